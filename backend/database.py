@@ -1,9 +1,15 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import DBAPIError, DisconnectionError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
+import logging
 import os
-import ssl
+import threading
+import time
+
+logger = logging.getLogger("intelli_cater.db")
 
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./catering.db")
 
@@ -15,20 +21,145 @@ if SQLALCHEMY_DATABASE_URL:
         SQLALCHEMY_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace("postgres://", "postgresql+pg8000://", 1)
     elif SQLALCHEMY_DATABASE_URL.startswith("postgresql://") and "+" not in SQLALCHEMY_DATABASE_URL.split("://")[0]:
         SQLALCHEMY_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace("postgresql://", "postgresql+pg8000://", 1)
+    elif SQLALCHEMY_DATABASE_URL.startswith("postgresql+psycopg2://"):
+        SQLALCHEMY_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace("postgresql+psycopg2://", "postgresql+pg8000://", 1)
+
+    # On Vercel, switch Supabase hosts to the Supavisor pooler (port 6543) to avoid
+    # IPv4/IPv6 connect timeouts; migrations and scripts keep the direct connection
+    if os.getenv("VERCEL") and "supabase.co" in SQLALCHEMY_DATABASE_URL and ":5432" in SQLALCHEMY_DATABASE_URL:
+        SQLALCHEMY_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace(":5432", ":6543", 1)
+
+# Pooling strategy, DB_POOL_MODE:
+#   auto       - sqlite: SQLAlchemy default; transaction-mode pooler (port 6543 / *.pooler.*): single;
+#                else persistent
+#   null       - NullPool, a fresh connection (and TLS handshake) per session
+#   single     - one kept, recycled connection per process (+ DB_MAX_OVERFLOW for bursts), for
+#                serverless instances behind Supavisor/pgbouncer: the pooler multiplexes the server
+#                side, so holding its client connection is cheap and warm requests skip connect + TLS.
+#                pg8000 only sends unnamed statements, which transaction-mode poolers accept.
+#   persistent - small LIFO QueuePool with recycling, for long-lived uvicorn processes
+#   pre_ping   - the old QueuePool + pool_pre_ping (an extra round trip on every checkout)
+# single and persistent ping a connection idle for DB_PING_AFTER_IDLE seconds on checkout.
+POOL_MODES = ("auto", "null", "single", "persistent", "pre_ping")
+DB_PING_AFTER_IDLE = float(os.getenv("DB_PING_AFTER_IDLE", "10"))  # seconds
+
+def resolve_pool_mode(url, mode=None):
+    """DB_POOL_MODE (or `mode`) with "auto" resolved; None means SQLAlchemy's default pool."""
+    mode = (mode or os.getenv("DB_POOL_MODE", "auto")).strip().lower()
+    if mode not in POOL_MODES:
+        raise ValueError(f"DB_POOL_MODE must be one of {POOL_MODES}, got {mode!r}")
+    if mode == "auto":
+        if url.startswith("sqlite"):
+            return None
+        mode = "single" if (":6543" in url or ".pooler." in url) else "persistent"
+    return mode
+
+def pool_options(url, mode=None):
+    mode = resolve_pool_mode(url, mode)
+    if mode is None:
+        return {}
+    if mode == "null":
+        return {"poolclass": NullPool}
+    if mode == "pre_ping":
+        return {"pool_pre_ping": True}
+    if mode == "single":
+        return {
+            "pool_size": 1,
+            "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "1")),
+            "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "300")),
+        }
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "2")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "3")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "300")),  # seconds; stay under pooler idle timeouts
+        "pool_use_lifo": True,  # reuse the warmest connection, let the rest idle out
+    }
+
+def engine_kwargs(url=SQLALCHEMY_DATABASE_URL):
+    # For SQLite, use check_same_thread=False. For Postgres (Supabase), use SSL context.
+    if "sqlite" in url:
+        return {"connect_args": {"check_same_thread": False}}
+    import ssl  # only needed for Postgres
 
-# For SQLite, use check_same_thread=False. For Postgres (Supabase), use SSL context.
-engine_args = {}
-if "sqlite" in SQLALCHEMY_DATABASE_URL:
-    engine_args["connect_args"] = {"check_same_thread": False}
-else:
     # Supabase requires SSL. pg8000 needs an SSLContext object.
     ssl_context = ssl.create_default_context()
     ssl_context.check_hostname = False
     ssl_context.verify_mode = ssl.CERT_NONE
-    engine_args["connect_args"] = {"ssl_context": ssl_context}
+    return {"connect_args": {"ssl_context": ssl_context, "timeout": 10}}  # pg8000 connect timeout, seconds
+
+def install_idle_ping(engine, idle_after=DB_PING_AFTER_IDLE):
+    """
+    Ping a pooled connection on checkout once it has sat idle for `idle_after`
+    seconds. A dead one raises DisconnectionError, which makes the pool discard it
+    and connect afresh, so everything a session does (execute, flush, commit) gets
+    a live connection. Busy connections skip the round trip that pool_pre_ping
+    pays on every checkout.
+    """
+    @event.listens_for(engine, "checkin")
+    def _checked_in(dbapi_connection, record):
+        record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _checked_out(dbapi_connection, record, proxy):
+        idle_since = record.info.get("checked_in_at")
+        if idle_since is None or time.monotonic() - idle_since < idle_after:
+            return
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            raise DisconnectionError(f"pooled connection died after {time.monotonic() - idle_since:.0f}s idle") from e
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_args)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def create_db_engine(url=SQLALCHEMY_DATABASE_URL, mode=None):
+    engine = create_engine(url, **engine_kwargs(url), **pool_options(url, mode))
+    if resolve_pool_mode(url, mode) in ("single", "persistent"):
+        install_idle_ping(engine)
+    return engine
+
+# The engine (driver import, SSL context, pool) is built on first DB use rather
+# than at import time, so serverless cold starts only pay for it when a request
+# needs it. `from backend.database import engine` still works (module __getattr__).
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_engine():
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                logger.info("Creating DB engine, URL starts with: %s...", SQLALCHEMY_DATABASE_URL[:30])
+                _engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
+    return _engine
+
+def __getattr__(name):
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class ReconnectingSession(Session):
+    """
+    Error-driven reconnect instead of pre-ping: if the first statement of a
+    transaction fails because its pooled connection was dead, SQLAlchemy has
+    already invalidated it, so roll back and run the statement once more on a
+    fresh connection. Nothing else ran in that transaction, so the retry is safe.
+    This covers execute() only; a flush or commit that is the first use of a
+    connection relies on the checkout ping (install_idle_ping), which catches
+    connections that died while idle in the persistent pool.
+    Sessions without an explicit bind use the shared (lazily created) engine.
+    """
+    def __init__(self, bind=None, **kwargs):
+        super().__init__(bind=bind if bind is not None else get_engine(), **kwargs)
+
+    def execute(self, *args, **kwargs):
+        first_statement = not self.in_transaction()
+        try:
+            return super().execute(*args, **kwargs)
+        except DBAPIError as e:
+            if not (first_statement and e.connection_invalidated):
+                raise
+            self.rollback()
+            return super().execute(*args, **kwargs)
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, class_=ReconnectingSession)
 
 Base = declarative_base()
 
@@ -38,3 +169,14 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def warm_up():
+    """
+    Open the first DB connection and return (ms, pool mode). In every mode but
+    "null" the connection stays pooled, so the next request skips connect + TLS;
+    under NullPool it is closed again and this only measures setup time.
+    """
+    started = time.perf_counter()
+    with get_engine().connect() as conn:
+        conn.exec_driver_sql("SELECT 1")
+    return (time.perf_counter() - started) * 1000, resolve_pool_mode(SQLALCHEMY_DATABASE_URL) or "default"
@@ -1,17 +1,43 @@
+import logging
 import os
-from fastapi import FastAPI, Depends, HTTPException
+import threading
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
 from datetime import datetime
 
-from backend.database import get_db, Base, engine
+from backend.database import get_db, warm_up
 from backend.models import Ingredient, MenuItem, Event, ProductionPlan
-from backend.services.calculation import calculate_indent, jit_batching
+from backend.services.calculation import calculate_indent, calculate_indent_batch, jit_batching
+from backend.services.procurement import plan_procurement
+from backend.services.events import (
+    add_menu_items, create_events, recompute_production_plan, recompute_production_plans, remove_menu_item, update_event,
+)
+from backend.services.event_indent import read_event_indent
+from backend.services.production import get_production_plan
+from backend.services.indent_cache import indent_cache
+from backend.services.catalogue import MENU_CACHE_CONTROL, get_menu_catalogue
+from backend.services.pagination import keyset_page
+from backend.services.search import get_menu_search_index
+from backend.services.density import optimize_indent
+from backend.services.simulation import MAX_SCENARIOS, scenario_grid, simulate_indent
+from backend.services.serialization import fast_json_enabled, json_response
+
+# The schema is managed by Alembic (alembic upgrade head), not created on startup
+
+logger = logging.getLogger("intelli_cater.api")
 
-# Create tables if not exist
-Base.metadata.create_all(bind=engine)
+# DB_WARMUP=1: connect in the background while the rest of the cold start runs
+if os.getenv("DB_WARMUP", "").lower() in ("1", "true", "yes"):
+    def _background_warm_up():
+        try:
+            logger.info("DB warm-up took %.1f ms (pool: %s)", *warm_up())
+        except Exception:
+            logger.exception("DB warm-up failed")
+
+    threading.Thread(target=_background_warm_up, name="db-warmup", daemon=True).start()
 
 # Use root_path=/api on Vercel so FastAPI routes match /api/menu-items etc.
 root_path = "/api" if os.getenv("VERCEL") else ""
@@ -23,6 +49,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 # --- Pydantic Schemas ---
@@ -53,6 +80,21 @@ class EventCreate(BaseModel):
     profile_type: str
     menu_item_ids: Optional[List[int]] = []
 
+class BulkEventCreate(BaseModel):
+    events: List[EventCreate]
+
+class EventUpdate(BaseModel):
+    name: Optional[str] = None
+    date: Optional[datetime] = None
+    venue: Optional[str] = None
+    pax_male: Optional[int] = None
+    pax_female: Optional[int] = None
+    pax_child: Optional[int] = None
+    profile_type: Optional[str] = None
+
+class MenuSelection(BaseModel):
+    menu_item_ids: List[int]
+
 class EventSchema(BaseModel):
     id: int
     name: str
@@ -69,39 +111,163 @@ class IndentRequest(BaseModel):
     event_id: int
     menu_item_ids: List[int]
 
+class BatchIndentRequest(BaseModel):
+    requests: List[IndentRequest]
+    consolidate: bool = False
+
+class OptimizeIndentRequest(BaseModel):
+    event_id: int
+    menu_item_ids: List[int]
+    category_weights: Dict[str, float] = {}  # e.g. {"Main Course": 2.0, "Beverages": 0.5}
+    veg_share: Optional[float] = None  # share of capacity for Veg items, 0..1
+    respect_stock: bool = True
+
+class Headcount(BaseModel):
+    pax_male: int = 0
+    pax_female: int = 0
+    pax_child: int = 0
+
+class HeadcountGrid(BaseModel):
+    pax_male: List[int] = Field([0], max_length=MAX_SCENARIOS)
+    pax_female: List[int] = Field([0], max_length=MAX_SCENARIOS)
+    pax_child: List[int] = Field([0], max_length=MAX_SCENARIOS)
+
+class SimulationRequest(BaseModel):
+    menu_item_ids: List[int]
+    scenarios: List[Headcount] = Field([], max_length=MAX_SCENARIOS)
+    grid: Optional[HeadcountGrid] = None  # cartesian product, appended after `scenarios`
+    percentiles: List[float] = [5, 50, 95]
+    include_scenarios: bool = True
+
 # --- Endpoints ---
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
 
+@app.get("/warmup")
+def warmup():
+    # Ping target for a scheduled keep-warm job
+    try:
+        connect_ms, pool_mode = warm_up()
+        return {"status": "ok", "connect_ms": round(connect_ms, 1), "pool_mode": pool_mode}
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
 @app.post("/events", response_model=EventSchema)
 def create_event(event: EventCreate, db: Session = Depends(get_db)):
-    event_data = event.dict(exclude={"menu_item_ids"})
-    db_event = Event(**event_data)
-    db.add(db_event)
-    db.commit()
-    db.refresh(db_event)
-    if event.menu_item_ids:
-        for item_id in event.menu_item_ids:
-            plan = ProductionPlan(
-                event_id=db_event.id,
-                menu_item_id=item_id,
-                total_qty_needed=0.0,
-                batch_1_qty=0.0,
-                batch_2_qty=0.0,
-                batch_3_qty=0.0
-            )
-            db.add(plan)
-        db.commit()
-    return db_event
+    try:
+        return create_events(db, [event.model_dump()])[0]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/events/bulk", response_model=List[EventSchema])
+def create_events_bulk(request: BulkEventCreate, db: Session = Depends(get_db)):
+    try:
+        return create_events(db, [event.model_dump() for event in request.events])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.patch("/events/{event_id}", response_model=EventSchema)
+def patch_event(event_id: int, changes: EventUpdate, db: Session = Depends(get_db)):
+    try:
+        return update_event(db, event_id, changes.model_dump(exclude_unset=True, exclude_none=True))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@app.get("/events/{event_id}/indent")
+def read_indent(event_id: int, db: Session = Depends(get_db)):
+    try:
+        return read_event_indent(db, event_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@app.post("/events/{event_id}/menu-items")
+def add_event_menu_items(event_id: int, selection: MenuSelection, db: Session = Depends(get_db)):
+    try:
+        return add_menu_items(db, event_id, selection.menu_item_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@app.delete("/events/{event_id}/menu-items/{menu_item_id}")
+def remove_event_menu_item(event_id: int, menu_item_id: int, db: Session = Depends(get_db)):
+    try:
+        return remove_menu_item(db, event_id, menu_item_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@app.get("/events/{event_id}/production-plan")
+def read_production_plan(event_id: int, db: Session = Depends(get_db)):
+    try:
+        return get_production_plan(db, event_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@app.post("/events/{event_id}/production-plan/recompute")
+def recompute_plan(event_id: int, db: Session = Depends(get_db)):
+    try:
+        return recompute_production_plan(db, event_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@app.post("/production-plans/recompute")
+def recompute_all_plans(db: Session = Depends(get_db)):
+    # Backfills plans and event_indent rows written before they were materialized
+    return {"updated": recompute_production_plans(db)}
+
+def paged_response(response: Response, db: Session, model, schema, limit, cursor, skip, fields):
+    allowed = list(schema.model_fields)
+    if not fields and fast_json_enabled():
+        # Fast path: Core tuples for every schema column, no ORM objects or per-row validation
+        fields = ",".join(allowed)
+    try:
+        rows, next_cursor = keyset_page(db, model, allowed, limit, cursor=cursor, skip=skip, fields=fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    if fields:
+        # Projected rows are plain dicts, so they bypass response_model validation
+        return json_response(rows, headers=headers)
+    response.headers.update(headers)
+    return rows
 
 @app.get("/menu-items", response_model=List[MenuItemSchema])
-def read_menu_items(skip: int = 0, limit: int = 10000, db: Session = Depends(get_db)):
-    return db.query(MenuItem).offset(skip).limit(limit).all()
+def read_menu_items(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 10000,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    catalogue = get_menu_catalogue(db) if not (cursor or fields or skip) else None
+    if catalogue is None or limit < catalogue.count:
+        return paged_response(response, db, MenuItem, MenuItemSchema, limit, cursor, skip, fields)
+
+    # Full catalogue: pre-serialized bytes with a strong ETag per content-coding
+    encoding, body = catalogue.negotiate(request.headers.get("accept-encoding"))
+    headers = {"ETag": catalogue.etag(encoding), "Cache-Control": MENU_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if catalogue.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.get("/menu-items/search")
+def search_menu_items(q: str, limit: int = Query(20, ge=1, le=200), offset: int = Query(0, ge=0), db: Session = Depends(get_db)):
+    total, hits = get_menu_search_index(db).search(q, limit=limit, offset=offset)
+    return {"query": q, "total": total, "items": [{**item, "score": score} for score, item in hits]}
 
 @app.get("/events", response_model=List[EventSchema])
-def read_events(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return db.query(Event).offset(skip).limit(limit).all()
+def read_events(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    return paged_response(response, db, Event, EventSchema, limit, cursor, skip, fields)
 
 @app.post("/calculate-indent")
 def get_indent(request: IndentRequest, db: Session = Depends(get_db)):
@@ -112,6 +278,66 @@ def get_indent(request: IndentRequest, db: Session = Depends(get_db)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/indent-cache/stats")
+def read_indent_cache_stats():
+    return indent_cache.stats()
+
+@app.post("/calculate-indent/batch")
+def get_indent_batch(request: BatchIndentRequest, db: Session = Depends(get_db)):
+    try:
+        return calculate_indent_batch(
+            db,
+            [(r.event_id, r.menu_item_ids) for r in request.requests],
+            consolidate=request.consolidate,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/optimize-indent")
+def get_optimized_indent(request: OptimizeIndentRequest, db: Session = Depends(get_db)):
+    if request.veg_share is not None and not 0 <= request.veg_share <= 1:
+        raise HTTPException(status_code=400, detail="veg_share must be between 0 and 1")
+    if any(w < 0 for w in request.category_weights.values()):
+        raise HTTPException(status_code=400, detail="category_weights must not be negative")
+    try:
+        return optimize_indent(
+            db, request.event_id, request.menu_item_ids,
+            category_weights=request.category_weights,
+            veg_share=request.veg_share,
+            respect_stock=request.respect_stock,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@app.post("/simulate-indent")
+def simulate(request: SimulationRequest, db: Session = Depends(get_db)):
+    if any(not 0 <= p <= 100 for p in request.percentiles):
+        raise HTTPException(status_code=400, detail="percentiles must be between 0 and 100")
+    grid = request.grid
+    # Size the request before materializing anything: a few KB of grid lists can describe billions of scenarios
+    total = len(request.scenarios)
+    if grid:
+        total += len(grid.pax_male) * len(grid.pax_female) * len(grid.pax_child)
+    if total > MAX_SCENARIOS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_SCENARIOS} scenarios per call, got {total}")
+    headcounts = [(s.pax_male, s.pax_female, s.pax_child) for s in request.scenarios]
+    if grid:
+        headcounts += scenario_grid(grid.pax_male, grid.pax_female, grid.pax_child).tolist()
+    if not headcounts:
+        raise HTTPException(status_code=400, detail="Provide scenarios or a grid")
+    try:
+        return simulate_indent(db, request.menu_item_ids, headcounts, request.percentiles, request.include_scenarios)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/procurement-plan")
+def get_procurement_plan(start: datetime, end: datetime, include_covered: bool = False, db: Session = Depends(get_db)):
+    if end < start:
+        raise HTTPException(status_code=400, detail="end must not be before start")
+    return plan_procurement(db, start, end, include_covered=include_covered)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("backend.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,45 @@
+from logging.config import fileConfig
+
+from alembic import context
+
+# Reuse the app's engine so migrations get the same URL normalization (pg8000) and SSL context
+from backend.database import SQLALCHEMY_DATABASE_URL, Base, engine
+import backend.models  # noqa: F401  registers every table on Base.metadata
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    """Emit the SQL to stdout (alembic upgrade head --sql) instead of running it."""
+    context.configure(
+        url=SQLALCHEMY_DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            # One transaction per revision, so autocommit_block() in a revision
+            # (CREATE INDEX CONCURRENTLY) only has to step out of its own
+            transaction_per_migration=True,
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,140 @@
+"""Baseline schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+Creates the tables backend/models.py defined before migrations existed.
+Databases that were created by the old per-startup create_all (or by
+migration.sql) already have some or all of them, so each table is only
+created when it is missing; upgrading such a database simply records it
+at this revision.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_ingredients():
+    op.create_table(
+        "ingredients",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String()),
+        sa.Column("category", sa.String()),
+        sa.Column("regional_name", sa.String(), nullable=True),
+        sa.Column("brand", sa.String(), nullable=True),
+        sa.Column("package_size", sa.String(), nullable=True),
+        sa.Column("unit", sa.String()),
+        sa.Column("stock_qty", sa.Float()),
+    )
+    op.create_index("ix_ingredients_id", "ingredients", ["id"])
+    op.create_index("ix_ingredients_name", "ingredients", ["name"])
+
+
+def _create_menu_items():
+    op.create_table(
+        "menu_items",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String()),
+        sa.Column("category", sa.String()),
+        sa.Column("sub_category", sa.String()),
+        sa.Column("diet_type", sa.String()),
+    )
+    op.create_index("ix_menu_items_id", "menu_items", ["id"])
+    op.create_index("ix_menu_items_name", "menu_items", ["name"])
+
+
+def _create_recipes():
+    op.create_table(
+        "recipes",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("menu_item_id", sa.Integer(), sa.ForeignKey("menu_items.id")),
+        sa.Column("ingredient_id", sa.Integer(), sa.ForeignKey("ingredients.id")),
+        sa.Column("quantity", sa.Float()),
+        sa.Column("unit", sa.String()),
+    )
+    op.create_index("ix_recipes_id", "recipes", ["id"])
+
+
+def _create_events():
+    op.create_table(
+        "events",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String()),
+        sa.Column("date", sa.DateTime()),
+        sa.Column("venue", sa.String()),
+        sa.Column("pax_male", sa.Integer()),
+        sa.Column("pax_female", sa.Integer()),
+        sa.Column("pax_child", sa.Integer()),
+        sa.Column("profile_type", sa.String()),
+    )
+    op.create_index("ix_events_id", "events", ["id"])
+
+
+def _create_production_plan():
+    op.create_table(
+        "production_plan",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("event_id", sa.Integer(), sa.ForeignKey("events.id")),
+        sa.Column("menu_item_id", sa.Integer(), sa.ForeignKey("menu_items.id")),
+        sa.Column("total_qty_needed", sa.Float()),
+        sa.Column("batch_1_qty", sa.Float()),
+        sa.Column("batch_2_qty", sa.Float()),
+        sa.Column("batch_3_qty", sa.Float()),
+    )
+    op.create_index("ix_production_plan_id", "production_plan", ["id"])
+
+
+def _create_recipe_hashes():
+    op.create_table(
+        "recipe_hashes",
+        sa.Column("menu_item_id", sa.Integer(), sa.ForeignKey("menu_items.id"), primary_key=True),
+        sa.Column("content_hash", sa.String()),
+    )
+
+
+def _create_event_indent():
+    op.create_table(
+        "event_indent",
+        sa.Column("event_id", sa.Integer(), sa.ForeignKey("events.id"), primary_key=True),
+        sa.Column("ingredient_id", sa.Integer(), sa.ForeignKey("ingredients.id"), primary_key=True),
+        sa.Column("base_qty", sa.Float()),
+        sa.Column("line_count", sa.Integer()),
+        sa.Column("quantity", sa.Float()),
+        sa.Column("unit", sa.String()),
+    )
+
+
+# Dependency order: referenced tables first
+TABLES = {
+    "ingredients": _create_ingredients,
+    "menu_items": _create_menu_items,
+    "recipes": _create_recipes,
+    "events": _create_events,
+    "production_plan": _create_production_plan,
+    "recipe_hashes": _create_recipe_hashes,
+    "event_indent": _create_event_indent,
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # --sql (offline) has no database to inspect and emits every table
+    existing = set() if context.is_offline_mode() else set(sa.inspect(op.get_bind()).get_table_names())
+    for table, create in TABLES.items():
+        if table not in existing:
+            create()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(list(TABLES)):
+        op.drop_table(table)
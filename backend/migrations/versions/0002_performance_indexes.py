@@ -0,0 +1,52 @@
+"""Performance indexes and one recipe line per (menu item, ingredient)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+On PostgreSQL the indexes are built with CREATE INDEX CONCURRENTLY outside
+the migration transaction, so production tables keep taking writes while
+they build. If a concurrent build fails it leaves an INVALID index behind:
+drop it (DROP INDEX CONCURRENTLY <name>) and run the upgrade again.
+Every index is IF NOT EXISTS, so databases that already got them from
+migration.sql or create_all are left as they are.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, unique)
+INDEXES = (
+    ("ix_production_plan_event_id", "production_plan", ["event_id"], False),
+    ("ix_production_plan_menu_item_event", "production_plan", ["menu_item_id", "event_id"], False),
+    ("uq_recipes_menu_item_ingredient", "recipes", ["menu_item_id", "ingredient_id"], True),
+    ("ix_recipes_ingredient_id", "recipes", ["ingredient_id"], False),
+    ("ix_events_date", "events", ["date"], False),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the first of any duplicate recipe lines so the unique index can build
+    op.execute(
+        "DELETE FROM recipes WHERE ingredient_id IS NOT NULL AND id NOT IN ("
+        "SELECT MIN(id) FROM recipes WHERE ingredient_id IS NOT NULL GROUP BY menu_item_id, ingredient_id)"
+    )
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in INDEXES:
+            op.create_index(name, table, columns, unique=unique, if_not_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
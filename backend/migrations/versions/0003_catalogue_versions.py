@@ -0,0 +1,45 @@
+"""Trigger-maintained catalogue revision counters
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00
+
+Adds catalogue_versions ("menu", "recipes") and the triggers that bump them on
+every write to menu_items, recipes and the recipe-relevant ingredient columns.
+The API's in-process caches compare against these counters instead of
+aggregate fingerprints, which missed same-length edits. The trigger DDL is
+shared with backend.models so create_all and migrations stay identical.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from backend.models import catalogue_version_ddl, drop_catalogue_version_ddl
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # create_all (ingest_data on a fresh file) may already have made the table; the DDL below is idempotent
+    if context.is_offline_mode() or not sa.inspect(op.get_bind()).has_table("catalogue_versions"):
+        op.create_table(
+            "catalogue_versions",
+            sa.Column("name", sa.String(), primary_key=True),
+            sa.Column("version", sa.BigInteger()),
+        )
+    for statement in catalogue_version_ddl(op.get_context().dialect.name):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for statement in drop_catalogue_version_ddl(op.get_context().dialect.name):
+        op.execute(statement)
+    op.drop_table("catalogue_versions")
@@ -0,0 +1,29 @@
+"""Backfill event_indent for events planned before it existed
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 00:00:00
+
+0001 creates event_indent empty on databases that already had events, and
+GET /events/{id}/indent reads only the materialized rows. The backfill lives
+in 0005, which recreates event_indent under its (event, ingredient, unit) key
+and fills it for every planned event: rows written here under the older
+(event, ingredient) key could collide for ingredients used in two units.
+This revision is kept, empty, so databases already stamped at it upgrade.
+"""
+from typing import Sequence, Union
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
@@ -0,0 +1,155 @@
+"""Key event_indent by (event, ingredient, unit)
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 00:00:00
+
+Recipe lines whose unit cannot be converted into the ingredient's stock unit
+(e.g. LTR lines for an ingredient stocked as BTL of "1x1kg") used to be summed
+into the same row as the convertible ones. They now get a row of their own,
+so the unit joins the primary key. event_indent is derived data: the table is
+recreated and every planned event rebuilt, which also backfills databases
+whose event_indent 0001 created empty.
+
+The rebuild is a frozen copy of backend/services/event_indent.py and
+backend/services/units.py as of this revision, so later changes to the
+services cannot change what this migration writes. Offline (--sql) mode emits
+only the DDL: run tools/check_event_indent.py --repair afterwards.
+"""
+import re
+from collections import defaultdict
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_event_indent(key):
+    op.create_table(
+        "event_indent",
+        sa.Column("event_id", sa.Integer(), sa.ForeignKey("events.id"), nullable=False),
+        sa.Column("ingredient_id", sa.Integer(), sa.ForeignKey("ingredients.id"), nullable=False),
+        sa.Column("unit", sa.String(), nullable="unit" not in key),
+        sa.Column("base_qty", sa.Float()),
+        sa.Column("line_count", sa.Integer()),
+        sa.Column("quantity", sa.Float()),
+        sa.PrimaryKeyConstraint(*key),
+    )
+
+
+# Unit rules at this revision (backend/services/units.py)
+PACKAGE_RE = re.compile(r"^\s*(?:(\d+)\s*x\s*)?(\d+(?:\.\d+)?)\s*([a-z]+)\s*$", re.IGNORECASE)
+MASS_UNITS = {"mg": 0.000001, "g": 0.001, "gm": 0.001, "gms": 0.001, "kg": 1.0, "kgs": 1.0}
+VOLUME_UNITS = {"ml": 0.001, "l": 1.0, "lt": 1.0, "ltr": 1.0, "ltrs": 1.0, "let": 1.0}
+
+# capacity / planned items per event, and per-portion recipe sums per (event, ingredient, recipe unit)
+PORTIONS_SQL = (
+    "SELECT e.id, (e.pax_male * 1.0 + e.pax_female * 0.85 + e.pax_child * 0.5) / COUNT(p.id) "
+    "FROM events e JOIN production_plan p ON p.event_id = e.id "
+    "GROUP BY e.id, e.pax_male, e.pax_female, e.pax_child"
+)
+LINES_SQL = (
+    "SELECT p.event_id, r.ingredient_id, r.unit, SUM(COALESCE(r.quantity, 0.0)), COUNT(r.id) "
+    "FROM production_plan p JOIN recipes r ON r.menu_item_id = p.menu_item_id "
+    "WHERE r.ingredient_id IS NOT NULL GROUP BY p.event_id, r.ingredient_id, r.unit"
+)
+
+
+def _base_quantity(unit):
+    unit = (unit or "").strip().lower()
+    if unit in MASS_UNITS:
+        return "KG", MASS_UNITS[unit]
+    if unit in VOLUME_UNITS:
+        return "LTR", VOLUME_UNITS[unit]
+    return None
+
+
+def _stock_units(stock_unit, package_size):
+    """(canonical unit, stock unit, canonical units per stock unit)."""
+    stock_unit = (stock_unit or "").strip().upper()
+    base = _base_quantity(stock_unit)
+    if base is not None:
+        return base[0], stock_unit, base[1]
+    match = PACKAGE_RE.match(package_size or "")
+    pack = _base_quantity(match.group(3)) if match else None
+    if pack is not None:
+        count, amount, _ = match.groups()
+        return pack[0], stock_unit, int(count or 1) * float(amount) * pack[1]
+    return stock_unit, stock_unit, 1.0
+
+
+def _convert(stock, unit):
+    base = _base_quantity(unit)
+    if stock is not None:
+        canonical, stock_unit, stock_factor = stock
+        if base is not None and base[0] == canonical:
+            return canonical, base[1]
+        if base is None and (unit or "").strip().upper() == stock_unit:
+            return canonical, stock_factor
+    return base if base is not None else ((unit or "").strip().upper(), 1.0)
+
+
+def _rebuild(bind):
+    stock = {ing_id: _stock_units(unit, size) for ing_id, unit, size in bind.execute(sa.text(
+        "SELECT id, unit, package_size FROM ingredients"
+    ))}
+    portions = dict(bind.execute(sa.text(PORTIONS_SQL)).all())
+    rows = {}
+    for event_id, ing_id, unit, qty, line_count in bind.execute(sa.text(LINES_SQL)):
+        canonical, factor = _convert(stock.get(ing_id), unit)
+        row = rows.setdefault((event_id, ing_id, canonical), {
+            "event_id": event_id, "ingredient_id": ing_id, "unit": canonical, "base_qty": 0.0, "line_count": 0,
+        })
+        row["base_qty"] += qty * factor
+        row["line_count"] += line_count
+    for row in rows.values():
+        portion = portions.get(row["event_id"])
+        row["quantity"] = None if portion is None else row["base_qty"] * portion
+    return list(rows.values())
+
+
+def _event_indent_table():
+    return sa.table(
+        "event_indent", sa.column("event_id"), sa.column("ingredient_id"), sa.column("unit"),
+        sa.column("base_qty"), sa.column("line_count"), sa.column("quantity"),
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_table("event_indent")
+    _create_event_indent(("event_id", "ingredient_id", "unit"))
+    if context.is_offline_mode():
+        return
+    rows = _rebuild(op.get_bind())
+    if rows:
+        op.bulk_insert(_event_indent_table(), rows)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    rows = []
+    if not context.is_offline_mode():
+        # Fold the per-unit rows back into one row per (event, ingredient), the pre-0005 key
+        merged = defaultdict(lambda: {"base_qty": 0.0, "line_count": 0, "quantity": 0.0})
+        for event_id, ing_id, unit, base_qty, line_count, quantity in op.get_bind().execute(sa.text(
+            "SELECT event_id, ingredient_id, unit, base_qty, line_count, quantity FROM event_indent "
+            "ORDER BY event_id, ingredient_id, unit"
+        )):
+            row = merged[(event_id, ing_id)]
+            row.setdefault("unit", unit)
+            row["base_qty"] += base_qty or 0.0
+            row["line_count"] += line_count or 0
+            row["quantity"] += quantity or 0.0
+        rows = [{"event_id": e, "ingredient_id": i, **row} for (e, i), row in merged.items()]
+    op.drop_table("event_indent")
+    _create_event_indent(("event_id", "ingredient_id"))
+    if rows:
+        op.bulk_insert(_event_indent_table(), rows)
@@ -1,7 +1,11 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime
+from sqlalchemy import BigInteger, Column, Integer, String, Float, ForeignKey, DateTime, Index, event
 from sqlalchemy.orm import relationship
 from .database import Base
 
+# Ingredient.category of produce bought per event (no inventory Item ID, no stock);
+# rows are created by backend/services/fresh.py
+FRESH_CATEGORY = "Fresh"
+
 class Ingredient(Base):
     __tablename__ = "ingredients"
 
@@ -42,13 +46,19 @@ class Recipe(Base):
     menu_item = relationship("MenuItem", back_populates="recipes")
     ingredient = relationship("Ingredient", back_populates="recipes")
 
+    __table_args__ = (
+        # One line per (item, ingredient); also serves every lookup by menu_item_id
+        Index("uq_recipes_menu_item_ingredient", "menu_item_id", "ingredient_id", unique=True),
+        Index("ix_recipes_ingredient_id", "ingredient_id"),
+    )
+
 
 class Event(Base):
     __tablename__ = "events"
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String)
-    date = Column(DateTime)
+    date = Column(DateTime, index=True)
     venue = Column(String)
     pax_male = Column(Integer, default=0)
     pax_female = Column(Integer, default=0)
@@ -62,7 +72,7 @@ class ProductionPlan(Base):
     __tablename__ = "production_plan"
 
     id = Column(Integer, primary_key=True, index=True)
-    event_id = Column(Integer, ForeignKey("events.id"))
+    event_id = Column(Integer, ForeignKey("events.id"), index=True)
     menu_item_id = Column(Integer, ForeignKey("menu_items.id"))
     total_qty_needed = Column(Float)
     batch_1_qty = Column(Float) # 60%
@@ -71,3 +81,109 @@ class ProductionPlan(Base):
 
     event = relationship("Event", back_populates="production_plans")
     menu_item = relationship("MenuItem", back_populates="production_plans")
+
+    __table_args__ = (
+        # Events planning a menu item, without touching the plan rows (sync, recipe edits)
+        Index("ix_production_plan_menu_item_event", "menu_item_id", "event_id"),
+    )
+
+
+class RecipeHash(Base):
+    __tablename__ = "recipe_hashes"
+
+    # Content hash of a menu item's recipe block in Master_Recipes_Generated.csv,
+    # used by incremental ingestion to rewrite only the items that changed
+    menu_item_id = Column(Integer, ForeignKey("menu_items.id"), primary_key=True)
+    content_hash = Column(String)
+
+
+class EventIndent(Base):
+    __tablename__ = "event_indent"
+
+    # Materialized ingredient indent of an event's planned menu, kept up to date
+    # incrementally by backend/services/event_indent.py. Recipe lines in a unit
+    # that does not convert into the stock unit get their own row.
+    event_id = Column(Integer, ForeignKey("events.id"), primary_key=True)
+    ingredient_id = Column(Integer, ForeignKey("ingredients.id"), primary_key=True)
+    unit = Column(String, primary_key=True)  # Canonical unit
+    base_qty = Column(Float)  # Sum of per-portion recipe quantities over the menu, in `unit`
+    line_count = Column(Integer)  # Recipe lines contributing; the row goes away at 0
+    quantity = Column(Float)  # base_qty * portion_per_item
+
+
+class CatalogueVersion(Base):
+    __tablename__ = "catalogue_versions"
+
+    # Revision counters bumped by database triggers on every write to the tables a
+    # catalogue is built from, so in-process caches (menu body, search index, recipe
+    # matrix) notice any change, including edits made outside the app
+    name = Column(String, primary_key=True)  # "menu" or "recipes"
+    version = Column(BigInteger)
+
+
+# counter -> [(table, columns whose UPDATE counts, None = any)]
+CATALOGUE_SOURCES = {
+    "menu": [("menu_items", None)],
+    "recipes": [("recipes", None), ("ingredients", "name, category, unit, package_size")],
+}
+
+# Counters start at the creation time in ms, so a re-created database never
+# reuses a revision a running server already cached
+_EPOCH_MS = {
+    "sqlite": "CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)",
+    "postgresql": "(extract(epoch from clock_timestamp()) * 1000)::bigint",
+}
+
+
+def catalogue_version_ddl(dialect):
+    """Idempotent statements that seed the counters and install the bump triggers (SQLite, PostgreSQL)."""
+    if dialect not in _EPOCH_MS:
+        return []
+    statements = [
+        f"INSERT INTO catalogue_versions (name, version) VALUES ('{name}', {_EPOCH_MS[dialect]}) ON CONFLICT DO NOTHING"
+        for name in CATALOGUE_SOURCES
+    ]
+    if dialect == "postgresql":
+        statements.append(
+            "CREATE OR REPLACE FUNCTION bump_catalogue_version() RETURNS trigger AS $$ "
+            "BEGIN UPDATE catalogue_versions SET version = version + 1 WHERE name = TG_ARGV[0]; RETURN NULL; END; "
+            "$$ LANGUAGE plpgsql"
+        )
+    for name, sources in CATALOGUE_SOURCES.items():
+        for table, columns in sources:
+            update = f"UPDATE OF {columns}" if columns else "UPDATE"
+            if dialect == "postgresql":
+                # Statement-level: one bump per bulk write, not per row
+                statements.append(f"DROP TRIGGER IF EXISTS trg_{table}_version ON {table}")
+                statements.append(
+                    f"CREATE TRIGGER trg_{table}_version AFTER INSERT OR DELETE OR {update} ON {table} "
+                    f"FOR EACH STATEMENT EXECUTE FUNCTION bump_catalogue_version('{name}')"
+                )
+            else:
+                # SQLite triggers take one event each and are always per row
+                for op in ("INSERT", "DELETE", update):
+                    statements.append(
+                        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_{op.split()[0].lower()}_version AFTER {op} ON {table} "
+                        f"BEGIN UPDATE catalogue_versions SET version = version + 1 WHERE name = '{name}'; END"
+                    )
+    return statements
+
+
+def drop_catalogue_version_ddl(dialect):
+    statements = []
+    for sources in CATALOGUE_SOURCES.values():
+        for table, _ in sources:
+            if dialect == "postgresql":
+                statements.append(f"DROP TRIGGER IF EXISTS trg_{table}_version ON {table}")
+            elif dialect == "sqlite":
+                statements += [f"DROP TRIGGER IF EXISTS trg_{table}_{op}_version" for op in ("insert", "delete", "update")]
+    if dialect == "postgresql":
+        statements.append("DROP FUNCTION IF EXISTS bump_catalogue_version()")
+    return statements
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_catalogue_triggers(metadata, connection, **kw):
+    # create_all (scripts, tools, throwaway DBs) gets the same triggers as the Alembic revision
+    for statement in catalogue_version_ddl(connection.dialect.name):
+        connection.exec_driver_sql(statement)
@@ -1,108 +1,431 @@
-import sys
+import argparse
+import hashlib
+import json
 import os
+import time
+from functools import partial
+
 import pandas as pd
-from sqlalchemy.orm import Session
-from backend.database import SessionLocal, engine, Base
-from backend.models import Ingredient, MenuItem, Recipe
+from sqlalchemy import bindparam, delete, insert, select, update
+from backend.database import engine, Base
+from backend.models import Ingredient, MenuItem, ProductionPlan, Recipe, RecipeHash
+from backend.services.event_indent import rebuild_event_indent
+from backend.services.fresh import (
+    FRESH_ID_BASE, FreshIdRegistry, fresh_ingredient_frame, fresh_ingredient_ids, is_fresh_line,
+)
+from backend.services.indent_cache import invalidate_indent_cache
+from backend.services.recipe_matrix import invalidate_recipe_matrix
 
 # Create tables
 Base.metadata.create_all(bind=engine)
 
-def ingest_data():
-    session = SessionLocal()
+INVENTORY_CSV = "food inventory.csv"
+RECIPES_CSV = "Master_Recipes_Generated.csv"
+CHUNK_SIZE = 1000
+STREAM_CHUNK_ROWS = 10000
+CHECKPOINT_PATH = ".ingest_checkpoint.json"
+
+
+def read_inventory(path=INVENTORY_CSV, **kwargs):
     try:
-        # 1. Ingest Ingredients from Inventory
-        print("Ingesting Ingredients...")
-        try:
-            inventory_df = pd.read_csv("food inventory.csv", on_bad_lines='skip')
-        except TypeError:
-             inventory_df = pd.read_csv("food inventory.csv", error_bad_lines=False)
-        # specific column mapping based on file inspection
-        # Category,Item ID,Item Name,Regional Name,Brand,Package Size,Unit,Stock Quantity
-        
-        for _, row in inventory_df.iterrows():
-            item_id = row['Item ID']
-            # efficient upsert check
-            existing = session.query(Ingredient).filter(Ingredient.id == item_id).first()
-            if not existing:
-                ingredient = Ingredient(
-                    id=item_id,
-                    name=row['Item Name'],
-                    category=row['Category'],
-                    regional_name=row['Regional Name'] if pd.notna(row['Regional Name']) else None,
-                    brand=row['Brand'] if pd.notna(row['Brand']) else None,
-                    package_size=row['Package Size'] if pd.notna(row['Package Size']) else None,
-                    unit=row['Unit'],
-                    stock_qty=float(row['Stock Quantity']) if pd.notna(row['Stock Quantity']) else 0.0
-                )
-                session.add(ingredient)
-        session.commit()
-        print("Ingredients ingested.")
-
-        # 2. Ingest Menu Items & Recipes
-        print("Ingesting Menu Items and Recipes...")
-        recipes_df = pd.read_csv("Master_Recipes_Generated.csv")
-        # Menu Item ID,Menu Category,Menu Sub-Category,Menu Item Name,Ingredient Type,Ingredient ID,Ingredient Name,Quantity,Unit
-        
-        # Unique Menu Items
-        menu_items_group = recipes_df.groupby('Menu Item ID').first()
-        
-        for menu_id, row in menu_items_group.iterrows():
-             # Check if exists
-            existing_item = session.query(MenuItem).filter(MenuItem.id == menu_id).first()
-            if not existing_item:
-                menu_item = MenuItem(
-                    id=menu_id,
-                    name=row['Menu Item Name'],
-                    category=row['Menu Category'],
-                    sub_category=row['Menu Sub-Category'],
-                    diet_type="Non-Veg" if "Non-Veg" in row['Menu Category'] else "Veg" # Simple heuristic, can be refined
-                )
-                session.add(menu_item)
-        session.commit()
-        print("Menu Items ingested.")
-
-        # Recipes
-        # We need to link recipes to ingredients. 
-        # Note: Master_Recipes_Generated.csv has 'Ingredient ID'. 
-        # Sometimes it is 'N/A' for Fresh items (Chicken, etc) which might not be in inventory csv?
-        # Let's handle 'N/A' or missing IDs gracefully or create dummy ingredients.
-        
-        print("Ingesting Recipes linkage...")
-        for _, row in recipes_df.iterrows():
-            menu_id = row['Menu Item ID']
-            ing_id_raw = row['Ingredient ID']
-            
-            if pd.notna(ing_id_raw):
-                try:
-                    ing_id = int(float(ing_id_raw))
-                except ValueError:
-                    continue
-                    
-                # Check if this recipe link already exists (avoid duplicates if re-run)
-                exists = session.query(Recipe).filter_by(menu_item_id=menu_id, ingredient_id=ing_id).first()
-                if not exists:
-                    # check if ingredient actually exists in DB, if not, maybe skip or log
-                    if session.query(Ingredient).filter(Ingredient.id == ing_id).first():
-                        recipe = Recipe(
-                            menu_item_id=menu_id,
-                            ingredient_id=ing_id,
-                            quantity=float(row['Quantity']),
-                            unit=row['Unit']
-                        )
-                        session.add(recipe)
-            else:
-                # Handle Fresh items or N/A IDs - For now, we skip or could insert into Ingredients as 'Fresh' type
-                pass
-
-        session.commit()
-        print("Recipes ingested.")
-
-    except Exception as e:
-        print(f"Error: {e}")
-        session.rollback()
-    finally:
-        session.close()
+        return pd.read_csv(path, on_bad_lines='skip', **kwargs)
+    except TypeError:
+        return pd.read_csv(path, error_bad_lines=False, **kwargs)
+
+
+def _records(df):
+    # NaN -> None so the driver writes NULLs
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def prepare_ingredients(inventory_df):
+    # Category,Item ID,Item Name,Regional Name,Brand,Package Size,Unit,Stock Quantity
+    df = pd.DataFrame({
+        "id": pd.to_numeric(inventory_df['Item ID'], errors='coerce'),
+        "name": inventory_df['Item Name'],
+        "category": inventory_df['Category'],
+        "regional_name": inventory_df['Regional Name'],
+        "brand": inventory_df['Brand'],
+        "package_size": inventory_df['Package Size'],
+        "unit": inventory_df['Unit'],
+        "stock_qty": pd.to_numeric(inventory_df['Stock Quantity'], errors='coerce').fillna(0.0),
+    })
+    df = df.dropna(subset=["id"]).drop_duplicates(subset="id", keep="first")
+    return df.astype({"id": "int64"})
+
+
+def prepare_menu_items(recipes_df):
+    # Menu Item ID,Menu Category,Menu Sub-Category,Menu Item Name,Ingredient Type,Ingredient ID,Ingredient Name,Quantity,Unit
+    first = recipes_df.dropna(subset=['Menu Item ID']).groupby('Menu Item ID', sort=False).first().reset_index()
+    return pd.DataFrame({
+        "id": first['Menu Item ID'].astype("int64"),
+        "name": first['Menu Item Name'],
+        "category": first['Menu Category'],
+        "sub_category": first['Menu Sub-Category'],
+        # Simple heuristic, can be refined
+        "diet_type": first['Menu Category'].astype(str).str.contains("Non-Veg", regex=False).map({True: "Non-Veg", False: "Veg"}),
+    })
+
+
+def prepare_recipes(recipes_df):
+    # 'Ingredient ID' is N/A for Fresh items (Chicken, etc) that are not in the inventory;
+    # those link to the fresh-ingredient dimension by normalized name
+    ing_ids = pd.to_numeric(recipes_df['Ingredient ID'], errors='coerce')
+    fresh = is_fresh_line(recipes_df)
+    if fresh.any():
+        ing_ids = ing_ids.where(~fresh, fresh_ingredient_ids(recipes_df['Ingredient Name'].where(fresh)))
+    df = pd.DataFrame({
+        "menu_item_id": pd.to_numeric(recipes_df['Menu Item ID'], errors='coerce'),
+        "ingredient_id": ing_ids,
+        "quantity": pd.to_numeric(recipes_df['Quantity'], errors='coerce'),
+        "unit": recipes_df['Unit'],
+    })
+    df = df.dropna(subset=["menu_item_id", "ingredient_id"])
+    df = df.astype({"menu_item_id": "int64", "ingredient_id": "int64"})
+    return df.drop_duplicates(subset=["menu_item_id", "ingredient_id"], keep="first")
+
+
+def prepare_all_ingredients(inventory_df, recipes_df, issued=None):
+    # Inventory items plus the fresh-ingredient dimension built from the recipes CSV
+    issued = issued if issued is not None else FreshIdRegistry()
+    inventory = prepare_ingredients(inventory_df)
+    issued.claim_existing(zip(inventory["id"], inventory["name"]))
+    return pd.concat([inventory, fresh_ingredient_frame(recipes_df, issued)], ignore_index=True)
+
+
+def claim_stored_fresh_ids(conn, issued):
+    """Check the ids issued for this load against the ingredients already stored in the fresh range."""
+    issued.claim_existing(conn.execute(select(Ingredient.id, Ingredient.name).where(Ingredient.id >= FRESH_ID_BASE)))
+
+
+def load_existing_keys(conn):
+    return {
+        "ingredients": set(conn.execute(select(Ingredient.id)).scalars()),
+        "menu_items": set(conn.execute(select(MenuItem.id)).scalars()),
+        "recipes": {tuple(row) for row in conn.execute(select(Recipe.menu_item_id, Recipe.ingredient_id))},
+    }
+
+
+def load_chunk_keys(conn, ingredient_ids, menu_item_ids):
+    # Same shape as load_existing_keys, but only for the keys one chunk mentions
+    ingredient_ids, menu_item_ids = [int(i) for i in ingredient_ids], [int(i) for i in menu_item_ids]
+    return {
+        "ingredients": set(conn.execute(select(Ingredient.id).where(Ingredient.id.in_(ingredient_ids))).scalars()),
+        "menu_items": set(conn.execute(select(MenuItem.id).where(MenuItem.id.in_(menu_item_ids))).scalars()),
+        "recipes": {
+            tuple(row)
+            for row in conn.execute(
+                select(Recipe.menu_item_id, Recipe.ingredient_id).where(Recipe.menu_item_id.in_(menu_item_ids))
+            )
+        },
+    }
+
+
+def diff_frames(keys, ingredients, menu_items, recipes):
+    """Split the parsed CSVs into rows to insert, given the keys already in the DB."""
+    new_ingredients = ingredients[~ingredients["id"].isin(keys["ingredients"])]
+    new_menu_items = menu_items[~menu_items["id"].isin(keys["menu_items"])]
+
+    known_ingredients = keys["ingredients"] | set(new_ingredients["id"])
+    pairs = pd.Series(list(zip(recipes["menu_item_id"], recipes["ingredient_id"])), index=recipes.index, dtype=object)
+    linkable = recipes["ingredient_id"].isin(known_ingredients)
+    new_recipes = recipes[linkable & ~pairs.isin(keys["recipes"])]
+    return {
+        "ingredients": new_ingredients,
+        "menu_items": new_menu_items,
+        "recipes": new_recipes,
+        "unknown_ingredient": int((~linkable).sum()),
+    }
+
+
+def insert_ignore(conn, table):
+    # INSERT ... ON CONFLICT DO NOTHING on both SQLite and Postgres; plain INSERT elsewhere
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return insert(table)
+    return dialect_insert(table).on_conflict_do_nothing()
+
+
+def write_chunks(conn, table, df, chunk_size=CHUNK_SIZE):
+    stmt = insert_ignore(conn, table)
+    rows = _records(df)
+    for i in range(0, len(rows), chunk_size):
+        conn.execute(stmt, rows[i:i + chunk_size])  # executemany
+    return len(rows)
+
+
+def print_summary(changes, dry_run):
+    verb = "Would insert" if dry_run else "Inserted"
+    print(f"{verb} {len(changes['ingredients'])} ingredients, {len(changes['menu_items'])} menu items, "
+          f"{len(changes['recipes'])} recipes "
+          f"({changes['unknown_ingredient']} recipe lines skipped for unknown ingredients).")
+
+
+def ingest_data(inventory_path=INVENTORY_CSV, recipes_path=RECIPES_CSV, dry_run=False, chunk_size=CHUNK_SIZE):
+    started = time.perf_counter()
+    print("Parsing CSVs...")
+    recipes_df = pd.read_csv(recipes_path)
+    issued = FreshIdRegistry()
+    ingredients = prepare_all_ingredients(read_inventory(inventory_path), recipes_df, issued)
+    menu_items = prepare_menu_items(recipes_df)
+    recipes = prepare_recipes(recipes_df)
+    print(f"{len(recipes_df) - len(recipes)} unlinkable or duplicate recipe lines ignored.")
+
+    # Single transaction: everything lands or nothing does
+    with engine.begin() as conn:
+        claim_stored_fresh_ids(conn, issued)
+        changes = diff_frames(load_existing_keys(conn), ingredients, menu_items, recipes)
+        if dry_run:
+            print_summary(changes, dry_run=True)
+            return changes
+
+        written = write_chunks(conn, Ingredient.__table__, changes["ingredients"], chunk_size)
+        written += write_chunks(conn, MenuItem.__table__, changes["menu_items"], chunk_size)
+        written += write_chunks(conn, Recipe.__table__, changes["recipes"], chunk_size)
+        # New lines (e.g. the fresh backfill) change the indents of events already planning those items
+        rebuild_indents_for_items(conn, changes["recipes"]["menu_item_id"].unique(), chunk_size)
+
+    invalidate_recipe_matrix()
+    invalidate_indent_cache()
+    elapsed = time.perf_counter() - started
+    print_summary(changes, dry_run=False)
+    print(f"{written} rows in {elapsed:.2f}s ({written / elapsed if elapsed else 0:.0f} rows/sec).")
+    return changes
+
+
+# Bump when the way recipe blocks are loaded changes, so the next --sync rewrites
+# every item once (2: Fresh lines are linked instead of dropped)
+RECIPE_HASH_VERSION = "2"
+
+
+def recipe_block_hashes(recipes_df):
+    """sha256 of each menu item's block of CSV lines (every column, file order)."""
+    df = recipes_df.dropna(subset=['Menu Item ID'])
+    cells = df.astype(object).where(df.notna(), "").astype(str)
+    line = cells[df.columns[0]]
+    for column in df.columns[1:]:
+        line = line + "\x1f" + cells[column]
+    blocks = line.groupby(df['Menu Item ID'].astype("int64"), sort=False).agg("\x1e".join)
+    return {
+        int(menu_id): hashlib.sha256(f"{RECIPE_HASH_VERSION}\x1e{block}".encode("utf-8")).hexdigest()
+        for menu_id, block in blocks.items()
+    }
+
+
+def rebuild_indents_for_items(conn, menu_item_ids, chunk_size=CHUNK_SIZE):
+    """Rebuild event_indent for every event planning one of `menu_item_ids` (their recipe lines changed)."""
+    affected = set()
+    for batch in _in_batches([int(i) for i in menu_item_ids], chunk_size):
+        affected.update(conn.execute(
+            select(ProductionPlan.event_id).where(ProductionPlan.menu_item_id.in_(batch)).distinct()
+        ).scalars())
+    if affected:
+        rebuild_event_indent(conn, sorted(affected))
+    return len(affected)
+
+
+def _in_batches(ids, size=CHUNK_SIZE):
+    ids = list(ids)
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
+def sync_data(inventory_path=INVENTORY_CSV, recipes_path=RECIPES_CSV, dry_run=False, chunk_size=CHUNK_SIZE):
+    """
+    Incremental sync: only menu items whose recipe block hash changed are rewritten.
+
+    For a changed item the menu_items row is updated (or inserted), its recipe
+    lines are replaced wholesale - so quantity edits land - and the new hash
+    is stored in recipe_hashes. Items that disappeared from the CSV are left alone
+    because events may still reference them.
+    """
+    started = time.perf_counter()
+    recipes_df = pd.read_csv(recipes_path)
+    issued = FreshIdRegistry()
+    ingredients = prepare_all_ingredients(read_inventory(inventory_path), recipes_df, issued)
+    hashes = recipe_block_hashes(recipes_df)
+
+    with engine.begin() as conn:
+        claim_stored_fresh_ids(conn, issued)
+        stored = {menu_id: digest for menu_id, digest in conn.execute(select(RecipeHash.menu_item_id, RecipeHash.content_hash))}
+        changed = [menu_id for menu_id, digest in hashes.items() if stored.get(menu_id) != digest]
+        print(f"{len(changed)} of {len(hashes)} menu items changed since the last sync.")
+        if dry_run or not changed:
+            return changed
+
+        known_ingredients = set(conn.execute(select(Ingredient.id)).scalars())
+        new_ingredients = ingredients[~ingredients["id"].isin(known_ingredients)]
+        written = write_chunks(conn, Ingredient.__table__, new_ingredients, chunk_size)
+        known_ingredients |= set(new_ingredients["id"])
+
+        menu_items = prepare_menu_items(recipes_df)
+        menu_items = menu_items[menu_items["id"].isin(changed)]
+        existing_items = set(conn.execute(select(MenuItem.id)).scalars())
+        is_new = ~menu_items["id"].isin(existing_items)
+        written += write_chunks(conn, MenuItem.__table__, menu_items[is_new], chunk_size)
+        updates = menu_items[~is_new].rename(columns={"id": "b_id"})
+        if len(updates):
+            table = MenuItem.__table__
+            conn.execute(update(table).where(table.c.id == bindparam("b_id")), _records(updates))
+            written += len(updates)
+
+        recipes = prepare_recipes(recipes_df)
+        recipes = recipes[recipes["menu_item_id"].isin(changed) & recipes["ingredient_id"].isin(known_ingredients)]
+        for batch in _in_batches(changed, chunk_size):
+            conn.execute(delete(Recipe).where(Recipe.menu_item_id.in_(batch)))
+            conn.execute(delete(RecipeHash).where(RecipeHash.menu_item_id.in_(batch)))
+        written += write_chunks(conn, Recipe.__table__, recipes, chunk_size)
+        write_chunks(conn, RecipeHash.__table__, pd.DataFrame(
+            {"menu_item_id": changed, "content_hash": [hashes[menu_id] for menu_id in changed]}
+        ), chunk_size)
+
+        # Events planning a rewritten item get their materialized indent rebuilt
+        rebuild_indents_for_items(conn, changed, chunk_size)
+
+    invalidate_recipe_matrix()
+    invalidate_indent_cache()
+    elapsed = time.perf_counter() - started
+    print(f"Rewrote {len(changed)} menu items ({written} rows) in {elapsed:.2f}s.")
+    return changed
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return {"path": os.path.abspath(path), "size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def new_progress(chunk_rows=STREAM_CHUNK_ROWS):
+    return {"chunk_rows": chunk_rows, "chunks_done": 0, "rows_done": 0, "complete": False}
+
+
+def load_checkpoint(checkpoint_path, stages):
+    """
+    Progress per stage ({"chunk_rows", "chunks_done", "rows_done", "complete"}), if the
+    checkpoint still describes the same files. Checkpoints without chunk counts (older
+    format) are ignored, since parsed rows cannot be mapped back to a file position.
+    """
+    try:
+        with open(checkpoint_path) as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {
+        stage: {key: saved[stage][key] for key in new_progress()}
+        for stage, path in stages.items()
+        if stage in saved and saved[stage].get("file") == _file_signature(path)
+        and all(key in saved[stage] for key in new_progress())
+    }
+
+
+def save_checkpoint(checkpoint_path, stages, progress):
+    state = {
+        stage: {"file": _file_signature(path), **progress.get(stage, new_progress())}
+        for stage, path in stages.items()
+    }
+    tmp_path = checkpoint_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, checkpoint_path)  # atomic, so a crash never leaves a torn checkpoint
+
+
+def _stream_inventory_chunk(conn, chunk, chunk_size):
+    ingredients = prepare_ingredients(chunk)
+    existing = load_chunk_keys(conn, ingredients["id"], [])["ingredients"]
+    return write_chunks(conn, Ingredient.__table__, ingredients[~ingredients["id"].isin(existing)], chunk_size)
+
+
+def _stream_recipes_chunk(conn, chunk, chunk_size, issued):
+    menu_items = prepare_menu_items(chunk)
+    recipes = prepare_recipes(chunk)
+    fresh = fresh_ingredient_frame(chunk, issued)
+    keys = load_chunk_keys(conn, recipes["ingredient_id"].unique(), menu_items["id"])
+    changes = diff_frames(keys, fresh, menu_items, recipes)
+    written = write_chunks(conn, Ingredient.__table__, changes["ingredients"], chunk_size)
+    written += write_chunks(conn, MenuItem.__table__, changes["menu_items"], chunk_size)
+    written += write_chunks(conn, Recipe.__table__, changes["recipes"], chunk_size)
+    rebuild_indents_for_items(conn, changes["recipes"]["menu_item_id"].unique(), chunk_size)
+    return written
+
+
+def ingest_stream(inventory_path=INVENTORY_CSV, recipes_path=RECIPES_CSV, chunk_rows=STREAM_CHUNK_ROWS,
+                  chunk_size=CHUNK_SIZE, checkpoint_path=CHECKPOINT_PATH, resume=True):
+    """
+    Bounded-memory ingestion for catalogues larger than RAM.
+
+    Each CSV is read `chunk_rows` rows at a time; every chunk is parsed, diffed
+    against only the keys it mentions and committed in its own transaction, after
+    which the checkpoint records how many chunks are done. A re-run with the same
+    files resumes after the last committed chunk: the reader is re-opened with the
+    checkpoint's chunk size and the done chunks are passed over unwritten. Their
+    file position does not depend on the parsed row count, which is short of the
+    line count wherever read_inventory skipped bad lines.
+    """
+    started = time.perf_counter()
+    stages = {"inventory": inventory_path, "recipes": recipes_path}
+    # Fresh ids issued by every recipes chunk, seeded with the stored ones when that stage starts
+    issued = FreshIdRegistry()
+    handlers = {"inventory": _stream_inventory_chunk, "recipes": partial(_stream_recipes_chunk, issued=issued)}
+    progress = load_checkpoint(checkpoint_path, stages) if resume else {}
+    if progress:
+        print("Resuming from checkpoint: " + ", ".join(f"{k}={v['rows_done']} rows" for k, v in progress.items()))
+
+    written = 0
+    for stage, path in stages.items():
+        state = progress.setdefault(stage, new_progress(chunk_rows))
+        if state["complete"]:
+            continue
+        read = read_inventory if stage == "inventory" else pd.read_csv
+        if stage == "recipes":
+            with engine.connect() as conn:
+                claim_stored_fresh_ids(conn, issued)
+        reader = read(path, chunksize=state["chunk_rows"])
+        for index, chunk in enumerate(reader):
+            if index < state["chunks_done"]:
+                continue
+            with engine.begin() as conn:
+                written += handlers[stage](conn, chunk, chunk_size)
+            state["chunks_done"] += 1
+            state["rows_done"] += len(chunk)
+            save_checkpoint(checkpoint_path, stages, progress)
+            print(f"  {stage}: {state['rows_done']} rows committed")
+        state["complete"] = True
+        save_checkpoint(checkpoint_path, stages, progress)
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    invalidate_recipe_matrix()
+    invalidate_indent_cache()
+    elapsed = time.perf_counter() - started
+    print(f"Streamed {written} new rows in {elapsed:.2f}s ({written / elapsed if elapsed else 0:.0f} rows/sec).")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load the inventory and recipe CSVs into the database.")
+    parser.add_argument("--inventory", default=INVENTORY_CSV)
+    parser.add_argument("--recipes", default=RECIPES_CSV)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be inserted.")
+    parser.add_argument("--stream", action="store_true", help="Read the CSVs in bounded chunks, committing and checkpointing each one.")
+    parser.add_argument("--chunk-rows", type=int, default=STREAM_CHUNK_ROWS, help="CSV lines per streamed chunk.")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_PATH)
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint.")
+    parser.add_argument("--sync", action="store_true", help="Incremental sync: rewrite only menu items whose recipe block hash changed.")
+    args = parser.parse_args()
+    if args.sync:
+        sync_data(args.inventory, args.recipes, dry_run=args.dry_run, chunk_size=args.chunk_size)
+    elif args.stream:
+        if args.dry_run:
+            parser.error("--dry-run is not supported with --stream")
+        ingest_stream(args.inventory, args.recipes, chunk_rows=args.chunk_rows, chunk_size=args.chunk_size,
+                      checkpoint_path=args.checkpoint, resume=not args.restart)
+    else:
+        ingest_data(args.inventory, args.recipes, dry_run=args.dry_run, chunk_size=args.chunk_size)
+
 
 if __name__ == "__main__":
-    ingest_data()
+    main()
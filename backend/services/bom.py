@@ -0,0 +1,52 @@
+from collections import Counter
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from backend.models import Ingredient, Recipe
+from backend.services.recipe_matrix import get_unit_table
+
+
+def servings_for_selection(menu_item_ids: list[int], portion_per_item: float):
+    # Repeated ids in a selection are counted once per occurrence, like the old loop did
+    return {item_id: count * portion_per_item for item_id, count in Counter(menu_item_ids).items()}
+
+
+def explode_bom(db: Session, servings: dict[int, float]):
+    """
+    Resolve the ingredient indent for a whole menu selection in one statement.
+
+    `servings` maps menu_item_id -> servings to prepare. The per-item weight is
+    inlined as a CASE so recipes ⋈ ingredients can be aggregated by ingredient_id
+    on the database side instead of one query per menu item / ingredient.
+    """
+    if not servings:
+        return []
+
+    weight = case(servings, value=Recipe.menu_item_id, else_=0.0)
+    rows = (
+        db.query(
+            Recipe.ingredient_id,
+            func.coalesce(Ingredient.name, "Unknown"),
+            func.coalesce(Ingredient.category, "Misc"),
+            Recipe.unit,
+            func.sum(Recipe.quantity * weight),
+        )
+        .outerjoin(Ingredient, Ingredient.id == Recipe.ingredient_id)
+        .filter(Recipe.menu_item_id.in_(list(servings)))
+        .filter(Recipe.ingredient_id.isnot(None))  # Skip N/A for now
+        .group_by(Recipe.ingredient_id, Ingredient.name, Ingredient.category, Recipe.unit)
+        .order_by(Recipe.ingredient_id)
+        .all()
+    )
+
+    # Per-unit partial sums -> one line per (ingredient, canonical unit)
+    units = get_unit_table(db)
+    indent = {}
+    for ing_id, name, category, unit, qty in rows:
+        canonical, factor = units.convert(ing_id, unit)
+        key = (ing_id, canonical)
+        if key not in indent:
+            indent[key] = {"id": ing_id, "name": name, "quantity": 0.0, "unit": canonical, "category": category}
+        indent[key]["quantity"] += (qty or 0.0) * factor
+    return [indent[key] for key in sorted(indent)]
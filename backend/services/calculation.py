@@ -1,11 +1,17 @@
-from backend.models import Event, MenuItem, Ingredient, Recipe, ProductionPlan
+from backend.models import Event
 from sqlalchemy.orm import Session
+from backend.services.bom import explode_bom, servings_for_selection
+from backend.services.indent_cache import memoized_indent
+from backend.services.recipe_matrix import RECIPE_MATRIX_ENABLED, RecipeMatrix, catalogue_version, get_recipe_matrix
 
 # Constants from PDF
 MALE_CONSUMPTION = 1.0
 FEMALE_CONSUMPTION = 0.85
 CHILD_CONSUMPTION = 0.5
 
+# Just-in-time cooking split: 60% first batch, 30% second, 10% top-up
+JIT_SPLIT = (0.60, 0.30, 0.10)
+
 def calculate_stomach_ceiling(event: Event):
     # Total Capacity = (Male * 1.0) + (Female * 0.85) + (Child * 0.5)
     capacity = (event.pax_male * MALE_CONSUMPTION) + \
@@ -13,13 +19,7 @@ def calculate_stomach_ceiling(event: Event):
                (event.pax_child * CHILD_CONSUMPTION)
     return capacity
 
-def calculate_indent(db: Session, event_id: int, menu_item_ids: list[int]):
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
-        raise ValueError("Event not found")
-    
-    capacity = calculate_stomach_ceiling(event)
-
+def build_indent(capacity: float, menu_item_ids: list[int], explode):
     # 1. Total Capacity needed (in KG, assuming 1 unit = 1 kg for simplicity or normalized)
     total_capacity = capacity
     num_items = len(menu_item_ids)
@@ -29,49 +29,75 @@ def calculate_indent(db: Session, event_id: int, menu_item_ids: list[int]):
     # 2. Distribute Capacity (Menu Density Logic)
     # Simple uniform distribution for now: Portion = Capacity / N
     portion_per_item = total_capacity / num_items
-    
+
     # 3. Aggregation
-    ingredient_totals = {} # {id: {name, qty, unit}}
-
-    for item_id in menu_item_ids:
-        recipes = db.query(Recipe).filter(Recipe.menu_item_id == item_id).all()
-        
-        # Assumption: Recipe Quantity is for **1 Serving**.
-        # Treat "Capacity" as "Total Servings" for now.
-        
-        servings_to_prep = portion_per_item 
-        
-        for recipe in recipes:
-            if recipe.ingredient_id: # Skip N/A for now
-               qty = recipe.quantity * servings_to_prep
-               ing_id = recipe.ingredient_id
-               
-               if ing_id not in ingredient_totals:
-                   ing_obj = db.query(Ingredient).filter(Ingredient.id == ing_id).first()
-                   name = ing_obj.name if ing_obj else "Unknown"
-                   ingredient_totals[ing_id] = {
-                       "id": ing_id,
-                       "name": name,
-                       "quantity": 0.0,
-                       "unit": recipe.unit,
-                       "category": ing_obj.category if ing_obj else "Misc"
-                   }
-               
-               ingredient_totals[ing_id]["quantity"] += qty
-
-    # Convert to list
-    indent_list = list(ingredient_totals.values())
-    
+    # Assumption: Recipe Quantity is for **1 Serving**.
+    # Treat "Capacity" as "Total Servings" for now.
+    servings = servings_for_selection(menu_item_ids, portion_per_item)
+    indent_list = explode(servings)
+
     return {
-        "capacity": total_capacity, 
+        "capacity": total_capacity,
         "total_items": num_items,
         "portion_per_item": portion_per_item,
         "indent": indent_list
     }
 
+def calculate_indent(db: Session, event_id: int, menu_item_ids: list[int]):
+    event = db.query(Event).filter(Event.id == event_id).first()
+    if not event:
+        raise ValueError("Event not found")
+
+    capacity = calculate_stomach_ceiling(event)
+
+    if RECIPE_MATRIX_ENABLED:
+        matrix = get_recipe_matrix(db)
+        version, explode = matrix.version, matrix.explode
+    else:
+        version = catalogue_version(db)
+        explode = lambda servings: explode_bom(db, servings)
+    return memoized_indent(capacity, menu_item_ids, version, lambda: build_indent(capacity, menu_item_ids, explode))
+
+def calculate_indent_batch(db: Session, requests: list[tuple[int, list[int]]], consolidate: bool = False):
+    # One query for all events, one recipe load for all menus, then pure in-memory math
+    event_ids = {event_id for event_id, _ in requests}
+    events = {e.id: e for e in db.query(Event).filter(Event.id.in_(event_ids))} if event_ids else {}
+    missing = sorted(event_ids - set(events))
+    if missing:
+        raise ValueError(f"Events not found: {missing}")
+
+    if RECIPE_MATRIX_ENABLED:
+        matrix = get_recipe_matrix(db)
+        version = matrix.version
+    else:
+        needed = {item_id for _, menu_item_ids in requests for item_id in menu_item_ids}
+        matrix = RecipeMatrix.build(db, None, menu_item_ids=needed)
+        version = catalogue_version(db)
+
+    results = []
+    for event_id, menu_item_ids in requests:
+        capacity = calculate_stomach_ceiling(events[event_id])
+        indent = memoized_indent(
+            capacity, menu_item_ids, version, lambda: build_indent(capacity, menu_item_ids, matrix.explode)
+        )
+        results.append({"event_id": event_id, **indent})
+
+    consolidated = None
+    if consolidate:
+        totals = {}
+        for result in results:
+            for line in result["indent"]:
+                key = (line["id"], line["unit"])
+                if key not in totals:
+                    totals[key] = {**line, "quantity": 0.0}
+                totals[key]["quantity"] += line["quantity"]
+        consolidated = [totals[key] for key in sorted(totals)]
+
+    return {"results": results, "consolidated": consolidated}
+
 def jit_batching(total_qty: float):
     return {
-        "batch_1": total_qty * 0.60,
-        "batch_2": total_qty * 0.30,
-        "batch_3": total_qty * 0.10
+        "batch_1": total_qty * JIT_SPLIT[0],
+        "batch_2": total_qty * JIT_SPLIT[1],
+        "batch_3": total_qty * JIT_SPLIT[2]
     }
@@ -0,0 +1,82 @@
+import gzip
+import hashlib
+import json
+import threading
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.models import MenuItem
+from backend.services.revisions import MENU, catalogue_revision
+
+try:  # optional: brotli is only used when installed
+    import brotli
+except ImportError:
+    brotli = None
+
+MENU_FIELDS = ("id", "name", "category", "sub_category", "diet_type")
+
+# Browsers always revalidate (cheap 304s via the ETag); Vercel's edge may serve a
+# cached copy for 5 minutes and keep serving it stale while it refetches.
+MENU_CACHE_CONTROL = "public, max-age=0, must-revalidate, s-maxage=300, stale-while-revalidate=86400"
+
+
+class MenuCatalogue:
+    """The full GET /menu-items body, serialized once and kept as bytes (plus compressed variants)."""
+
+    def __init__(self, version, items):
+        self.version = version
+        self.count = len(items)
+        # Same encoding FastAPI's JSONResponse uses, so the bytes match the uncached path
+        self.body = json.dumps(items, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.encoded = {"gzip": gzip.compress(self.body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            self.encoded["br"] = brotli.compress(self.body, quality=11)
+
+    def etag(self, encoding=None):
+        """Strong ETag of one representation: each content-coding gets its own tag."""
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+    def matches(self, if_none_match):
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison, as required for If-None-Match (proxies may add W/); a tag of
+        # any coding validates, since all of them encode the same body
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return any(self.etag(encoding) in tags for encoding in (None, *self.encoded))
+
+    def negotiate(self, accept_encoding):
+        """(content-encoding or None, body) for the client's Accept-Encoding."""
+        accepted = {part.split(";")[0].strip().lower() for part in (accept_encoding or "").split(",")}
+        for encoding in ("br", "gzip"):
+            if encoding in accepted and encoding in self.encoded:
+                return encoding, self.encoded[encoding]
+        return None, self.body
+
+
+_lock = threading.Lock()
+_catalogue = None
+
+
+def get_menu_catalogue(db: Session) -> MenuCatalogue:
+    global _catalogue
+    # Trigger-maintained counter: any write to menu_items, same-length renames included
+    version = catalogue_revision(db, MENU)
+    catalogue = _catalogue
+    if catalogue is not None and catalogue.version == version:
+        return catalogue
+    with _lock:
+        if _catalogue is None or _catalogue.version != version:
+            columns = [getattr(MenuItem, field) for field in MENU_FIELDS]
+            rows = db.execute(select(*columns).order_by(MenuItem.id)).all()
+            _catalogue = MenuCatalogue(version, [dict(zip(MENU_FIELDS, row)) for row in rows])
+        return _catalogue
+
+
+def invalidate_menu_catalogue():
+    global _catalogue
+    with _lock:
+        _catalogue = None
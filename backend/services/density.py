@@ -0,0 +1,141 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.models import FRESH_CATEGORY, Event, Ingredient, MenuItem
+from backend.services.calculation import calculate_stomach_ceiling
+from backend.services.recipe_matrix import RECIPE_MATRIX_ENABLED, RecipeMatrix, get_recipe_matrix
+
+STOCK_TOLERANCE = 1e-9
+
+
+def density_weights(items, category_weights=None, veg_share=None):
+    """
+    Relative portion weight per item: its category's weight (default 1.0),
+    then rescaled so Veg items get `veg_share` of the total when both diets
+    are on the menu.
+    """
+    import numpy as np
+    category_weights = category_weights or {}
+    weights = np.array([float(category_weights.get(item["category"], 1.0)) for item in items])
+    if veg_share is not None:
+        veg = np.array([item["diet_type"] == "Veg" for item in items])
+        if weights[veg].sum() > 0 and weights[~veg].sum() > 0:
+            weights[veg] *= veg_share / weights[veg].sum()
+            weights[~veg] *= (1.0 - veg_share) / weights[~veg].sum()
+    return weights
+
+
+def allocate_portions(capacity, weights, usage, stock):
+    """
+    Water-filling: give each item capacity * weight share, then while some
+    ingredient's stock is exceeded scale the items drawing on it down to fit,
+    freeze them, and hand the freed capacity to the remaining items by weight.
+    Each round freezes at least one item, so it settles within n + 1 rounds.
+
+    usage is (items, ingredients) per-portion quantities; stock holds the
+    limit per ingredient (inf when unconstrained). Returns (portions, binding
+    ingredient columns).
+    """
+    import numpy as np
+    n = len(weights)
+    portions = np.zeros(n)
+    free = weights > 0
+    binding = set()
+    for _ in range(n + 2):
+        room = capacity - portions[~free].sum()
+        if free.any() and room > 0:
+            portions[free] = room * weights[free] / weights[free].sum()
+        demand = portions @ usage
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(demand > 0, stock / demand, np.inf)
+        over = ratio < 1.0 - STOCK_TOLERANCE
+        if not over.any():
+            break
+        binding.update(np.flatnonzero(over).tolist())
+        # Shrink every item by its tightest violated ingredient; feasible for all of them at once
+        item_ratio = np.where(usage[:, over] > 0, ratio[over], np.inf).min(axis=1, initial=np.inf)
+        hit = item_ratio < 1.0
+        portions[hit] *= item_ratio[hit]
+        free &= ~hit
+    return portions, sorted(binding)
+
+
+def optimize_indent(db: Session, event_id: int, menu_item_ids: list[int], category_weights=None,
+                    veg_share=None, respect_stock=True):
+    """
+    Menu-density indent: per-item portions that fill the event's Stomach Ceiling
+    (sum of portions <= capacity) following category weights and the Veg/Non-Veg
+    split, without planning more of an ingredient than is in stock. With no
+    weights, split or binding stock this is calculate_indent's uniform
+    capacity / N split, except that repeated ids count once here
+    (calculate_indent counts each occurrence). Only a positive stock_qty caps
+    an ingredient: zero or unknown stock means it is not tracked (many of the
+    bundled disposables sit at 0), not that none may be used.
+    """
+    import numpy as np
+    event = db.query(Event).filter(Event.id == event_id).first()
+    if not event:
+        raise ValueError("Event not found")
+    capacity = calculate_stomach_ceiling(event)
+    menu_item_ids = list(dict.fromkeys(menu_item_ids))
+    if not menu_item_ids:
+        return {"capacity": capacity, "indent": [], "portions": []}
+
+    rows = db.execute(
+        select(MenuItem.id, MenuItem.name, MenuItem.category, MenuItem.diet_type).where(MenuItem.id.in_(menu_item_ids))
+    ).all()
+    found = {row[0]: dict(zip(("id", "name", "category", "diet_type"), row)) for row in rows}
+    missing = [item_id for item_id in menu_item_ids if item_id not in found]
+    if missing:
+        raise ValueError(f"Menu items not found: {missing}")
+    items = [found[item_id] for item_id in menu_item_ids]
+
+    if RECIPE_MATRIX_ENABLED:
+        matrix = get_recipe_matrix(db)
+    else:
+        matrix = RecipeMatrix.build(db, None, menu_item_ids=set(menu_item_ids))
+    # Dense per-portion usage (canonical units) over the ingredients this menu touches
+    cols = sorted({
+        int(c) for item_id in menu_item_ids if item_id in matrix.row_of
+        for c in matrix.indices[matrix.indptr[matrix.row_of[item_id]]:matrix.indptr[matrix.row_of[item_id] + 1]]
+    })
+    col_pos = {c: k for k, c in enumerate(cols)}
+    usage = np.zeros((len(items), len(cols)))
+    for i, item_id in enumerate(menu_item_ids):
+        row = matrix.row_of.get(item_id)
+        if row is not None:
+            for k in range(matrix.indptr[row], matrix.indptr[row + 1]):
+                usage[i, col_pos[int(matrix.indices[k])]] += matrix.data[k]
+
+    stock = np.full(len(cols), np.inf)
+    if respect_stock and cols:
+        ing_ids = [matrix.ingredient_ids[c] for c in cols]
+        # Fresh produce is bought per event rather than held in stock, so it never binds
+        on_hand = dict(db.execute(
+            select(Ingredient.id, Ingredient.stock_qty)
+            .where(Ingredient.id.in_(ing_ids), Ingredient.category != FRESH_CATEGORY)
+        ).all())
+        for k, c in enumerate(cols):
+            qty = on_hand.get(matrix.ingredient_ids[c])
+            info = matrix.unit_table.stock(matrix.ingredient_ids[c])
+            # Matrix quantities are canonical; only comparable when the stock unit converts to the same one
+            if qty and qty > 0 and info is not None and info.canonical == matrix.units[c]:
+                stock[k] = qty * info.stock_factor
+
+    weights = density_weights(items, category_weights, veg_share)
+    portions, binding = allocate_portions(capacity, weights, usage, stock)
+    servings = {item_id: float(p) for item_id, p in zip(menu_item_ids, portions)}
+    allocated = float(portions.sum())
+    return {
+        "capacity": capacity,
+        "total_items": len(items),
+        "allocated": allocated,
+        "coverage": allocated / capacity if capacity else 0.0,
+        "portions": [
+            {"menu_item_id": item["id"], "name": item["name"], "category": item["category"],
+             "diet_type": item["diet_type"], "portion": servings[item["id"]]}
+            for item in items
+        ],
+        "binding_ingredients": [matrix.ingredient_ids[cols[k]] for k in binding],
+        "indent": matrix.explode(servings),
+    }
@@ -0,0 +1,178 @@
+import math
+from collections import Counter, defaultdict
+
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from backend.models import Event, EventIndent, Ingredient, ProductionPlan, Recipe
+from backend.services.calculation import build_indent, calculate_stomach_ceiling
+from backend.services.production import portion_per_item
+from backend.services.recipe_matrix import RecipeMatrix, get_unit_table
+
+# Core table for executemany DML (ORM bulk UPDATE only supports by-primary-key dicts)
+event_indent = EventIndent.__table__
+
+
+def rescale_event_indent(db: Session, event_ids=None):
+    """quantity = base_qty * portion_per_item; all a headcount change needs, no BOM work."""
+    stmt = update(event_indent).values(
+        quantity=event_indent.c.base_qty * portion_per_item(event_indent.c.event_id)
+    )
+    if event_ids is not None:
+        stmt = stmt.where(event_indent.c.event_id.in_(event_ids))
+    db.execute(stmt)
+
+
+def rebuild_event_indent(db: Session, event_ids=None):
+    """Full rebuild from production_plan x recipes (new events, backfills, recipe changes). Does not commit."""
+    lines = (
+        select(
+            ProductionPlan.event_id,
+            Recipe.ingredient_id,
+            Recipe.unit,
+            func.sum(func.coalesce(Recipe.quantity, 0.0)),
+            func.count(Recipe.id),
+        )
+        .join(Recipe, Recipe.menu_item_id == ProductionPlan.menu_item_id)
+        .where(Recipe.ingredient_id.isnot(None))
+        .group_by(ProductionPlan.event_id, Recipe.ingredient_id, Recipe.unit)
+    )
+    clear = delete(event_indent)
+    if event_ids is not None:
+        event_ids = list(event_ids)
+        lines = lines.where(ProductionPlan.event_id.in_(event_ids))
+        clear = clear.where(event_indent.c.event_id.in_(event_ids))
+
+    # Per-unit partial sums merged into one row per (event, ingredient, canonical unit)
+    units = get_unit_table(db)
+    rows = {}
+    for event_id, ing_id, unit, qty, line_count in db.execute(lines):
+        canonical, factor = units.convert(ing_id, unit)
+        row = rows.setdefault((event_id, ing_id, canonical), {
+            "event_id": event_id, "ingredient_id": ing_id, "base_qty": 0.0, "line_count": 0, "unit": canonical,
+        })
+        row["base_qty"] += qty * factor
+        row["line_count"] += line_count
+    db.execute(clear)
+    if rows:
+        db.execute(insert(event_indent), list(rows.values()))
+    rescale_event_indent(db, event_ids)
+
+
+def apply_menu_delta(db: Session, event_id: int, menu_item_ids: list[int], sign: int):
+    """
+    Add (sign=1) or remove (sign=-1) menu items' recipe lines to an event's
+    materialized indent. Only the ingredients those items use are touched,
+    then the event's rows are rescaled for the new portion. Call after the
+    ProductionPlan rows have been changed; does not commit.
+    """
+    counts = Counter(menu_item_ids)
+    recipe_rows = db.execute(
+        select(Recipe.menu_item_id, Recipe.ingredient_id, Recipe.quantity, Recipe.unit)
+        .where(Recipe.menu_item_id.in_(list(counts)), Recipe.ingredient_id.isnot(None))
+    )
+    units = get_unit_table(db)
+    deltas = {}
+    for menu_id, ing_id, qty, unit in recipe_rows:
+        n = counts[menu_id] * sign
+        canonical, factor = units.convert(ing_id, unit)
+        base, line_count = deltas.get((ing_id, canonical), (0.0, 0))
+        deltas[(ing_id, canonical)] = (base + (qty or 0.0) * factor * n, line_count + n)
+
+    if deltas:
+        existing = set(db.execute(
+            select(event_indent.c.ingredient_id, event_indent.c.unit)
+            .where(event_indent.c.event_id == event_id,
+                   event_indent.c.ingredient_id.in_({ing_id for ing_id, _ in deltas}))
+        ).tuples())
+        updates = [
+            {"b_ingredient": ing_id, "b_unit": unit, "b_base": base, "b_lines": line_count}
+            for (ing_id, unit), (base, line_count) in deltas.items() if (ing_id, unit) in existing
+        ]
+        if updates:
+            db.execute(
+                update(event_indent)
+                .where(event_indent.c.event_id == event_id, event_indent.c.ingredient_id == bindparam("b_ingredient"),
+                       event_indent.c.unit == bindparam("b_unit"))
+                .values(base_qty=event_indent.c.base_qty + bindparam("b_base"),
+                        line_count=event_indent.c.line_count + bindparam("b_lines")),
+                updates,
+            )
+        inserts = [
+            {"event_id": event_id, "ingredient_id": ing_id, "base_qty": base, "line_count": line_count, "unit": unit}
+            for (ing_id, unit), (base, line_count) in deltas.items() if (ing_id, unit) not in existing and line_count > 0
+        ]
+        if inserts:
+            db.execute(insert(event_indent), inserts)
+        db.execute(delete(event_indent).where(event_indent.c.event_id == event_id, event_indent.c.line_count <= 0))
+    rescale_event_indent(db, [event_id])
+
+
+def read_event_indent(db: Session, event_id: int):
+    """The materialized indent, shaped like calculate_indent's response."""
+    event = db.get(Event, event_id)
+    if not event:
+        raise ValueError("Event not found")
+    capacity = calculate_stomach_ceiling(event)
+    num_items = db.execute(select(func.count(ProductionPlan.id)).where(ProductionPlan.event_id == event_id)).scalar()
+    if not num_items:
+        return {"event_id": event_id, "capacity": capacity, "indent": []}
+
+    rows = db.execute(
+        select(
+            event_indent.c.ingredient_id,
+            func.coalesce(Ingredient.name, "Unknown"),
+            event_indent.c.quantity,
+            event_indent.c.unit,
+            func.coalesce(Ingredient.category, "Misc"),
+        )
+        .outerjoin(Ingredient, Ingredient.id == event_indent.c.ingredient_id)
+        .where(event_indent.c.event_id == event_id)
+        .order_by(event_indent.c.ingredient_id, event_indent.c.unit)
+    )
+    return {
+        "event_id": event_id,
+        "capacity": capacity,
+        "total_items": num_items,
+        "portion_per_item": capacity / num_items,
+        "indent": [
+            {"id": ing_id, "name": name, "quantity": qty, "unit": unit, "category": category}
+            for ing_id, name, qty, unit, category in rows
+        ],
+    }
+
+
+def check_event_indent(db: Session, event_ids=None, rel_tol=1e-9, abs_tol=1e-6):
+    """
+    Compare the materialized indent against a full recompute of each event's
+    planned menu. Returns one dict per disagreeing (event, ingredient, unit);
+    empty when consistent.
+    """
+    events = db.query(Event)
+    plans = select(ProductionPlan.event_id, ProductionPlan.menu_item_id).order_by(ProductionPlan.id)
+    stored = select(event_indent.c.event_id, event_indent.c.ingredient_id, event_indent.c.unit, event_indent.c.quantity)
+    if event_ids is not None:
+        event_ids = list(event_ids)
+        events = events.filter(Event.id.in_(event_ids))
+        plans = plans.where(ProductionPlan.event_id.in_(event_ids))
+        stored = stored.where(event_indent.c.event_id.in_(event_ids))
+
+    menus = defaultdict(list)
+    for event_id, menu_item_id in db.execute(plans):
+        menus[event_id].append(menu_item_id)
+    materialized = defaultdict(dict)
+    for event_id, ing_id, unit, qty in db.execute(stored):
+        materialized[event_id][(ing_id, unit)] = qty
+    matrix = RecipeMatrix.build(db, None, menu_item_ids={m for menu in menus.values() for m in menu})
+
+    mismatches = []
+    for event in events:
+        indent = build_indent(calculate_stomach_ceiling(event), menus[event.id], matrix.explode)["indent"]
+        expected = {(line["id"], line["unit"]): line["quantity"] for line in indent}
+        actual = materialized[event.id]
+        for ing_id, unit in sorted(expected.keys() | actual.keys()):
+            want, got = expected.get((ing_id, unit)), actual.get((ing_id, unit))
+            if want is None or got is None or not math.isclose(want, got, rel_tol=rel_tol, abs_tol=abs_tol):
+                mismatches.append({"event_id": event.id, "ingredient_id": ing_id, "unit": unit,
+                                   "materialized": got, "expected": want})
+    return mismatches
@@ -0,0 +1,124 @@
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from backend.models import Event, MenuItem, ProductionPlan
+from backend.services.event_indent import apply_menu_delta, read_event_indent, rebuild_event_indent, rescale_event_indent
+from backend.services.production import get_production_plan, materialize_production_plans
+
+EVENT_FIELDS = ("name", "date", "venue", "pax_male", "pax_female", "pax_child", "profile_type")
+HEADCOUNT_FIELDS = ("pax_male", "pax_female", "pax_child")
+
+
+def _check_menu_items(db: Session, menu_item_ids):
+    wanted = set(menu_item_ids)
+    if wanted:
+        known = set(db.execute(select(MenuItem.id).where(MenuItem.id.in_(wanted))).scalars())
+        unknown = sorted(wanted - known)
+        if unknown:
+            raise ValueError(f"Unknown menu item ids: {unknown}")
+
+
+def _plan_rows(event_id, menu_item_ids):
+    # Quantities are filled in by materialize_production_plans
+    return [
+        {"event_id": event_id, "menu_item_id": item_id, "total_qty_needed": 0.0,
+         "batch_1_qty": 0.0, "batch_2_qty": 0.0, "batch_3_qty": 0.0}
+        for item_id in menu_item_ids
+    ]
+
+
+def _event_dict(event: Event):
+    return {"id": event.id, **{field: getattr(event, field) for field in EVENT_FIELDS}}
+
+
+def create_events(db: Session, events: list[dict]) -> list[dict]:
+    """
+    Create events (EVENT_FIELDS + "menu_item_ids") and their ProductionPlan rows
+    in one transaction: one multi-row INSERT ... RETURNING for the events, one
+    executemany for the plans, then set-based statements that materialize the
+    plan quantities, JIT batches and event_indent. Unknown menu item ids raise
+    ValueError and nothing is written. Returns the created events as dicts, in
+    input order.
+    """
+    if not events:
+        return []
+    menus = [list(dict.fromkeys(e.get("menu_item_ids") or [])) for e in events]
+    _check_menu_items(db, {item_id for menu in menus for item_id in menu})
+
+    try:
+        rows = [{field: e[field] for field in EVENT_FIELDS} for e in events]
+        stmt = insert(Event).returning(Event.id, sort_by_parameter_order=True)
+        ids = db.execute(stmt, rows).scalars().all()
+        plans = [plan for event_id, menu in zip(ids, menus) for plan in _plan_rows(event_id, menu)]
+        if plans:
+            db.execute(insert(ProductionPlan), plans)
+            materialize_production_plans(db, ids)
+            rebuild_event_indent(db, ids)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return [{"id": event_id, **row} for event_id, row in zip(ids, rows)]
+
+
+def update_event(db: Session, event_id: int, changes: dict):
+    """Apply field changes; a headcount change only rescales the plan and indent, no BOM explosion."""
+    event = db.get(Event, event_id)
+    if not event:
+        raise ValueError("Event not found")
+    headcount_changed = any(
+        field in HEADCOUNT_FIELDS and getattr(event, field) != value for field, value in changes.items()
+    )
+    for field, value in changes.items():
+        setattr(event, field, value)
+    db.flush()
+    if headcount_changed:
+        materialize_production_plans(db, [event_id])
+        rescale_event_indent(db, [event_id])
+    db.commit()
+    return _event_dict(event)
+
+
+def add_menu_items(db: Session, event_id: int, menu_item_ids: list[int]):
+    """Plan extra menu items for an event; only their recipe lines are added to the indent."""
+    if db.get(Event, event_id) is None:
+        raise ValueError("Event not found")
+    _check_menu_items(db, menu_item_ids)
+    planned = set(db.execute(select(ProductionPlan.menu_item_id).where(ProductionPlan.event_id == event_id)).scalars())
+    added = [item_id for item_id in dict.fromkeys(menu_item_ids) if item_id not in planned]
+    if added:
+        db.execute(insert(ProductionPlan), _plan_rows(event_id, added))
+        materialize_production_plans(db, [event_id])
+        apply_menu_delta(db, event_id, added, 1)
+        db.commit()
+    return read_event_indent(db, event_id)
+
+
+def remove_menu_item(db: Session, event_id: int, menu_item_id: int):
+    """Drop a menu item from an event; only its recipe lines are subtracted from the indent."""
+    if db.get(Event, event_id) is None:
+        raise ValueError("Event not found")
+    in_plan = ProductionPlan.event_id == event_id, ProductionPlan.menu_item_id == menu_item_id
+    count = db.execute(select(func.count(ProductionPlan.id)).where(*in_plan)).scalar()
+    if not count:
+        raise ValueError("Menu item not in event plan")
+    db.execute(delete(ProductionPlan).where(*in_plan))
+    materialize_production_plans(db, [event_id])
+    apply_menu_delta(db, event_id, [menu_item_id] * count, -1)  # legacy plans may hold duplicates
+    db.commit()
+    return read_event_indent(db, event_id)
+
+
+def recompute_production_plans(db: Session, event_ids=None):
+    """Re-materialize plan quantities and event_indent from scratch (all events when None)."""
+    updated = materialize_production_plans(db, event_ids)
+    rebuild_event_indent(db, event_ids)
+    db.commit()
+    return updated
+
+
+def recompute_production_plan(db: Session, event_id: int):
+    if db.get(Event, event_id) is None:
+        raise ValueError("Event not found")
+    recompute_production_plans(db, [event_id])
+    return get_production_plan(db, event_id)
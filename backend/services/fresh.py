@@ -0,0 +1,85 @@
+import hashlib
+
+import pandas as pd
+
+from backend.models import FRESH_CATEGORY
+
+# Fresh produce (chicken, onion...) has no inventory Item ID; it gets its own
+# ingredient rows, with ids derived from the normalized name so every loader
+# (ingest_data.py, generate_inserts.py) agrees without consulting the DB.
+FRESH_ID_BASE = 1_000_000  # far above inventory Item IDs
+FRESH_ID_SPAN = 1_000_000
+
+INGREDIENT_COLUMNS = ["id", "name", "category", "regional_name", "brand", "package_size", "unit", "stock_qty"]
+
+
+def normalize_ingredient_name(names: pd.Series) -> pd.Series:
+    # "Meat (Chicken/Mutton)" -> "meat chicken mutton"
+    return names.astype(str).str.lower().str.replace(r"[^a-z0-9]+", " ", regex=True).str.strip()
+
+
+def fresh_ingredient_id(normalized_name: str) -> int:
+    digest = hashlib.sha256(normalized_name.encode("utf-8")).hexdigest()
+    return FRESH_ID_BASE + int(digest[:12], 16) % FRESH_ID_SPAN
+
+
+def is_fresh_line(recipes_df: pd.DataFrame) -> pd.Series:
+    """Recipe lines for produce outside the inventory: Ingredient Type=Fresh and Ingredient ID=N/A."""
+    ing_ids = pd.to_numeric(recipes_df['Ingredient ID'], errors='coerce')
+    return recipes_df['Ingredient Type'].astype(str).str.strip().str.lower().eq("fresh") & ing_ids.isna()
+
+
+def fresh_ingredient_ids(names: pd.Series) -> pd.Series:
+    """Vectorized name -> id: each distinct normalized name is hashed once, rows resolve through a dict."""
+    normalized = normalize_ingredient_name(names)
+    lookup = {name: fresh_ingredient_id(name) for name in normalized.dropna().unique() if name}
+    return normalized.map(lookup).where(names.notna())
+
+
+class FreshIdRegistry:
+    """
+    Every id issued in the fresh range so far -> the normalized name it stands for.
+    One registry spans all chunks of a load and is seeded with the rows already
+    stored, so a hash collision is caught wherever the other name came from.
+    """
+
+    def __init__(self):
+        self.names = {}
+
+    def claim(self, ids, normalized_names):
+        for fresh_id, name in zip(ids, normalized_names):
+            owner = self.names.setdefault(int(fresh_id), name)
+            if owner != name:
+                raise ValueError(f"Fresh ingredient id collision: {int(fresh_id)} is both {owner!r} and {name!r}")
+
+    def claim_existing(self, rows):
+        """(id, name) pairs of ingredients stored or loaded elsewhere; ids below the fresh range cannot collide."""
+        rows = [(int(ing_id), name) for ing_id, name in rows if ing_id is not None and ing_id >= FRESH_ID_BASE]
+        if rows:
+            self.claim([ing_id for ing_id, _ in rows], normalize_ingredient_name(pd.Series([name for _, name in rows])))
+
+
+def fresh_ingredient_frame(recipes_df: pd.DataFrame, issued: FreshIdRegistry = None) -> pd.DataFrame:
+    """
+    The deduplicated fresh-ingredient dimension of a recipes frame, in ingredients-table
+    columns. Pass the load's `issued` registry to check collisions beyond this frame.
+    """
+    lines = recipes_df[is_fresh_line(recipes_df)]
+    normalized = normalize_ingredient_name(lines['Ingredient Name'])
+    df = pd.DataFrame({
+        "id": fresh_ingredient_ids(lines['Ingredient Name']),
+        "normalized": normalized,
+        "name": lines['Ingredient Name'].astype(str).str.strip(),
+        "unit": lines['Unit'],
+    }).dropna(subset=["id"]).drop_duplicates(subset="normalized", keep="first")
+    (issued if issued is not None else FreshIdRegistry()).claim(df["id"], df["normalized"])
+    return pd.DataFrame({
+        "id": df["id"].astype("int64"),
+        "name": df["name"],
+        "category": FRESH_CATEGORY,
+        "regional_name": None,
+        "brand": None,
+        "package_size": None,
+        "unit": df["unit"],
+        "stock_qty": 0.0,  # bought per event, never stocked
+    }, columns=INGREDIENT_COLUMNS)
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+
+# INDENT_CACHE=0 disables memoization; INDENT_CACHE_SQLITE=/tmp/indent_cache.db adds a
+# second tier shared by every process (e.g. serverless instances on one host) that opens it.
+INDENT_CACHE_ENABLED = os.getenv("INDENT_CACHE", "1").lower() not in ("0", "false", "no")
+INDENT_CACHE_SIZE = int(os.getenv("INDENT_CACHE_SIZE", "256"))
+INDENT_CACHE_TTL = float(os.getenv("INDENT_CACHE_TTL", "3600"))  # seconds
+INDENT_CACHE_SQLITE = os.getenv("INDENT_CACHE_SQLITE") or None
+# Expired shared rows are purged once every this many writes rather than on each one
+INDENT_CACHE_PURGE_EVERY = int(os.getenv("INDENT_CACHE_PURGE_EVERY", "128"))
+
+
+def indent_key(capacity: float, menu_item_ids: list[int], recipe_version) -> str:
+    """
+    Canonical hash of everything an indent depends on. Ids are sorted but
+    duplicates kept, since repeated ids count once per occurrence.
+    """
+    payload = json.dumps([repr(float(capacity)), sorted(menu_item_ids), recipe_version], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class IndentCache:
+    """LRU + TTL memo of indent results, optionally backed by a shared SQLite file."""
+
+    def __init__(self, maxsize=INDENT_CACHE_SIZE, ttl=INDENT_CACHE_TTL, sqlite_path=INDENT_CACHE_SQLITE,
+                 purge_every=INDENT_CACHE_PURGE_EVERY):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.sqlite_path = sqlite_path
+        self.purge_every = purge_every
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = self.shared_hits = self.misses = self.evictions = 0
+        if sqlite_path:
+            with self._connect() as conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS indent_cache (key TEXT PRIMARY KEY, value TEXT, expires_at REAL)")
+                conn.execute("CREATE INDEX IF NOT EXISTS ix_indent_cache_expires_at ON indent_cache (expires_at)")
+
+    @contextmanager
+    def _connect(self):
+        # sqlite3's own context manager only commits; closing() releases the file handle too
+        with closing(sqlite3.connect(self.sqlite_path, timeout=5)) as conn, conn:
+            yield conn
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+
+        if self.sqlite_path:
+            with self._connect() as conn:
+                row = conn.execute("SELECT value, expires_at FROM indent_cache WHERE key = ?", (key,)).fetchone()
+            if row is not None and row[1] > now:
+                value = json.loads(row[0])
+                with self._lock:
+                    self.shared_hits += 1
+                    self._remember(key, row[1], value)
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, value):
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._remember(key, expires_at, value)
+            self._writes += 1
+            purge = self.purge_every > 0 and self._writes % self.purge_every == 0
+        if self.sqlite_path:
+            with self._connect() as conn:
+                if purge:
+                    conn.execute("DELETE FROM indent_cache WHERE expires_at <= ?", (time.time(),))
+                conn.execute(
+                    "INSERT OR REPLACE INTO indent_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), expires_at),
+                )
+
+    def _remember(self, key, expires_at, value):
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        if self.sqlite_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM indent_cache")
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.shared_hits + self.misses
+            return {
+                "enabled": INDENT_CACHE_ENABLED,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "shared_store": self.sqlite_path,
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": (self.hits + self.shared_hits) / lookups if lookups else 0.0,
+            }
+
+
+indent_cache = IndentCache()
+
+
+def memoized_indent(capacity: float, menu_item_ids: list[int], recipe_version, compute):
+    """compute() on a miss; cached indents are shared, so callers must not mutate them."""
+    if not INDENT_CACHE_ENABLED:
+        return compute()
+    key = indent_key(capacity, menu_item_ids, recipe_version)
+    result = indent_cache.get(key)
+    if result is None:
+        result = compute()
+        indent_cache.put(key, result)
+    return result
+
+
+def invalidate_indent_cache():
+    indent_cache.clear()
@@ -0,0 +1,60 @@
+import base64
+import binascii
+import json
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+
+def encode_cursor(last_id: int) -> str:
+    payload = json.dumps({"after": last_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        after = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))["after"]
+    except (binascii.Error, ValueError, UnicodeError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(after, int):
+        raise ValueError("Invalid cursor")
+    return after
+
+
+def parse_fields(fields, allowed):
+    """'name,date' -> ['id', 'name', 'date']; id is always returned so rows stay addressable."""
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = sorted(set(requested) - set(allowed))
+    if unknown:
+        raise ValueError(f"Unknown fields: {unknown}. Allowed: {list(allowed)}")
+    return ["id"] + [f for f in dict.fromkeys(requested) if f != "id"]
+
+
+def keyset_page(db: Session, model, allowed_fields, limit: int, cursor=None, skip: int = 0, fields=None):
+    """
+    One page of `model` ordered by primary key.
+
+    With a cursor the page is `WHERE id > :after ORDER BY id LIMIT :limit`, an
+    index range scan whose cost does not grow with the page number; without
+    one, the legacy skip/offset applies. `fields` projects columns in SQL and
+    returns plain dicts instead of ORM objects. The second element of the
+    result is the cursor for the next page, or None on the last page.
+    """
+    columns = parse_fields(fields, allowed_fields) if fields else None
+    stmt = select(*[getattr(model, c) for c in columns]) if columns else select(model)
+    if cursor:
+        stmt = stmt.where(model.id > decode_cursor(cursor))
+    elif skip:
+        stmt = stmt.offset(skip)
+    stmt = stmt.order_by(model.id).limit(limit)
+
+    if columns:
+        rows = [dict(zip(columns, row)) for row in db.execute(stmt)]
+        last_id = rows[-1]["id"] if rows else None
+    else:
+        rows = db.execute(stmt).scalars().all()
+        last_id = rows[-1].id if rows else None
+
+    next_cursor = encode_cursor(last_id) if rows and len(rows) == limit else None
+    return rows, next_cursor
@@ -0,0 +1,122 @@
+import math
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from backend.models import Event, Ingredient, ProductionPlan, Recipe
+from backend.services.calculation import CHILD_CONSUMPTION, FEMALE_CONSUMPTION, MALE_CONSUMPTION
+from backend.services.recipe_matrix import get_unit_table
+
+def items_per_event(start: datetime, end: datetime):
+    """Subquery: (event_id, n_items) for every event dated in [start, end] with a plan."""
+    return (
+        select(ProductionPlan.event_id.label("event_id"), func.count(ProductionPlan.id).label("n_items"))
+        .join(Event, Event.id == ProductionPlan.event_id)
+        .where(Event.date >= start, Event.date <= end)
+        .group_by(ProductionPlan.event_id)
+        .subquery()
+    )
+
+
+def requirements_statement(start: datetime, end: datetime, per_event=None):
+    """
+    The procurement roll-up: recipe quantity x each event's portion per item,
+    summed per (ingredient, recipe unit) over the events of `per_event`
+    (items_per_event(start, end) by default). tools/check_query_plans.py
+    checks this exact statement.
+    """
+    per_event = per_event if per_event is not None else items_per_event(start, end)
+    capacity = (
+        func.coalesce(Event.pax_male, 0) * MALE_CONSUMPTION
+        + func.coalesce(Event.pax_female, 0) * FEMALE_CONSUMPTION
+        + func.coalesce(Event.pax_child, 0) * CHILD_CONSUMPTION
+    )
+    return (
+        select(
+            Recipe.ingredient_id.label("ingredient_id"),
+            Recipe.unit.label("recipe_unit"),
+            func.sum(Recipe.quantity * capacity / per_event.c.n_items).label("required"),
+        )
+        .select_from(Event)
+        .join(per_event, per_event.c.event_id == Event.id)
+        .join(ProductionPlan, ProductionPlan.event_id == Event.id)
+        .join(Recipe, Recipe.menu_item_id == ProductionPlan.menu_item_id)
+        .where(Recipe.ingredient_id.isnot(None))
+        .group_by(Recipe.ingredient_id, Recipe.unit)
+    )
+
+
+def plan_procurement(db: Session, start: datetime, end: datetime, include_covered: bool = False):
+    """
+    Aggregate indents for every event dated in [start, end], net them against
+    Ingredient.stock_qty and round the shortfall up to whole packages.
+
+    Menus come from ProductionPlan rows; each event's capacity is split evenly
+    across its planned items, exactly like calculate_indent. The whole
+    aggregation is a single grouped statement.
+    """
+    per_event = items_per_event(start, end)
+    required = requirements_statement(start, end, per_event).subquery()
+    rows = (
+        db.query(
+            required.c.ingredient_id,
+            Ingredient.name,
+            Ingredient.category,
+            Ingredient.unit,
+            required.c.recipe_unit,
+            Ingredient.package_size,
+            func.coalesce(Ingredient.stock_qty, 0.0),
+            required.c.required,
+        )
+        .outerjoin(Ingredient, Ingredient.id == required.c.ingredient_id)
+        .order_by(required.c.ingredient_id)
+        .all()
+    )
+    n_events = db.query(func.count()).select_from(per_event).scalar()
+
+    # Requirements arrive per recipe unit; convert into the stock unit through the
+    # canonical factors (no string parsing here) and merge per (ingredient, unit).
+    # Lines in a unit the stock cannot be converted into stay separate, with no
+    # stock netted against them and stock_comparable=False.
+    units = get_unit_table(db)
+    merged = {}
+    for ing_id, name, category, stock_unit, recipe_unit, package_size, stock_qty, required_qty in rows:
+        canonical, factor = units.convert(ing_id, recipe_unit)
+        if units.comparable(ing_id, canonical):
+            info = units.stock(ing_id)
+            factor /= info.stock_factor
+            key, line = (ing_id, info.stock_unit), [name, category, stock_unit, package_size, stock_qty, 0.0, info]
+        else:
+            key, line = (ing_id, canonical), [name, category, canonical, None, 0.0, 0.0, None]
+        line = merged.setdefault(key, line)
+        line[5] += (required_qty or 0.0) * factor
+
+    items = []
+    for (ing_id, _), (name, category, unit, package_size, stock_qty, required_qty, info) in sorted(merged.items()):
+        shortfall = max(0.0, required_qty - stock_qty)
+        if shortfall <= 0 and not include_covered:
+            continue
+        pack_qty = info.pack_size / info.stock_factor if info is not None and info.pack_size else None
+        if shortfall > 0 and pack_qty:
+            packs = math.ceil(shortfall / pack_qty - 1e-9)
+            order_qty = packs * pack_qty
+        else:
+            packs = None
+            order_qty = shortfall
+        items.append({
+            "id": ing_id,
+            "name": name or "Unknown",
+            "category": category or "Misc",
+            "unit": unit,
+            "required_qty": required_qty,
+            "stock_qty": stock_qty,
+            "stock_comparable": info is not None,
+            "shortfall_qty": shortfall,
+            "package_size": package_size,
+            "pack_qty": pack_qty,
+            "packs": packs,
+            "order_qty": order_qty,
+        })
+
+    return {"start": start, "end": end, "events": n_events, "items": items}
@@ -0,0 +1,63 @@
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session, aliased
+
+from backend.models import Event, MenuItem, ProductionPlan
+from backend.services.calculation import (
+    CHILD_CONSUMPTION, FEMALE_CONSUMPTION, JIT_SPLIT, MALE_CONSUMPTION, calculate_stomach_ceiling,
+)
+
+
+def portion_per_item(event_id_column):
+    """
+    SQL expression for an event's capacity / number of planned items, correlated
+    on `event_id_column` - the same portion_per_item calculate_indent uses.
+    """
+    peers = aliased(ProductionPlan)
+    capacity = (
+        select(Event.pax_male * MALE_CONSUMPTION + Event.pax_female * FEMALE_CONSUMPTION + Event.pax_child * CHILD_CONSUMPTION)
+        .where(Event.id == event_id_column)
+        .scalar_subquery()
+    )
+    n_items = select(func.count(peers.id)).where(peers.event_id == event_id_column).scalar_subquery()
+    return capacity / n_items
+
+
+def materialize_production_plans(db: Session, event_ids=None):
+    """
+    Fill total_qty_needed and the 60/30/10 JIT batches of every ProductionPlan
+    row of `event_ids` (all events when None) with one set-based UPDATE.
+    Each planned item gets an equal share of the event's stomach ceiling.
+    Does not commit.
+    """
+    total = portion_per_item(ProductionPlan.event_id)
+    stmt = update(ProductionPlan).values(
+        total_qty_needed=total,
+        batch_1_qty=total * JIT_SPLIT[0],
+        batch_2_qty=total * JIT_SPLIT[1],
+        batch_3_qty=total * JIT_SPLIT[2],
+    )
+    if event_ids is not None:
+        stmt = stmt.where(ProductionPlan.event_id.in_(event_ids))
+    return db.execute(stmt.execution_options(synchronize_session=False)).rowcount
+
+
+def get_production_plan(db: Session, event_id: int):
+    event = db.get(Event, event_id)
+    if not event:
+        raise ValueError("Event not found")
+    stmt = (
+        select(
+            ProductionPlan.menu_item_id, MenuItem.name, ProductionPlan.total_qty_needed,
+            ProductionPlan.batch_1_qty, ProductionPlan.batch_2_qty, ProductionPlan.batch_3_qty,
+        )
+        .join(MenuItem, MenuItem.id == ProductionPlan.menu_item_id, isouter=True)
+        .where(ProductionPlan.event_id == event_id)
+        .order_by(ProductionPlan.menu_item_id)
+    )
+    items = [
+        {"menu_item_id": item_id, "name": name, "total_qty_needed": total,
+         "batch_1_qty": b1, "batch_2_qty": b2, "batch_3_qty": b3}
+        for item_id, name, total, b1, b2, b3 in db.execute(stmt)
+    ]
+    return {"event_id": event_id, "capacity": calculate_stomach_ceiling(event), "items": items}
+
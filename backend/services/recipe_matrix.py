@@ -0,0 +1,175 @@
+import os
+import threading
+
+from sqlalchemy.orm import Session
+
+from backend.models import Ingredient, Recipe
+from backend.services.revisions import RECIPES, catalogue_revision
+from backend.services.units import UnitTable
+
+# Set RECIPE_MATRIX_CACHE=0 to fall back to the per-request SQL BOM explosion
+# (useful on short-lived serverless instances where the full load never pays off).
+RECIPE_MATRIX_ENABLED = os.getenv("RECIPE_MATRIX_CACHE", "1").lower() not in ("0", "false", "no")
+
+# numpy is imported inside the functions that use it (here, density.py, simulation.py)
+# so the serverless cold start only pays for it on the first indent request.
+
+
+class RecipeMatrix:
+    """
+    Compiled menu_item x ingredient recipe matrix in CSR form.
+
+    Row r holds the per-serving ingredient quantities of menu item `menu_ids[r]`:
+    columns `indices[indptr[r]:indptr[r + 1]]` with values `data[...]`, already
+    converted into each ingredient's canonical unit. A column is one
+    (ingredient, unit) pair, so an ingredient with recipe lines in a unit that
+    does not convert gets a second column. Ingredient metadata lives in side
+    tables aligned with the column index.
+    """
+
+    def __init__(self, version, menu_ids, indptr, indices, data, ingredient_ids, names, categories, units, unit_table):
+        self.version = version
+        self.menu_ids = menu_ids
+        self.row_of = {menu_id: row for row, menu_id in enumerate(menu_ids)}
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.ingredient_ids = ingredient_ids
+        self.names = names
+        self.categories = categories
+        self.units = units
+        self.unit_table = unit_table
+
+    @classmethod
+    def build(cls, db: Session, version, menu_item_ids=None):
+        import numpy as np
+        # menu_item_ids restricts the build to a subset (an ad-hoc matrix for one batch)
+        query = db.query(Recipe.menu_item_id, Recipe.ingredient_id, Recipe.quantity, Recipe.unit).filter(
+            Recipe.ingredient_id.isnot(None), Recipe.menu_item_id.isnot(None)
+        )
+        if menu_item_ids is not None:
+            query = query.filter(Recipe.menu_item_id.in_(list(menu_item_ids)))
+        rows = query.order_by(Recipe.menu_item_id, Recipe.id).all()
+        ingredient_rows = db.query(
+            Ingredient.id, Ingredient.name, Ingredient.category, Ingredient.unit, Ingredient.package_size
+        ).all()
+        ingredients = {ing_id: (name, category) for ing_id, name, category, _, _ in ingredient_rows}
+        unit_table = UnitTable(version, [(ing_id, unit, size) for ing_id, _, _, unit, size in ingredient_rows])
+
+        col_of = {}
+        menu_ids, indptr, indices, data = [], [0], [], []
+        units = []
+        for menu_id, ing_id, qty, unit in rows:
+            if not menu_ids or menu_ids[-1] != menu_id:
+                if menu_ids:
+                    indptr.append(len(indices))
+                menu_ids.append(menu_id)
+            canonical, factor = unit_table.convert(ing_id, unit)
+            col = col_of.get((ing_id, canonical))
+            if col is None:
+                col = col_of[(ing_id, canonical)] = len(col_of)
+                units.append(canonical)
+            indices.append(col)
+            data.append((qty or 0.0) * factor)
+        if menu_ids:
+            indptr.append(len(indices))
+
+        ingredient_ids = [ing_id for ing_id, _ in col_of]
+        names = [ingredients[i][0] if i in ingredients else "Unknown" for i in ingredient_ids]
+        categories = [ingredients[i][1] if i in ingredients else "Misc" for i in ingredient_ids]
+        return cls(
+            version,
+            menu_ids,
+            np.asarray(indptr, dtype=np.int64),
+            np.asarray(indices, dtype=np.int64),
+            np.asarray(data, dtype=np.float64),
+            ingredient_ids,
+            names,
+            categories,
+            units,
+            unit_table,
+        )
+
+    def ingredient_vector(self, servings: dict[int, float]):
+        """Sparse vector-matrix product: servings (over menu items) x recipe matrix."""
+        import numpy as np
+        n_cols = len(self.ingredient_ids)
+        totals = np.zeros(n_cols, dtype=np.float64)
+        touched = np.zeros(n_cols, dtype=bool)
+        rows = [(self.row_of[m], s) for m, s in servings.items() if m in self.row_of]
+        if not rows:
+            return totals, touched
+
+        row_idx = np.fromiter((r for r, _ in rows), dtype=np.int64, count=len(rows))
+        weights = np.fromiter((s for _, s in rows), dtype=np.float64, count=len(rows))
+        starts, ends = self.indptr[row_idx], self.indptr[row_idx + 1]
+        lengths = ends - starts
+        # Flat positions of every non-zero in the selected rows
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        cols = self.indices[offsets]
+        totals += np.bincount(cols, weights=self.data[offsets] * np.repeat(weights, lengths), minlength=n_cols)
+        touched[cols] = True
+        return totals, touched
+
+    def explode(self, servings: dict[int, float]):
+        import numpy as np
+        totals, touched = self.ingredient_vector(servings)
+        cols = np.flatnonzero(touched)
+        cols = sorted(cols, key=lambda c: (self.ingredient_ids[c], self.units[c]))
+        return [
+            {
+                "id": self.ingredient_ids[c],
+                "name": self.names[c],
+                "quantity": float(totals[c]),
+                "unit": self.units[c],
+                "category": self.categories[c],
+            }
+            for c in cols
+        ]
+
+
+_lock = threading.Lock()
+_matrix = None
+_units = None
+
+
+def catalogue_version(db: Session) -> int:
+    # Trigger-maintained counter over recipes and the recipe-relevant ingredient
+    # columns (see CatalogueVersion): one primary-key lookup per request, and
+    # every process sees a write made by any other.
+    return catalogue_revision(db, RECIPES)
+
+
+def get_recipe_matrix(db: Session) -> RecipeMatrix:
+    global _matrix
+    version = catalogue_version(db)
+    matrix = _matrix
+    if matrix is not None and matrix.version == version:
+        return matrix
+    with _lock:
+        if _matrix is None or _matrix.version != version:
+            _matrix = RecipeMatrix.build(db, version)
+        return _matrix
+
+
+def get_unit_table(db: Session) -> UnitTable:
+    """Canonical-unit factors for the current catalogue, shared with the cached matrix when there is one."""
+    global _units
+    version = catalogue_version(db)
+    matrix = _matrix
+    if matrix is not None and matrix.version == version:
+        return matrix.unit_table
+    units = _units
+    if units is not None and units.version == version:
+        return units
+    with _lock:
+        if _units is None or _units.version != version:
+            _units = UnitTable.build(db, version)
+        return _units
+
+
+def invalidate_recipe_matrix():
+    global _matrix, _units
+    with _lock:
+        _matrix = None
+        _units = None
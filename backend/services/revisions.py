@@ -0,0 +1,16 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.models import CatalogueVersion
+
+MENU = "menu"
+RECIPES = "recipes"
+
+
+def catalogue_revision(db: Session, name: str) -> int:
+    """
+    Current revision of a catalogue ("menu" or "recipes"): a counter the database
+    bumps on every insert, delete or relevant update of its source tables (see
+    CatalogueVersion), so checking it is one primary-key lookup.
+    """
+    return db.execute(select(CatalogueVersion.version).where(CatalogueVersion.name == name)).scalar_one()
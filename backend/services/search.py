@@ -0,0 +1,128 @@
+import bisect
+import re
+import threading
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.models import MenuItem
+from backend.services.catalogue import MENU_FIELDS
+from backend.services.revisions import MENU, catalogue_revision
+
+# Relative weight of a match in each searchable field
+FIELD_WEIGHTS = {"name": 3.0, "sub_category": 2.0, "category": 1.5, "diet_type": 1.0}
+FUZZY_MIN_SIMILARITY = 0.4  # trigram Jaccard similarity needed for a typo match
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    return WORD_RE.findall((text or "").lower())
+
+
+def trigrams(word):
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class MenuSearchIndex:
+    """
+    In-memory prefix + trigram index over menu item name/category/sub_category/diet_type.
+
+    Every distinct word is stored once. Prefix lookups bisect a sorted word list;
+    typo-tolerant lookups go through a trigram -> word-ids inverted index. Each
+    word remembers the (item, field) postings it came from.
+    """
+
+    def __init__(self, version, items):
+        self.version = version
+        self.items = items
+        self.names = [(item["name"] or "").lower() for item in items]
+        word_ids = {}
+        self.postings = []  # word id -> [(item index, field weight)]
+        for doc, item in enumerate(items):
+            for field, weight in FIELD_WEIGHTS.items():
+                for word in set(tokenize(item[field])):
+                    if word not in word_ids:
+                        word_ids[word] = len(self.postings)
+                        self.postings.append([])
+                    self.postings[word_ids[word]].append((doc, weight))
+        self.words = list(word_ids)
+        self.sorted_words = sorted(word_ids)
+        self.sorted_ids = [word_ids[w] for w in self.sorted_words]
+        self.word_trigrams = [trigrams(w) for w in self.words]
+        self.trigram_index = {}
+        for word_id, grams in enumerate(self.word_trigrams):
+            for gram in grams:
+                self.trigram_index.setdefault(gram, []).append(word_id)
+
+    def _prefix_words(self, token):
+        start = bisect.bisect_left(self.sorted_words, token)
+        end = bisect.bisect_left(self.sorted_words, token + "\uffff")
+        for pos in range(start, end):
+            # Exact words score a little higher than longer completions
+            yield self.sorted_ids[pos], 1.0 if self.sorted_words[pos] == token else 0.8
+
+    def _fuzzy_words(self, token):
+        grams = trigrams(token)
+        shared = {}
+        for gram in grams:
+            for word_id in self.trigram_index.get(gram, ()):
+                shared[word_id] = shared.get(word_id, 0) + 1
+        for word_id, common in shared.items():
+            similarity = common / (len(grams) + len(self.word_trigrams[word_id]) - common)
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                yield word_id, 0.6 * similarity
+
+    def _token_scores(self, token):
+        matches = dict(self._prefix_words(token))
+        if len(token) >= 3:
+            for word_id, quality in self._fuzzy_words(token):
+                matches[word_id] = max(quality, matches.get(word_id, 0.0))
+        scores = {}
+        for word_id, quality in matches.items():
+            for doc, weight in self.postings[word_id]:
+                score = quality * weight
+                if score > scores.get(doc, 0.0):
+                    scores[doc] = score
+        return scores
+
+    def search(self, query, limit=20, offset=0):
+        """(total matches, ranked page of (score, item)); every query token must match."""
+        tokens = tokenize(query)
+        if not tokens:
+            return 0, []
+        totals = None
+        for token in dict.fromkeys(tokens):
+            scores = self._token_scores(token)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {doc: totals[doc] + s for doc, s in scores.items() if doc in totals}
+            if not totals:
+                return 0, []
+
+        phrase = " ".join(tokens)
+        for doc in totals:
+            if self.names[doc].startswith(phrase):
+                totals[doc] += 2.0  # whole query is a prefix of the item name
+        ranked = sorted(totals.items(), key=lambda kv: (-kv[1], self.names[kv[0]], kv[0]))
+        page = ranked[offset:offset + limit]
+        return len(ranked), [(round(score, 3), self.items[doc]) for doc, score in page]
+
+
+_lock = threading.Lock()
+_index = None
+
+
+def get_menu_search_index(db: Session) -> MenuSearchIndex:
+    global _index
+    version = catalogue_revision(db, MENU)  # bumped by any menu_items write, renames included
+    index = _index
+    if index is not None and index.version == version:
+        return index
+    with _lock:
+        if _index is None or _index.version != version:
+            columns = [getattr(MenuItem, field) for field in MENU_FIELDS]
+            rows = db.execute(select(*columns).order_by(MenuItem.id)).all()
+            _index = MenuSearchIndex(version, [dict(zip(MENU_FIELDS, row)) for row in rows])
+        return _index
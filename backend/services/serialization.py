@@ -0,0 +1,29 @@
+import os
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:  # optional: orjson is only used when installed
+    import orjson
+except ImportError:
+    orjson = None
+
+# Opt-in: list endpoints skip per-row ORM + Pydantic conversion and serialize Core row tuples directly
+FAST_JSON_ENABLED = os.getenv("FAST_JSON", "0").lower() in ("1", "true", "yes")
+
+
+def fast_json_enabled():
+    return FAST_JSON_ENABLED
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson-rendered response for plain dict rows (datetimes are encoded natively, ISO 8601 like Pydantic)."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+def json_response(rows, headers=None):
+    if orjson is not None:
+        return FastJSONResponse(rows, headers=headers)
+    return JSONResponse(jsonable_encoder(rows), headers=headers)
@@ -0,0 +1,68 @@
+import itertools
+from collections import Counter
+
+from sqlalchemy.orm import Session
+
+from backend.services.calculation import CHILD_CONSUMPTION, FEMALE_CONSUMPTION, MALE_CONSUMPTION
+from backend.services.recipe_matrix import RECIPE_MATRIX_ENABLED, RecipeMatrix, get_recipe_matrix
+
+CONSUMPTION = (MALE_CONSUMPTION, FEMALE_CONSUMPTION, CHILD_CONSUMPTION)
+MAX_SCENARIOS = 10000
+
+
+def scenario_grid(pax_male: list[int], pax_female: list[int], pax_child: list[int]):
+    """Cartesian product of headcount options -> (S, 3) array of (male, female, child)."""
+    import numpy as np
+    size = len(pax_male) * len(pax_female) * len(pax_child)
+    if size > MAX_SCENARIOS:
+        raise ValueError(f"At most {MAX_SCENARIOS} scenarios per call, got {size}")
+    return np.array(list(itertools.product(pax_male, pax_female, pax_child)), dtype=np.float64).reshape(-1, 3)
+
+
+def simulate_indent(db: Session, menu_item_ids: list[int], headcounts, percentiles=(5, 50, 95), include_scenarios=True):
+    """
+    Indents for one menu under many headcount scenarios at once.
+
+    capacity = headcounts @ CONSUMPTION gives every scenario's stomach ceiling,
+    and the menu's per-portion BOM b comes from one pass over the recipe
+    matrix. The indents are then the outer product (capacity / n_items) x b:
+    row s equals calculate_indent's quantities for scenario s.
+    """
+    import numpy as np
+    headcounts = np.asarray(headcounts, dtype=np.float64).reshape(-1, 3)
+    if len(headcounts) > MAX_SCENARIOS:
+        raise ValueError(f"At most {MAX_SCENARIOS} scenarios per call, got {len(headcounts)}")
+
+    capacity = headcounts @ CONSUMPTION
+    num_items = len(menu_item_ids)
+    if RECIPE_MATRIX_ENABLED:
+        matrix = get_recipe_matrix(db)
+    else:
+        matrix = RecipeMatrix.build(db, None, menu_item_ids=set(menu_item_ids))
+    per_portion, touched = matrix.ingredient_vector(dict(Counter(menu_item_ids)))
+    cols = np.flatnonzero(touched)
+    cols = cols[np.argsort([matrix.ingredient_ids[c] for c in cols], kind="stable")]
+    portion = capacity / num_items if num_items else np.zeros_like(capacity)
+    quantities = np.outer(portion, per_portion[cols])  # (scenarios, ingredients)
+
+    result = {
+        "total_items": num_items,
+        "scenario_count": len(headcounts),
+        "ingredients": [
+            {"id": matrix.ingredient_ids[c], "name": matrix.names[c], "unit": matrix.units[c], "category": matrix.categories[c]}
+            for c in cols
+        ],
+    }
+    if include_scenarios:
+        result["scenarios"] = [
+            {"pax_male": int(m), "pax_female": int(f), "pax_child": int(ch), "capacity": float(cap), "quantities": row}
+            for (m, f, ch), cap, row in zip(headcounts, capacity, quantities.tolist())
+        ]
+    if percentiles and len(headcounts):
+        points = np.percentile(quantities, percentiles, axis=0) if len(cols) else np.zeros((len(percentiles), 0))
+        result["summary"] = {
+            "percentiles": list(percentiles),
+            "capacity": np.percentile(capacity, percentiles).tolist(),
+            "quantities": points.T.tolist(),  # per ingredient, one value per percentile
+        }
+    return result
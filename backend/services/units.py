@@ -0,0 +1,109 @@
+import re
+from typing import NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.models import Ingredient, Recipe
+
+# "1x500g", "1kg", "1x15Lt", "1.7kg" -> (count, amount, unit)
+PACKAGE_RE = re.compile(r"^\s*(?:(\d+)\s*x\s*)?(\d+(?:\.\d+)?)\s*([a-z]+)\s*$", re.IGNORECASE)
+# Canonical units are KG for mass and LTR for volume; countable units (PKT, BTL, NO...) stay as they are
+MASS_UNITS = {"mg": 0.000001, "g": 0.001, "gm": 0.001, "gms": 0.001, "kg": 1.0, "kgs": 1.0}
+VOLUME_UNITS = {"ml": 0.001, "l": 1.0, "lt": 1.0, "ltr": 1.0, "ltrs": 1.0, "let": 1.0}
+
+
+def base_quantity(unit):
+    """'g' -> ('KG', 0.001), 'Ltr' -> ('LTR', 1.0); None for countable units."""
+    unit = (unit or "").strip().lower()
+    if unit in MASS_UNITS:
+        return "KG", MASS_UNITS[unit]
+    if unit in VOLUME_UNITS:
+        return "LTR", VOLUME_UNITS[unit]
+    return None
+
+
+def parse_quantity(text):
+    """'1x500g' -> ('KG', 0.5); None unless it is a mass or volume amount."""
+    match = PACKAGE_RE.match(text or "")
+    if not match:
+        return None
+    count, amount, unit = match.groups()
+    base = base_quantity(unit)
+    if base is None:
+        return None
+    return base[0], int(count or 1) * float(amount) * base[1]
+
+
+class IngredientUnits(NamedTuple):
+    canonical: str  # unit every quantity of this ingredient is aggregated in
+    stock_unit: str
+    stock_factor: float  # canonical units per stock unit
+    pack_size: Optional[float]  # canonical units per purchasable pack, None if unknown
+
+
+def ingredient_units(stock_unit, package_size) -> IngredientUnits:
+    stock_unit = (stock_unit or "").strip().upper()
+    base = base_quantity(stock_unit)
+    pack = parse_quantity(package_size)
+    if base is not None:
+        canonical, factor = base
+        return IngredientUnits(canonical, stock_unit, factor, pack[1] if pack and pack[0] == canonical else None)
+    if pack is not None:
+        # A countable unit of known content: 1 BTL of "1x1Lt" is 1 LTR
+        return IngredientUnits(pack[0], stock_unit, pack[1], pack[1])
+    # Countable without a usable size: ordered one pack (= one stock unit) at a time
+    return IngredientUnits(stock_unit, stock_unit, 1.0, 1.0)
+
+
+class UnitTable:
+    """
+    Conversion factors into each ingredient's canonical unit, resolved once
+    when the table is built so hot paths only do dict lookups.
+
+    `convert(ingredient_id, unit)` returns (canonical unit, factor). A recipe
+    unit that cannot be related to the ingredient's stock unit (e.g. LTR for
+    a KG item) converts into its own base unit instead, so callers must
+    aggregate by (ingredient, canonical unit) and only net stock against
+    lines where `comparable` holds.
+    """
+
+    def __init__(self, version, ingredients, recipe_units=()):
+        self.version = version
+        self.ingredients = {ing_id: ingredient_units(unit, package_size) for ing_id, unit, package_size in ingredients}
+        self.factors = {}
+        for ing_id, unit in recipe_units:
+            self.factors[(ing_id, unit)] = self._resolve(ing_id, unit)
+
+    @classmethod
+    def build(cls, db: Session, version):
+        ingredients = db.execute(select(Ingredient.id, Ingredient.unit, Ingredient.package_size)).all()
+        recipe_units = db.execute(select(Recipe.ingredient_id, Recipe.unit).where(Recipe.ingredient_id.isnot(None)).distinct()).all()
+        return cls(version, ingredients, recipe_units)
+
+    def _resolve(self, ing_id, unit):
+        info = self.ingredients.get(ing_id)
+        base = base_quantity(unit)
+        if info is not None:
+            if base is not None and base[0] == info.canonical:
+                return info.canonical, base[1]
+            if base is None and (unit or "").strip().upper() == info.stock_unit:
+                return info.canonical, info.stock_factor
+        # Unrelated to the stock unit: kept apart in its own base unit
+        return base if base is not None else ((unit or "").strip().upper(), 1.0)
+
+    def convert(self, ing_id, unit):
+        key = (ing_id, unit)
+        factor = self.factors.get(key)
+        if factor is None:
+            factor = self.factors[key] = self._resolve(ing_id, unit)
+        return factor
+
+    def stock(self, ing_id) -> Optional[IngredientUnits]:
+        return self.ingredients.get(ing_id)
+
+    def comparable(self, ing_id, canonical) -> bool:
+        """Whether quantities in `canonical` can be netted against the ingredient's stock."""
+        info = self.ingredients.get(ing_id)
+        return info is not None and info.canonical == canonical
+
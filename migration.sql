@@ -1,4 +1,6 @@
 -- Migration Script for Intelli-Cater
+-- Hand-run equivalent of `alembic upgrade head` for the Supabase SQL editor; backend/migrations is
+-- the source of truth. Prefer Alembic on live databases: it builds the indexes CONCURRENTLY.
 
 CREATE TABLE IF NOT EXISTS ingredients (
     id INTEGER PRIMARY KEY,
@@ -47,3 +49,44 @@ CREATE TABLE IF NOT EXISTS production_plan (
     batch_2_qty FLOAT,
     batch_3_qty FLOAT
 );
+
+CREATE INDEX IF NOT EXISTS ix_production_plan_event_id ON production_plan (event_id);
+CREATE INDEX IF NOT EXISTS ix_production_plan_menu_item_event ON production_plan (menu_item_id, event_id);
+
+-- Keep the first of any duplicate recipe lines before enforcing one line per (item, ingredient)
+DELETE FROM recipes
+WHERE ingredient_id IS NOT NULL
+  AND id NOT IN (SELECT MIN(id) FROM recipes WHERE ingredient_id IS NOT NULL GROUP BY menu_item_id, ingredient_id);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_recipes_menu_item_ingredient ON recipes (menu_item_id, ingredient_id);
+CREATE INDEX IF NOT EXISTS ix_recipes_ingredient_id ON recipes (ingredient_id);
+CREATE INDEX IF NOT EXISTS ix_events_date ON events (date);
+
+CREATE TABLE IF NOT EXISTS recipe_hashes (
+    menu_item_id INTEGER PRIMARY KEY REFERENCES menu_items(id),
+    content_hash TEXT
+);
+
+CREATE TABLE IF NOT EXISTS event_indent (
+    event_id INTEGER REFERENCES events(id),
+    ingredient_id INTEGER REFERENCES ingredients(id),
+    unit TEXT,
+    base_qty FLOAT,
+    line_count INTEGER,
+    quantity FLOAT,
+    PRIMARY KEY (event_id, ingredient_id, unit)
+);
+
+-- Catalogue revision counters, bumped by triggers on every write (see backend/models.py CatalogueVersion)
+CREATE TABLE IF NOT EXISTS catalogue_versions (
+    name TEXT PRIMARY KEY,
+    version BIGINT
+);
+INSERT INTO catalogue_versions (name, version) VALUES ('menu', (extract(epoch from clock_timestamp()) * 1000)::bigint) ON CONFLICT DO NOTHING;
+INSERT INTO catalogue_versions (name, version) VALUES ('recipes', (extract(epoch from clock_timestamp()) * 1000)::bigint) ON CONFLICT DO NOTHING;
+CREATE OR REPLACE FUNCTION bump_catalogue_version() RETURNS trigger AS $$ BEGIN UPDATE catalogue_versions SET version = version + 1 WHERE name = TG_ARGV[0]; RETURN NULL; END; $$ LANGUAGE plpgsql;
+DROP TRIGGER IF EXISTS trg_menu_items_version ON menu_items;
+CREATE TRIGGER trg_menu_items_version AFTER INSERT OR DELETE OR UPDATE ON menu_items FOR EACH STATEMENT EXECUTE FUNCTION bump_catalogue_version('menu');
+DROP TRIGGER IF EXISTS trg_recipes_version ON recipes;
+CREATE TRIGGER trg_recipes_version AFTER INSERT OR DELETE OR UPDATE ON recipes FOR EACH STATEMENT EXECUTE FUNCTION bump_catalogue_version('recipes');
+DROP TRIGGER IF EXISTS trg_ingredients_version ON ingredients;
+CREATE TRIGGER trg_ingredients_version AFTER INSERT OR DELETE OR UPDATE OF name, category, unit, package_size ON ingredients FOR EACH STATEMENT EXECUTE FUNCTION bump_catalogue_version('recipes');
@@ -228,6 +228,22 @@ INSERT INTO ingredients (id, name, category, regional_name, brand, package_size,
 (232, 'Paneer', 'Dairy Products', 'Paneer', 'Milk Mist', NULL, 'KG', 0.0)
 ON CONFLICT (id) DO NOTHING;
 
+INSERT INTO ingredients (id, name, category, regional_name, brand, package_size, unit, stock_qty) VALUES
+(1581921, 'Chicken Boneless', 'Fresh', NULL, NULL, NULL, 'KG', 0.0),
+(1691919, 'Mutton', 'Fresh', NULL, NULL, NULL, 'KG', 0.0),
+(1658053, 'Fish', 'Fresh', NULL, NULL, NULL, 'KG', 0.0),
+(1457666, 'Prawns', 'Fresh', NULL, NULL, NULL, 'KG', 0.0),
+(1039230, 'Meat (Chicken/Mutton)', 'Fresh', NULL, NULL, NULL, 'KG', 0.0),
+(1211973, 'Onion', 'Fresh', NULL, NULL, NULL, 'KG', 0.0),
+(1385336, 'Chicken Curry Cut', 'Fresh', NULL, NULL, NULL, 'KG', 0.0),
+(1846301, 'Tomato', 'Fresh', NULL, NULL, NULL, 'KG', 0.0),
+(1008409, 'Main Ingredient (Generic)', 'Fresh', NULL, NULL, NULL, 'KG', 0.0)
+ON CONFLICT (id) DO NOTHING;
+
+INSERT INTO ingredients (id, name, category, regional_name, brand, package_size, unit, stock_qty) VALUES
+(1083105, 'Fruit', 'Fresh', NULL, NULL, NULL, 'KG', 0.0)
+ON CONFLICT (id) DO NOTHING;
+
 INSERT INTO menu_items (id, name, category, sub_category, diet_type) VALUES
 (1, 'Achari Murg Tikka', 'Non-Veg Appetizers', 'Chicken Snacks', 'Non-Veg'),
 (2, 'Amritsari Chicken', 'Non-Veg Appetizers', 'Chicken Snacks', 'Non-Veg'),
@@ -430,7 +446,10 @@ INSERT INTO menu_items (id, name, category, sub_category, diet_type) VALUES
 (199, 'Mulakada Sambar', 'Accompaniments', 'Standard Items', 'Veg'),
 (200, 'Mysore Rasam', 'Accompaniments', 'Standard Items', 'Veg'),
 (201, 'Nethi Talimpu', 'Accompaniments', 'Standard Items', 'Veg'),
-(202, 'Orugallu Pachipulusu', 'Accompaniments', 'Standard Items', 'Veg'),
+(202, 'Orugallu Pachipulusu', 'Accompaniments', 'Standard Items', 'Veg')
+ON CONFLICT (id) DO NOTHING;
+
+INSERT INTO menu_items (id, name, category, sub_category, diet_type) VALUES
 (203, 'Pappu Charu', 'Accompaniments', 'Standard Items', 'Veg'),
 (204, 'Patchipulusu', 'Accompaniments', 'Standard Items', 'Veg'),
 (205, 'Pepper Rasam', 'Accompaniments', 'Standard Items', 'Veg'),
@@ -751,7 +770,10 @@ INSERT INTO menu_items (id, name, category, sub_category, diet_type) VALUES
 (520, 'Qhubani Ka Meetha', 'Dessert', 'Shahi Sweets', 'Veg'),
 (521, 'Shahi Tukra', 'Dessert', 'Shahi Sweets', 'Veg'),
 (522, 'Pot Kulfi', 'Dessert', 'Special Ice Creams', 'Veg'),
-(523, 'Roller Ice Cream', 'Dessert', 'Special Ice Creams', 'Veg'),
+(523, 'Roller Ice Cream', 'Dessert', 'Special Ice Creams', 'Veg')
+ON CONFLICT (id) DO NOTHING;
+
+INSERT INTO menu_items (id, name, category, sub_category, diet_type) VALUES
 (524, 'Stone Ice Cream', 'Dessert', 'Special Ice Creams', 'Veg'),
 (525, 'Chekkara Pongal', 'Dessert', 'Temple Sweets', 'Veg'),
 (526, 'Palathalikalu', 'Dessert', 'Temple Sweets', 'Veg'),
@@ -1031,7 +1053,10 @@ INSERT INTO menu_items (id, name, category, sub_category, diet_type) VALUES
 (800, 'Plain Biryani', 'Main Course (Veg)', 'Biryani', 'Veg'),
 (801, 'Avakai Pappu', 'Main Course (Veg)', 'Dal', 'Veg'),
 (802, 'Beerakaya Pappu', 'Main Course (Veg)', 'Dal', 'Veg'),
-(803, 'Chukkakura Mamidikaya Pappu', 'Main Course (Veg)', 'Dal', 'Veg'),
+(803, 'Chukkakura Mamidikaya Pappu', 'Main Course (Veg)', 'Dal', 'Veg')
+ON CONFLICT (id) DO NOTHING;
+
+INSERT INTO menu_items (id, name, category, sub_category, diet_type) VALUES
 (804, 'Cucumber Dal', 'Main Course (Veg)', 'Dal', 'Veg'),
 (805, 'Dal Jaipuri', 'Main Course (Veg)', 'Dal', 'Veg'),
 (806, 'Dal Makhani', 'Main Course (Veg)', 'Dal', 'Veg'),
@@ -1357,7 +1382,10 @@ INSERT INTO menu_items (id, name, category, sub_category, diet_type) VALUES
 (1126, 'Meal Maker Keema Wada', 'Snacks', 'Hots (Indian Fried)', 'Veg'),
 (1127, 'Mini Alsanda Wada', 'Snacks', 'Hots (Indian Fried)', 'Veg'),
 (1128, 'Mini Perugu Aawada', 'Snacks', 'Hots (Indian Fried)', 'Veg'),
-(1129, 'Mixed Veg. Wada', 'Snacks', 'Hots (Indian Fried)', 'Veg'),
+(1129, 'Mixed Veg. Wada', 'Snacks', 'Hots (Indian Fried)', 'Veg')
+ON CONFLICT (id) DO NOTHING;
+
+INSERT INTO menu_items (id, name, category, sub_category, diet_type) VALUES
 (1130, 'Nellore Chitti Gaare', 'Snacks', 'Hots (Indian Fried)', 'Veg'),
 (1131, 'Onion Pakodi', 'Snacks', 'Hots (Indian Fried)', 'Veg'),
 (1132, 'Palak Roll', 'Snacks', 'Hots (Indian Fried)', 'Veg'),
@@ -1561,294 +1589,352 @@ INSERT INTO menu_items (id, name, category, sub_category, diet_type) VALUES
 ON CONFLICT (id) DO NOTHING;
 
 INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
+(1, 1581921, 0.25, 'KG'),
 (1, 89, 0.02, 'LTR'),
 (1, 127, 0.005, 'KG'),
 (1, 109, 0.005, 'KG'),
 (1, 1, 0.002, 'KG'),
 (1, 214, 0.05, 'NO'),
 (1, 131, 0.01, 'BOT'),
+(2, 1581921, 0.25, 'KG'),
 (2, 89, 0.02, 'LTR'),
 (2, 127, 0.005, 'KG'),
 (2, 109, 0.005, 'KG'),
 (2, 1, 0.002, 'KG'),
 (2, 214, 0.05, 'NO'),
 (2, 131, 0.01, 'BOT'),
+(3, 1581921, 0.25, 'KG'),
 (3, 89, 0.02, 'LTR'),
 (3, 127, 0.005, 'KG'),
 (3, 109, 0.005, 'KG'),
 (3, 1, 0.002, 'KG'),
 (3, 214, 0.05, 'NO'),
 (3, 131, 0.01, 'BOT'),
+(4, 1581921, 0.25, 'KG'),
 (4, 89, 0.02, 'LTR'),
 (4, 127, 0.005, 'KG'),
 (4, 109, 0.005, 'KG'),
 (4, 1, 0.002, 'KG'),
 (4, 214, 0.05, 'NO'),
 (4, 131, 0.01, 'BOT'),
+(5, 1581921, 0.25, 'KG'),
 (5, 89, 0.02, 'LTR'),
 (5, 127, 0.005, 'KG'),
 (5, 109, 0.005, 'KG'),
 (5, 1, 0.002, 'KG'),
 (5, 214, 0.05, 'NO'),
 (5, 131, 0.01, 'BOT'),
+(6, 1581921, 0.25, 'KG'),
 (6, 89, 0.02, 'LTR'),
 (6, 127, 0.005, 'KG'),
 (6, 109, 0.005, 'KG'),
 (6, 1, 0.002, 'KG'),
 (6, 214, 0.05, 'NO'),
 (6, 131, 0.01, 'BOT'),
+(7, 1581921, 0.25, 'KG'),
 (7, 89, 0.02, 'LTR'),
 (7, 127, 0.005, 'KG'),
 (7, 109, 0.005, 'KG'),
 (7, 1, 0.002, 'KG'),
 (7, 214, 0.05, 'NO'),
 (7, 131, 0.01, 'BOT'),
+(8, 1581921, 0.25, 'KG'),
 (8, 89, 0.02, 'LTR'),
 (8, 127, 0.005, 'KG'),
 (8, 109, 0.005, 'KG'),
 (8, 1, 0.002, 'KG'),
 (8, 214, 0.05, 'NO'),
 (8, 131, 0.01, 'BOT'),
+(9, 1581921, 0.25, 'KG'),
 (9, 89, 0.02, 'LTR'),
 (9, 127, 0.005, 'KG'),
 (9, 109, 0.005, 'KG'),
 (9, 1, 0.002, 'KG'),
 (9, 214, 0.05, 'NO'),
 (9, 131, 0.01, 'BOT'),
+(10, 1581921, 0.25, 'KG'),
 (10, 89, 0.02, 'LTR'),
 (10, 127, 0.005, 'KG'),
 (10, 109, 0.005, 'KG'),
 (10, 1, 0.002, 'KG'),
 (10, 214, 0.05, 'NO'),
 (10, 131, 0.01, 'BOT'),
+(11, 1581921, 0.25, 'KG'),
 (11, 89, 0.02, 'LTR'),
 (11, 127, 0.005, 'KG'),
 (11, 109, 0.005, 'KG'),
 (11, 1, 0.002, 'KG'),
 (11, 214, 0.05, 'NO'),
 (11, 131, 0.01, 'BOT'),
+(12, 1581921, 0.25, 'KG'),
 (12, 89, 0.02, 'LTR'),
 (12, 127, 0.005, 'KG'),
 (12, 109, 0.005, 'KG'),
 (12, 1, 0.002, 'KG'),
 (12, 214, 0.05, 'NO'),
 (12, 131, 0.01, 'BOT'),
+(13, 1581921, 0.25, 'KG'),
 (13, 89, 0.02, 'LTR'),
 (13, 127, 0.005, 'KG'),
 (13, 109, 0.005, 'KG'),
 (13, 1, 0.002, 'KG'),
 (13, 214, 0.05, 'NO'),
 (13, 131, 0.01, 'BOT'),
+(14, 1581921, 0.25, 'KG'),
 (14, 89, 0.02, 'LTR'),
 (14, 127, 0.005, 'KG'),
 (14, 109, 0.005, 'KG'),
 (14, 1, 0.002, 'KG'),
 (14, 214, 0.05, 'NO'),
 (14, 131, 0.01, 'BOT'),
+(15, 1581921, 0.25, 'KG'),
 (15, 89, 0.02, 'LTR'),
 (15, 127, 0.005, 'KG'),
 (15, 109, 0.005, 'KG'),
 (15, 1, 0.002, 'KG'),
 (15, 214, 0.05, 'NO'),
 (15, 131, 0.01, 'BOT'),
+(16, 1581921, 0.25, 'KG'),
 (16, 89, 0.02, 'LTR'),
 (16, 127, 0.005, 'KG'),
 (16, 109, 0.005, 'KG'),
 (16, 1, 0.002, 'KG'),
 (16, 214, 0.05, 'NO'),
 (16, 131, 0.01, 'BOT'),
+(17, 1581921, 0.25, 'KG'),
 (17, 89, 0.02, 'LTR'),
 (17, 127, 0.005, 'KG'),
 (17, 109, 0.005, 'KG'),
 (17, 1, 0.002, 'KG'),
 (17, 214, 0.05, 'NO'),
 (17, 131, 0.01, 'BOT'),
+(18, 1581921, 0.25, 'KG'),
 (18, 89, 0.02, 'LTR'),
 (18, 127, 0.005, 'KG'),
 (18, 109, 0.005, 'KG'),
 (18, 1, 0.002, 'KG'),
 (18, 214, 0.05, 'NO'),
 (18, 131, 0.01, 'BOT'),
+(19, 1581921, 0.25, 'KG'),
 (19, 89, 0.02, 'LTR'),
 (19, 127, 0.005, 'KG'),
 (19, 109, 0.005, 'KG'),
 (19, 1, 0.002, 'KG'),
 (19, 214, 0.05, 'NO'),
 (19, 131, 0.01, 'BOT'),
+(20, 1581921, 0.25, 'KG'),
 (20, 89, 0.02, 'LTR'),
 (20, 127, 0.005, 'KG'),
 (20, 109, 0.005, 'KG'),
 (20, 1, 0.002, 'KG'),
 (20, 214, 0.05, 'NO'),
 (20, 131, 0.01, 'BOT'),
+(21, 1581921, 0.25, 'KG'),
 (21, 89, 0.02, 'LTR'),
 (21, 127, 0.005, 'KG'),
 (21, 109, 0.005, 'KG'),
 (21, 1, 0.002, 'KG'),
 (21, 214, 0.05, 'NO'),
 (21, 131, 0.01, 'BOT'),
+(22, 1581921, 0.25, 'KG'),
 (22, 89, 0.02, 'LTR'),
 (22, 127, 0.005, 'KG'),
 (22, 109, 0.005, 'KG'),
 (22, 1, 0.002, 'KG'),
 (22, 214, 0.05, 'NO'),
 (22, 131, 0.01, 'BOT'),
+(23, 1581921, 0.25, 'KG'),
 (23, 89, 0.02, 'LTR'),
 (23, 127, 0.005, 'KG'),
 (23, 109, 0.005, 'KG'),
 (23, 1, 0.002, 'KG'),
 (23, 214, 0.05, 'NO'),
 (23, 131, 0.01, 'BOT'),
+(24, 1581921, 0.25, 'KG'),
 (24, 89, 0.02, 'LTR'),
 (24, 127, 0.005, 'KG'),
 (24, 109, 0.005, 'KG'),
 (24, 1, 0.002, 'KG'),
 (24, 214, 0.05, 'NO'),
 (24, 131, 0.01, 'BOT'),
+(25, 1581921, 0.25, 'KG'),
 (25, 89, 0.02, 'LTR'),
 (25, 127, 0.005, 'KG'),
 (25, 109, 0.005, 'KG'),
 (25, 1, 0.002, 'KG'),
 (25, 214, 0.05, 'NO'),
 (25, 131, 0.01, 'BOT'),
+(26, 1581921, 0.25, 'KG'),
 (26, 89, 0.02, 'LTR'),
 (26, 127, 0.005, 'KG'),
 (26, 109, 0.005, 'KG'),
 (26, 1, 0.002, 'KG'),
 (26, 214, 0.05, 'NO'),
 (26, 131, 0.01, 'BOT'),
+(27, 1581921, 0.25, 'KG'),
 (27, 89, 0.02, 'LTR'),
 (27, 127, 0.005, 'KG'),
 (27, 109, 0.005, 'KG'),
 (27, 1, 0.002, 'KG'),
 (27, 214, 0.05, 'NO'),
 (27, 131, 0.01, 'BOT'),
+(28, 1581921, 0.25, 'KG'),
 (28, 89, 0.02, 'LTR'),
 (28, 127, 0.005, 'KG'),
 (28, 109, 0.005, 'KG'),
 (28, 1, 0.002, 'KG'),
 (28, 214, 0.05, 'NO'),
 (28, 131, 0.01, 'BOT'),
+(29, 1581921, 0.25, 'KG'),
 (29, 89, 0.02, 'LTR'),
 (29, 127, 0.005, 'KG'),
 (29, 109, 0.005, 'KG'),
 (29, 1, 0.002, 'KG'),
 (29, 214, 0.05, 'NO'),
 (29, 131, 0.01, 'BOT'),
+(30, 1581921, 0.25, 'KG'),
 (30, 89, 0.02, 'LTR'),
 (30, 127, 0.005, 'KG'),
 (30, 109, 0.005, 'KG'),
 (30, 1, 0.002, 'KG'),
 (30, 214, 0.05, 'NO'),
 (30, 131, 0.01, 'BOT'),
+(31, 1691919, 0.25, 'KG'),
 (31, 89, 0.04, 'LTR'),
 (31, 127, 0.005, 'KG'),
 (31, 109, 0.008, 'KG'),
 (31, 76, 0.005, 'KG'),
+(32, 1691919, 0.25, 'KG'),
 (32, 89, 0.04, 'LTR'),
 (32, 127, 0.005, 'KG'),
 (32, 109, 0.008, 'KG'),
 (32, 76, 0.005, 'KG'),
+(33, 1691919, 0.25, 'KG'),
 (33, 89, 0.04, 'LTR'),
 (33, 127, 0.005, 'KG'),
 (33, 109, 0.008, 'KG'),
 (33, 76, 0.005, 'KG'),
+(34, 1691919, 0.25, 'KG'),
 (34, 89, 0.04, 'LTR'),
 (34, 127, 0.005, 'KG'),
 (34, 109, 0.008, 'KG'),
 (34, 76, 0.005, 'KG'),
+(35, 1691919, 0.25, 'KG'),
 (35, 89, 0.04, 'LTR'),
 (35, 127, 0.005, 'KG'),
 (35, 109, 0.008, 'KG'),
 (35, 76, 0.005, 'KG'),
+(36, 1691919, 0.25, 'KG'),
 (36, 89, 0.04, 'LTR'),
 (36, 127, 0.005, 'KG'),
 (36, 109, 0.008, 'KG'),
 (36, 76, 0.005, 'KG'),
+(37, 1691919, 0.25, 'KG'),
 (37, 89, 0.04, 'LTR'),
 (37, 127, 0.005, 'KG'),
 (37, 109, 0.008, 'KG'),
 (37, 76, 0.005, 'KG'),
+(38, 1691919, 0.25, 'KG'),
 (38, 89, 0.04, 'LTR'),
 (38, 127, 0.005, 'KG'),
 (38, 109, 0.008, 'KG'),
 (38, 76, 0.005, 'KG'),
+(39, 1658053, 0.25, 'KG'),
 (39, 89, 0.03, 'LTR'),
 (39, 127, 0.005, 'KG'),
 (39, 109, 0.006, 'KG'),
 (39, 24, 0.01, 'KG'),
+(40, 1457666, 0.25, 'KG'),
 (40, 89, 0.03, 'LTR'),
 (40, 127, 0.005, 'KG'),
 (40, 109, 0.006, 'KG'),
 (40, 24, 0.01, 'KG'),
+(41, 1658053, 0.25, 'KG'),
 (41, 89, 0.03, 'LTR'),
 (41, 127, 0.005, 'KG'),
 (41, 109, 0.006, 'KG'),
 (41, 24, 0.01, 'KG'),
+(42, 1658053, 0.25, 'KG'),
 (42, 89, 0.03, 'LTR'),
 (42, 127, 0.005, 'KG'),
 (42, 109, 0.006, 'KG'),
 (42, 24, 0.01, 'KG'),
+(43, 1658053, 0.25, 'KG'),
 (43, 89, 0.03, 'LTR'),
 (43, 127, 0.005, 'KG'),
 (43, 109, 0.006, 'KG'),
 (43, 24, 0.01, 'KG'),
+(44, 1658053, 0.25, 'KG'),
 (44, 89, 0.03, 'LTR'),
 (44, 127, 0.005, 'KG'),
 (44, 109, 0.006, 'KG'),
 (44, 24, 0.01, 'KG'),
+(45, 1658053, 0.25, 'KG'),
 (45, 89, 0.03, 'LTR'),
 (45, 127, 0.005, 'KG'),
 (45, 109, 0.006, 'KG'),
 (45, 24, 0.01, 'KG'),
+(46, 1658053, 0.25, 'KG'),
 (46, 89, 0.03, 'LTR'),
 (46, 127, 0.005, 'KG'),
 (46, 109, 0.006, 'KG'),
 (46, 24, 0.01, 'KG'),
+(47, 1658053, 0.25, 'KG'),
 (47, 89, 0.03, 'LTR'),
 (47, 127, 0.005, 'KG'),
 (47, 109, 0.006, 'KG'),
 (47, 24, 0.01, 'KG'),
+(48, 1658053, 0.25, 'KG'),
 (48, 89, 0.03, 'LTR'),
 (48, 127, 0.005, 'KG'),
 (48, 109, 0.006, 'KG'),
 (48, 24, 0.01, 'KG'),
+(49, 1457666, 0.25, 'KG'),
 (49, 89, 0.03, 'LTR'),
 (49, 127, 0.005, 'KG'),
 (49, 109, 0.006, 'KG'),
 (49, 24, 0.01, 'KG'),
+(50, 1457666, 0.25, 'KG'),
 (50, 89, 0.03, 'LTR'),
 (50, 127, 0.005, 'KG'),
 (50, 109, 0.006, 'KG'),
 (50, 24, 0.01, 'KG'),
+(51, 1658053, 0.25, 'KG'),
 (51, 89, 0.03, 'LTR'),
 (51, 127, 0.005, 'KG'),
 (51, 109, 0.006, 'KG'),
 (51, 24, 0.01, 'KG'),
+(52, 1457666, 0.25, 'KG'),
 (52, 89, 0.03, 'LTR'),
 (52, 127, 0.005, 'KG'),
 (52, 109, 0.006, 'KG'),
 (52, 24, 0.01, 'KG'),
+(53, 1658053, 0.25, 'KG'),
 (53, 89, 0.03, 'LTR'),
 (53, 127, 0.005, 'KG'),
 (53, 109, 0.006, 'KG'),
 (53, 24, 0.01, 'KG'),
+(54, 1457666, 0.25, 'KG'),
 (54, 89, 0.03, 'LTR'),
 (54, 127, 0.005, 'KG'),
 (54, 109, 0.006, 'KG'),
 (54, 24, 0.01, 'KG'),
+(55, 1658053, 0.25, 'KG'),
 (55, 89, 0.03, 'LTR'),
 (55, 127, 0.005, 'KG'),
 (55, 109, 0.006, 'KG'),
 (55, 24, 0.01, 'KG'),
+(56, 1658053, 0.25, 'KG'),
 (56, 89, 0.03, 'LTR'),
 (56, 127, 0.005, 'KG'),
 (56, 109, 0.006, 'KG'),
 (56, 24, 0.01, 'KG'),
+(57, 1658053, 0.25, 'KG'),
 (57, 89, 0.03, 'LTR'),
 (57, 127, 0.005, 'KG'),
 (57, 109, 0.006, 'KG'),
 (57, 24, 0.01, 'KG'),
+(58, 1039230, 0.25, 'KG'),
 (58, 117, 0.2, 'KG'),
 (58, 89, 0.05, 'LTR'),
 (58, 61, 0.02, 'KG'),
@@ -1856,6 +1942,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (58, 163, 0.001, 'KG'),
 (58, 165, 0.001, 'KG'),
 (58, 164, 0.001, 'KG'),
+(58, 1211973, 0.1, 'KG'),
+(59, 1039230, 0.25, 'KG'),
 (59, 117, 0.2, 'KG'),
 (59, 89, 0.05, 'LTR'),
 (59, 61, 0.02, 'KG'),
@@ -1863,6 +1951,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (59, 163, 0.001, 'KG'),
 (59, 165, 0.001, 'KG'),
 (59, 164, 0.001, 'KG'),
+(59, 1211973, 0.1, 'KG'),
+(60, 1039230, 0.25, 'KG'),
 (60, 117, 0.2, 'KG'),
 (60, 89, 0.05, 'LTR'),
 (60, 61, 0.02, 'KG'),
@@ -1870,6 +1960,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (60, 163, 0.001, 'KG'),
 (60, 165, 0.001, 'KG'),
 (60, 164, 0.001, 'KG'),
+(60, 1211973, 0.1, 'KG'),
+(61, 1039230, 0.25, 'KG'),
 (61, 117, 0.2, 'KG'),
 (61, 89, 0.05, 'LTR'),
 (61, 61, 0.02, 'KG'),
@@ -1877,6 +1969,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (61, 163, 0.001, 'KG'),
 (61, 165, 0.001, 'KG'),
 (61, 164, 0.001, 'KG'),
+(61, 1211973, 0.1, 'KG'),
+(62, 1039230, 0.25, 'KG'),
 (62, 117, 0.2, 'KG'),
 (62, 89, 0.05, 'LTR'),
 (62, 61, 0.02, 'KG'),
@@ -1884,6 +1978,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (62, 163, 0.001, 'KG'),
 (62, 165, 0.001, 'KG'),
 (62, 164, 0.001, 'KG'),
+(62, 1211973, 0.1, 'KG'),
+(63, 1039230, 0.25, 'KG'),
 (63, 117, 0.2, 'KG'),
 (63, 89, 0.05, 'LTR'),
 (63, 61, 0.02, 'KG'),
@@ -1891,6 +1987,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (63, 163, 0.001, 'KG'),
 (63, 165, 0.001, 'KG'),
 (63, 164, 0.001, 'KG'),
+(63, 1211973, 0.1, 'KG'),
+(64, 1039230, 0.25, 'KG'),
 (64, 117, 0.2, 'KG'),
 (64, 89, 0.05, 'LTR'),
 (64, 61, 0.02, 'KG'),
@@ -1898,6 +1996,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (64, 163, 0.001, 'KG'),
 (64, 165, 0.001, 'KG'),
 (64, 164, 0.001, 'KG'),
+(64, 1211973, 0.1, 'KG'),
+(65, 1039230, 0.25, 'KG'),
 (65, 117, 0.2, 'KG'),
 (65, 89, 0.05, 'LTR'),
 (65, 61, 0.02, 'KG'),
@@ -1905,6 +2005,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (65, 163, 0.001, 'KG'),
 (65, 165, 0.001, 'KG'),
 (65, 164, 0.001, 'KG'),
+(65, 1211973, 0.1, 'KG'),
+(66, 1039230, 0.25, 'KG'),
 (66, 117, 0.2, 'KG'),
 (66, 89, 0.05, 'LTR'),
 (66, 61, 0.02, 'KG'),
@@ -1912,6 +2014,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (66, 163, 0.001, 'KG'),
 (66, 165, 0.001, 'KG'),
 (66, 164, 0.001, 'KG'),
+(66, 1211973, 0.1, 'KG'),
+(67, 1039230, 0.25, 'KG'),
 (67, 117, 0.2, 'KG'),
 (67, 89, 0.05, 'LTR'),
 (67, 61, 0.02, 'KG'),
@@ -1919,750 +2023,1115 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (67, 163, 0.001, 'KG'),
 (67, 165, 0.001, 'KG'),
 (67, 164, 0.001, 'KG'),
+(67, 1211973, 0.1, 'KG'),
+(68, 1385336, 0.3, 'KG'),
 (68, 89, 0.03, 'LTR'),
 (68, 127, 0.005, 'KG'),
 (68, 109, 0.008, 'KG'),
 (68, 1, 0.002, 'KG'),
 (68, 76, 0.003, 'KG'),
+(68, 1211973, 0.1, 'KG'),
+(68, 1846301, 0.05, 'KG'),
+(69, 1385336, 0.3, 'KG'),
 (69, 89, 0.03, 'LTR'),
 (69, 127, 0.005, 'KG'),
 (69, 109, 0.008, 'KG'),
 (69, 1, 0.002, 'KG'),
 (69, 76, 0.003, 'KG'),
+(69, 1211973, 0.1, 'KG'),
+(69, 1846301, 0.05, 'KG'),
+(70, 1385336, 0.3, 'KG'),
 (70, 89, 0.03, 'LTR'),
 (70, 127, 0.005, 'KG'),
 (70, 109, 0.008, 'KG'),
 (70, 1, 0.002, 'KG'),
 (70, 76, 0.003, 'KG'),
+(70, 1211973, 0.1, 'KG'),
+(70, 1846301, 0.05, 'KG'),
+(71, 1385336, 0.3, 'KG'),
 (71, 89, 0.03, 'LTR'),
 (71, 127, 0.005, 'KG'),
 (71, 109, 0.008, 'KG'),
 (71, 1, 0.002, 'KG'),
 (71, 76, 0.003, 'KG'),
+(71, 1211973, 0.1, 'KG'),
+(71, 1846301, 0.05, 'KG'),
+(72, 1385336, 0.3, 'KG'),
 (72, 89, 0.03, 'LTR'),
 (72, 127, 0.005, 'KG'),
 (72, 109, 0.008, 'KG'),
 (72, 1, 0.002, 'KG'),
 (72, 76, 0.003, 'KG'),
+(72, 1211973, 0.1, 'KG'),
+(72, 1846301, 0.05, 'KG'),
+(73, 1385336, 0.3, 'KG'),
 (73, 89, 0.03, 'LTR'),
 (73, 127, 0.005, 'KG'),
 (73, 109, 0.008, 'KG'),
 (73, 1, 0.002, 'KG'),
 (73, 76, 0.003, 'KG'),
+(73, 1211973, 0.1, 'KG'),
+(73, 1846301, 0.05, 'KG'),
+(74, 1385336, 0.3, 'KG'),
 (74, 89, 0.03, 'LTR'),
 (74, 127, 0.005, 'KG'),
 (74, 109, 0.008, 'KG'),
 (74, 1, 0.002, 'KG'),
 (74, 76, 0.003, 'KG'),
+(74, 1211973, 0.1, 'KG'),
+(74, 1846301, 0.05, 'KG'),
+(75, 1385336, 0.3, 'KG'),
 (75, 89, 0.03, 'LTR'),
 (75, 127, 0.005, 'KG'),
 (75, 109, 0.008, 'KG'),
 (75, 1, 0.002, 'KG'),
 (75, 76, 0.003, 'KG'),
+(75, 1211973, 0.1, 'KG'),
+(75, 1846301, 0.05, 'KG'),
+(76, 1385336, 0.3, 'KG'),
 (76, 89, 0.03, 'LTR'),
 (76, 127, 0.005, 'KG'),
 (76, 109, 0.008, 'KG'),
 (76, 1, 0.002, 'KG'),
 (76, 76, 0.003, 'KG'),
+(76, 1211973, 0.1, 'KG'),
+(76, 1846301, 0.05, 'KG'),
+(77, 1385336, 0.3, 'KG'),
 (77, 89, 0.03, 'LTR'),
 (77, 127, 0.005, 'KG'),
 (77, 109, 0.008, 'KG'),
 (77, 1, 0.002, 'KG'),
 (77, 76, 0.003, 'KG'),
+(77, 1211973, 0.1, 'KG'),
+(77, 1846301, 0.05, 'KG'),
+(78, 1385336, 0.3, 'KG'),
 (78, 89, 0.03, 'LTR'),
 (78, 127, 0.005, 'KG'),
 (78, 109, 0.008, 'KG'),
 (78, 1, 0.002, 'KG'),
 (78, 76, 0.003, 'KG'),
+(78, 1211973, 0.1, 'KG'),
+(78, 1846301, 0.05, 'KG'),
+(79, 1385336, 0.3, 'KG'),
 (79, 89, 0.03, 'LTR'),
 (79, 127, 0.005, 'KG'),
 (79, 109, 0.008, 'KG'),
 (79, 1, 0.002, 'KG'),
 (79, 76, 0.003, 'KG'),
+(79, 1211973, 0.1, 'KG'),
+(79, 1846301, 0.05, 'KG'),
+(80, 1385336, 0.3, 'KG'),
 (80, 89, 0.03, 'LTR'),
 (80, 127, 0.005, 'KG'),
 (80, 109, 0.008, 'KG'),
 (80, 1, 0.002, 'KG'),
 (80, 76, 0.003, 'KG'),
+(80, 1211973, 0.1, 'KG'),
+(80, 1846301, 0.05, 'KG'),
+(81, 1385336, 0.3, 'KG'),
 (81, 89, 0.03, 'LTR'),
 (81, 127, 0.005, 'KG'),
 (81, 109, 0.008, 'KG'),
 (81, 1, 0.002, 'KG'),
 (81, 76, 0.003, 'KG'),
+(81, 1211973, 0.1, 'KG'),
+(81, 1846301, 0.05, 'KG'),
+(82, 1385336, 0.3, 'KG'),
 (82, 89, 0.03, 'LTR'),
 (82, 127, 0.005, 'KG'),
 (82, 109, 0.008, 'KG'),
 (82, 1, 0.002, 'KG'),
 (82, 76, 0.003, 'KG'),
+(82, 1211973, 0.1, 'KG'),
+(82, 1846301, 0.05, 'KG'),
+(83, 1385336, 0.3, 'KG'),
 (83, 89, 0.03, 'LTR'),
 (83, 127, 0.005, 'KG'),
 (83, 109, 0.008, 'KG'),
 (83, 1, 0.002, 'KG'),
 (83, 76, 0.003, 'KG'),
+(83, 1211973, 0.1, 'KG'),
+(83, 1846301, 0.05, 'KG'),
+(84, 1385336, 0.3, 'KG'),
 (84, 89, 0.03, 'LTR'),
 (84, 127, 0.005, 'KG'),
 (84, 109, 0.008, 'KG'),
 (84, 1, 0.002, 'KG'),
 (84, 76, 0.003, 'KG'),
+(84, 1211973, 0.1, 'KG'),
+(84, 1846301, 0.05, 'KG'),
+(85, 1385336, 0.3, 'KG'),
 (85, 89, 0.03, 'LTR'),
 (85, 127, 0.005, 'KG'),
 (85, 109, 0.008, 'KG'),
 (85, 1, 0.002, 'KG'),
 (85, 76, 0.003, 'KG'),
+(85, 1211973, 0.1, 'KG'),
+(85, 1846301, 0.05, 'KG'),
+(86, 1385336, 0.3, 'KG'),
 (86, 89, 0.03, 'LTR'),
 (86, 127, 0.005, 'KG'),
 (86, 109, 0.008, 'KG'),
 (86, 1, 0.002, 'KG'),
 (86, 76, 0.003, 'KG'),
+(86, 1211973, 0.1, 'KG'),
+(86, 1846301, 0.05, 'KG'),
+(87, 1691919, 0.25, 'KG'),
 (87, 89, 0.04, 'LTR'),
 (87, 127, 0.005, 'KG'),
 (87, 109, 0.008, 'KG'),
 (87, 76, 0.005, 'KG'),
+(88, 1691919, 0.25, 'KG'),
 (88, 89, 0.04, 'LTR'),
 (88, 127, 0.005, 'KG'),
 (88, 109, 0.008, 'KG'),
 (88, 76, 0.005, 'KG'),
+(89, 1691919, 0.25, 'KG'),
 (89, 89, 0.04, 'LTR'),
 (89, 127, 0.005, 'KG'),
 (89, 109, 0.008, 'KG'),
 (89, 76, 0.005, 'KG'),
+(90, 1691919, 0.25, 'KG'),
 (90, 89, 0.04, 'LTR'),
 (90, 127, 0.005, 'KG'),
 (90, 109, 0.008, 'KG'),
 (90, 76, 0.005, 'KG'),
+(91, 1691919, 0.25, 'KG'),
 (91, 89, 0.04, 'LTR'),
 (91, 127, 0.005, 'KG'),
 (91, 109, 0.008, 'KG'),
 (91, 76, 0.005, 'KG'),
+(92, 1691919, 0.25, 'KG'),
 (92, 89, 0.04, 'LTR'),
 (92, 127, 0.005, 'KG'),
 (92, 109, 0.008, 'KG'),
 (92, 76, 0.005, 'KG'),
+(93, 1691919, 0.25, 'KG'),
 (93, 89, 0.04, 'LTR'),
 (93, 127, 0.005, 'KG'),
 (93, 109, 0.008, 'KG'),
 (93, 76, 0.005, 'KG'),
+(94, 1691919, 0.25, 'KG'),
 (94, 89, 0.04, 'LTR'),
 (94, 127, 0.005, 'KG'),
 (94, 109, 0.008, 'KG'),
 (94, 76, 0.005, 'KG'),
+(95, 1691919, 0.25, 'KG'),
 (95, 89, 0.04, 'LTR'),
 (95, 127, 0.005, 'KG'),
 (95, 109, 0.008, 'KG'),
 (95, 76, 0.005, 'KG'),
+(96, 1691919, 0.25, 'KG'),
 (96, 89, 0.04, 'LTR'),
 (96, 127, 0.005, 'KG'),
 (96, 109, 0.008, 'KG'),
 (96, 76, 0.005, 'KG'),
+(97, 1691919, 0.25, 'KG'),
 (97, 89, 0.04, 'LTR'),
 (97, 127, 0.005, 'KG'),
 (97, 109, 0.008, 'KG'),
 (97, 76, 0.005, 'KG'),
+(98, 1691919, 0.25, 'KG'),
 (98, 89, 0.04, 'LTR'),
 (98, 127, 0.005, 'KG'),
 (98, 109, 0.008, 'KG'),
 (98, 76, 0.005, 'KG'),
+(99, 1691919, 0.25, 'KG'),
 (99, 89, 0.04, 'LTR'),
 (99, 127, 0.005, 'KG'),
 (99, 109, 0.008, 'KG'),
 (99, 76, 0.005, 'KG'),
+(100, 1691919, 0.25, 'KG'),
 (100, 89, 0.04, 'LTR'),
 (100, 127, 0.005, 'KG'),
 (100, 109, 0.008, 'KG'),
 (100, 76, 0.005, 'KG'),
+(101, 1691919, 0.25, 'KG'),
 (101, 89, 0.04, 'LTR'),
 (101, 127, 0.005, 'KG'),
 (101, 109, 0.008, 'KG'),
 (101, 76, 0.005, 'KG'),
+(102, 1691919, 0.25, 'KG'),
 (102, 89, 0.04, 'LTR'),
 (102, 127, 0.005, 'KG'),
 (102, 109, 0.008, 'KG'),
 (102, 76, 0.005, 'KG'),
+(103, 1658053, 0.25, 'KG'),
 (103, 89, 0.03, 'LTR'),
 (103, 127, 0.005, 'KG'),
 (103, 109, 0.006, 'KG'),
 (103, 24, 0.01, 'KG'),
+(104, 1658053, 0.25, 'KG'),
 (104, 89, 0.03, 'LTR'),
 (104, 127, 0.005, 'KG'),
 (104, 109, 0.006, 'KG'),
 (104, 24, 0.01, 'KG'),
+(105, 1457666, 0.25, 'KG'),
 (105, 89, 0.03, 'LTR'),
 (105, 127, 0.005, 'KG'),
 (105, 109, 0.006, 'KG'),
 (105, 24, 0.01, 'KG'),
+(106, 1658053, 0.25, 'KG'),
 (106, 89, 0.03, 'LTR'),
 (106, 127, 0.005, 'KG'),
 (106, 109, 0.006, 'KG'),
 (106, 24, 0.01, 'KG'),
+(107, 1658053, 0.25, 'KG'),
 (107, 89, 0.03, 'LTR'),
 (107, 127, 0.005, 'KG'),
 (107, 109, 0.006, 'KG'),
 (107, 24, 0.01, 'KG'),
+(108, 1658053, 0.25, 'KG'),
 (108, 89, 0.03, 'LTR'),
 (108, 127, 0.005, 'KG'),
 (108, 109, 0.006, 'KG'),
 (108, 24, 0.01, 'KG'),
+(109, 1658053, 0.25, 'KG'),
 (109, 89, 0.03, 'LTR'),
 (109, 127, 0.005, 'KG'),
 (109, 109, 0.006, 'KG'),
 (109, 24, 0.01, 'KG'),
+(110, 1658053, 0.25, 'KG'),
 (110, 89, 0.03, 'LTR'),
 (110, 127, 0.005, 'KG'),
 (110, 109, 0.006, 'KG'),
 (110, 24, 0.01, 'KG'),
+(111, 1658053, 0.25, 'KG'),
 (111, 89, 0.03, 'LTR'),
 (111, 127, 0.005, 'KG'),
 (111, 109, 0.006, 'KG'),
 (111, 24, 0.01, 'KG'),
+(112, 1658053, 0.25, 'KG'),
 (112, 89, 0.03, 'LTR'),
 (112, 127, 0.005, 'KG'),
 (112, 109, 0.006, 'KG'),
 (112, 24, 0.01, 'KG'),
+(113, 1658053, 0.25, 'KG'),
 (113, 89, 0.03, 'LTR'),
 (113, 127, 0.005, 'KG'),
 (113, 109, 0.006, 'KG'),
 (113, 24, 0.01, 'KG'),
+(114, 1658053, 0.25, 'KG'),
 (114, 89, 0.03, 'LTR'),
 (114, 127, 0.005, 'KG'),
 (114, 109, 0.006, 'KG'),
 (114, 24, 0.01, 'KG'),
+(115, 1457666, 0.25, 'KG'),
 (115, 89, 0.03, 'LTR'),
 (115, 127, 0.005, 'KG'),
 (115, 109, 0.006, 'KG'),
 (115, 24, 0.01, 'KG'),
+(116, 1457666, 0.25, 'KG'),
 (116, 89, 0.03, 'LTR'),
 (116, 127, 0.005, 'KG'),
 (116, 109, 0.006, 'KG'),
 (116, 24, 0.01, 'KG'),
+(117, 1457666, 0.25, 'KG'),
 (117, 89, 0.03, 'LTR'),
 (117, 127, 0.005, 'KG'),
 (117, 109, 0.006, 'KG'),
 (117, 24, 0.01, 'KG'),
+(118, 1658053, 0.25, 'KG'),
 (118, 89, 0.03, 'LTR'),
 (118, 127, 0.005, 'KG'),
 (118, 109, 0.006, 'KG'),
 (118, 24, 0.01, 'KG'),
+(119, 1658053, 0.25, 'KG'),
 (119, 89, 0.03, 'LTR'),
 (119, 127, 0.005, 'KG'),
 (119, 109, 0.006, 'KG'),
 (119, 24, 0.01, 'KG'),
+(120, 1008409, 0.2, 'KG'),
 (120, 127, 0.005, 'KG'),
 (120, 89, 0.02, 'LTR'),
+(121, 1008409, 0.2, 'KG'),
 (121, 127, 0.005, 'KG'),
 (121, 89, 0.02, 'LTR'),
+(122, 1008409, 0.2, 'KG'),
 (122, 127, 0.005, 'KG'),
 (122, 89, 0.02, 'LTR'),
+(123, 1008409, 0.2, 'KG'),
 (123, 127, 0.005, 'KG'),
 (123, 89, 0.02, 'LTR'),
+(124, 1008409, 0.2, 'KG'),
 (124, 127, 0.005, 'KG'),
 (124, 89, 0.02, 'LTR'),
+(125, 1008409, 0.2, 'KG'),
 (125, 127, 0.005, 'KG'),
 (125, 89, 0.02, 'LTR'),
+(126, 1008409, 0.2, 'KG'),
 (126, 127, 0.005, 'KG'),
 (126, 89, 0.02, 'LTR'),
+(127, 1008409, 0.2, 'KG'),
 (127, 127, 0.005, 'KG'),
 (127, 89, 0.02, 'LTR'),
+(128, 1008409, 0.2, 'KG'),
 (128, 127, 0.005, 'KG'),
 (128, 89, 0.02, 'LTR'),
+(129, 1008409, 0.2, 'KG'),
 (129, 127, 0.005, 'KG'),
 (129, 89, 0.02, 'LTR'),
+(130, 1008409, 0.2, 'KG'),
 (130, 127, 0.005, 'KG'),
 (130, 89, 0.02, 'LTR'),
+(131, 1008409, 0.2, 'KG'),
 (131, 127, 0.005, 'KG'),
 (131, 89, 0.02, 'LTR'),
+(132, 1008409, 0.2, 'KG'),
 (132, 127, 0.005, 'KG'),
 (132, 89, 0.02, 'LTR'),
+(133, 1008409, 0.2, 'KG'),
 (133, 127, 0.005, 'KG'),
 (133, 89, 0.02, 'LTR'),
+(134, 1008409, 0.2, 'KG'),
 (134, 127, 0.005, 'KG'),
 (134, 89, 0.02, 'LTR'),
+(135, 1008409, 0.2, 'KG'),
 (135, 127, 0.005, 'KG'),
 (135, 89, 0.02, 'LTR'),
+(136, 1008409, 0.2, 'KG'),
 (136, 127, 0.005, 'KG'),
 (136, 89, 0.02, 'LTR'),
+(137, 1008409, 0.2, 'KG'),
 (137, 127, 0.005, 'KG'),
 (137, 89, 0.02, 'LTR'),
+(138, 1008409, 0.2, 'KG'),
 (138, 127, 0.005, 'KG'),
 (138, 89, 0.02, 'LTR'),
+(139, 1008409, 0.2, 'KG'),
 (139, 127, 0.005, 'KG'),
 (139, 89, 0.02, 'LTR'),
+(140, 1008409, 0.2, 'KG'),
 (140, 127, 0.005, 'KG'),
 (140, 89, 0.02, 'LTR'),
+(141, 1008409, 0.2, 'KG'),
 (141, 127, 0.005, 'KG'),
 (141, 89, 0.02, 'LTR'),
+(142, 1008409, 0.2, 'KG'),
 (142, 127, 0.005, 'KG'),
 (142, 89, 0.02, 'LTR'),
+(143, 1008409, 0.2, 'KG'),
 (143, 127, 0.005, 'KG'),
 (143, 89, 0.02, 'LTR'),
+(144, 1008409, 0.2, 'KG'),
 (144, 127, 0.005, 'KG'),
 (144, 89, 0.02, 'LTR'),
+(145, 1008409, 0.2, 'KG'),
 (145, 127, 0.005, 'KG'),
 (145, 89, 0.02, 'LTR'),
+(146, 1008409, 0.2, 'KG'),
 (146, 127, 0.005, 'KG'),
 (146, 89, 0.02, 'LTR'),
+(147, 1008409, 0.2, 'KG'),
 (147, 127, 0.005, 'KG'),
 (147, 89, 0.02, 'LTR'),
+(148, 1008409, 0.2, 'KG'),
 (148, 127, 0.005, 'KG'),
 (148, 89, 0.02, 'LTR'),
+(149, 1008409, 0.2, 'KG'),
 (149, 127, 0.005, 'KG'),
 (149, 89, 0.02, 'LTR'),
+(150, 1008409, 0.2, 'KG'),
 (150, 127, 0.005, 'KG'),
 (150, 89, 0.02, 'LTR'),
+(151, 1008409, 0.2, 'KG'),
 (151, 127, 0.005, 'KG'),
 (151, 89, 0.02, 'LTR'),
+(152, 1008409, 0.2, 'KG'),
 (152, 127, 0.005, 'KG'),
 (152, 89, 0.02, 'LTR'),
+(153, 1008409, 0.2, 'KG'),
 (153, 127, 0.005, 'KG'),
 (153, 89, 0.02, 'LTR'),
+(154, 1008409, 0.2, 'KG'),
 (154, 127, 0.005, 'KG'),
 (154, 89, 0.02, 'LTR'),
+(155, 1008409, 0.2, 'KG'),
 (155, 127, 0.005, 'KG'),
 (155, 89, 0.02, 'LTR'),
+(156, 1008409, 0.2, 'KG'),
 (156, 127, 0.005, 'KG'),
 (156, 89, 0.02, 'LTR'),
+(157, 1008409, 0.2, 'KG'),
 (157, 127, 0.005, 'KG'),
 (157, 89, 0.02, 'LTR'),
+(158, 1008409, 0.2, 'KG'),
 (158, 127, 0.005, 'KG'),
 (158, 89, 0.02, 'LTR'),
+(159, 1008409, 0.2, 'KG'),
 (159, 127, 0.005, 'KG'),
 (159, 89, 0.02, 'LTR'),
+(160, 1008409, 0.2, 'KG'),
 (160, 127, 0.005, 'KG'),
 (160, 89, 0.02, 'LTR'),
+(161, 1008409, 0.2, 'KG'),
 (161, 127, 0.005, 'KG'),
 (161, 89, 0.02, 'LTR'),
+(162, 1008409, 0.2, 'KG'),
 (162, 127, 0.005, 'KG'),
 (162, 89, 0.02, 'LTR'),
+(163, 1008409, 0.2, 'KG'),
 (163, 127, 0.005, 'KG'),
 (163, 89, 0.02, 'LTR'),
+(164, 1008409, 0.2, 'KG'),
 (164, 127, 0.005, 'KG'),
 (164, 89, 0.02, 'LTR'),
+(165, 1008409, 0.2, 'KG'),
 (165, 127, 0.005, 'KG'),
 (165, 89, 0.02, 'LTR'),
+(166, 1008409, 0.2, 'KG'),
 (166, 127, 0.005, 'KG'),
 (166, 89, 0.02, 'LTR'),
+(167, 1008409, 0.2, 'KG'),
 (167, 127, 0.005, 'KG'),
 (167, 89, 0.02, 'LTR'),
+(168, 1008409, 0.2, 'KG'),
 (168, 127, 0.005, 'KG'),
 (168, 89, 0.02, 'LTR'),
+(169, 1008409, 0.2, 'KG'),
 (169, 127, 0.005, 'KG'),
 (169, 89, 0.02, 'LTR'),
+(170, 1008409, 0.2, 'KG'),
 (170, 127, 0.005, 'KG'),
 (170, 89, 0.02, 'LTR'),
+(171, 1008409, 0.2, 'KG'),
 (171, 127, 0.005, 'KG'),
 (171, 89, 0.02, 'LTR'),
+(172, 1008409, 0.2, 'KG'),
 (172, 127, 0.005, 'KG'),
 (172, 89, 0.02, 'LTR'),
+(173, 1008409, 0.2, 'KG'),
 (173, 127, 0.005, 'KG'),
 (173, 89, 0.02, 'LTR'),
+(174, 1008409, 0.2, 'KG'),
 (174, 127, 0.005, 'KG'),
 (174, 89, 0.02, 'LTR'),
+(175, 1008409, 0.2, 'KG'),
 (175, 127, 0.005, 'KG'),
 (175, 89, 0.02, 'LTR'),
+(176, 1008409, 0.2, 'KG'),
 (176, 127, 0.005, 'KG'),
 (176, 89, 0.02, 'LTR'),
+(177, 1008409, 0.2, 'KG'),
 (177, 127, 0.005, 'KG'),
 (177, 89, 0.02, 'LTR'),
+(178, 1008409, 0.2, 'KG'),
 (178, 127, 0.005, 'KG'),
 (178, 89, 0.02, 'LTR'),
+(179, 1008409, 0.2, 'KG'),
 (179, 127, 0.005, 'KG'),
 (179, 89, 0.02, 'LTR'),
+(180, 1008409, 0.2, 'KG'),
 (180, 127, 0.005, 'KG'),
 (180, 89, 0.02, 'LTR'),
+(181, 1008409, 0.2, 'KG'),
 (181, 127, 0.005, 'KG'),
 (181, 89, 0.02, 'LTR'),
+(182, 1008409, 0.2, 'KG'),
 (182, 127, 0.005, 'KG'),
 (182, 89, 0.02, 'LTR'),
+(183, 1008409, 0.2, 'KG'),
 (183, 127, 0.005, 'KG'),
 (183, 89, 0.02, 'LTR'),
+(184, 1008409, 0.2, 'KG'),
 (184, 127, 0.005, 'KG'),
 (184, 89, 0.02, 'LTR'),
+(185, 1008409, 0.2, 'KG'),
 (185, 127, 0.005, 'KG'),
 (185, 89, 0.02, 'LTR'),
+(186, 1008409, 0.2, 'KG'),
 (186, 127, 0.005, 'KG'),
 (186, 89, 0.02, 'LTR'),
+(187, 1008409, 0.2, 'KG'),
 (187, 127, 0.005, 'KG'),
 (187, 89, 0.02, 'LTR'),
+(188, 1008409, 0.2, 'KG'),
 (188, 127, 0.005, 'KG'),
 (188, 89, 0.02, 'LTR'),
+(189, 1008409, 0.2, 'KG'),
 (189, 127, 0.005, 'KG'),
 (189, 89, 0.02, 'LTR'),
+(190, 1008409, 0.2, 'KG'),
 (190, 127, 0.005, 'KG'),
 (190, 89, 0.02, 'LTR'),
+(191, 1008409, 0.2, 'KG'),
 (191, 127, 0.005, 'KG'),
 (191, 89, 0.02, 'LTR'),
+(192, 1008409, 0.2, 'KG'),
 (192, 127, 0.005, 'KG'),
 (192, 89, 0.02, 'LTR'),
+(193, 1008409, 0.2, 'KG'),
 (193, 127, 0.005, 'KG'),
 (193, 89, 0.02, 'LTR'),
+(194, 1008409, 0.2, 'KG'),
 (194, 127, 0.005, 'KG'),
 (194, 89, 0.02, 'LTR'),
+(195, 1008409, 0.2, 'KG'),
 (195, 127, 0.005, 'KG'),
 (195, 89, 0.02, 'LTR'),
+(196, 1008409, 0.2, 'KG'),
 (196, 127, 0.005, 'KG'),
 (196, 89, 0.02, 'LTR'),
+(197, 1008409, 0.2, 'KG'),
 (197, 127, 0.005, 'KG'),
 (197, 89, 0.02, 'LTR'),
+(198, 1008409, 0.2, 'KG'),
 (198, 127, 0.005, 'KG'),
 (198, 89, 0.02, 'LTR'),
+(199, 1008409, 0.2, 'KG'),
 (199, 127, 0.005, 'KG'),
 (199, 89, 0.02, 'LTR'),
+(200, 1008409, 0.2, 'KG'),
 (200, 127, 0.005, 'KG'),
 (200, 89, 0.02, 'LTR'),
+(201, 1008409, 0.2, 'KG'),
 (201, 127, 0.005, 'KG'),
 (201, 89, 0.02, 'LTR'),
-(202, 127, 0.005, 'KG'),
+(202, 1008409, 0.2, 'KG'),
+(202, 127, 0.005, 'KG')
+ON CONFLICT DO NOTHING;
+
+INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (202, 89, 0.02, 'LTR'),
+(203, 1008409, 0.2, 'KG'),
 (203, 127, 0.005, 'KG'),
 (203, 89, 0.02, 'LTR'),
+(204, 1008409, 0.2, 'KG'),
 (204, 127, 0.005, 'KG'),
 (204, 89, 0.02, 'LTR'),
+(205, 1008409, 0.2, 'KG'),
 (205, 127, 0.005, 'KG'),
 (205, 89, 0.02, 'LTR'),
+(206, 1008409, 0.2, 'KG'),
 (206, 127, 0.005, 'KG'),
 (206, 89, 0.02, 'LTR'),
+(207, 1008409, 0.2, 'KG'),
 (207, 127, 0.005, 'KG'),
 (207, 89, 0.02, 'LTR'),
+(208, 1008409, 0.2, 'KG'),
 (208, 127, 0.005, 'KG'),
 (208, 89, 0.02, 'LTR'),
+(209, 1008409, 0.2, 'KG'),
 (209, 127, 0.005, 'KG'),
 (209, 89, 0.02, 'LTR'),
+(210, 1008409, 0.2, 'KG'),
 (210, 127, 0.005, 'KG'),
 (210, 89, 0.02, 'LTR'),
+(211, 1008409, 0.2, 'KG'),
 (211, 127, 0.005, 'KG'),
 (211, 89, 0.02, 'LTR'),
+(212, 1008409, 0.2, 'KG'),
 (212, 127, 0.005, 'KG'),
 (212, 89, 0.02, 'LTR'),
+(213, 1008409, 0.2, 'KG'),
 (213, 127, 0.005, 'KG'),
 (213, 89, 0.02, 'LTR'),
+(214, 1008409, 0.2, 'KG'),
 (214, 127, 0.005, 'KG'),
 (214, 89, 0.02, 'LTR'),
+(215, 1008409, 0.2, 'KG'),
 (215, 127, 0.005, 'KG'),
 (215, 89, 0.02, 'LTR'),
+(216, 1008409, 0.2, 'KG'),
 (216, 127, 0.005, 'KG'),
 (216, 89, 0.02, 'LTR'),
+(217, 1008409, 0.2, 'KG'),
 (217, 127, 0.005, 'KG'),
 (217, 89, 0.02, 'LTR'),
+(218, 1008409, 0.2, 'KG'),
 (218, 127, 0.005, 'KG'),
 (218, 89, 0.02, 'LTR'),
+(219, 1008409, 0.2, 'KG'),
 (219, 127, 0.005, 'KG'),
 (219, 89, 0.02, 'LTR'),
+(220, 1008409, 0.2, 'KG'),
 (220, 127, 0.005, 'KG'),
 (220, 89, 0.02, 'LTR'),
+(221, 1008409, 0.2, 'KG'),
 (221, 127, 0.005, 'KG'),
 (221, 89, 0.02, 'LTR'),
+(222, 1008409, 0.2, 'KG'),
 (222, 127, 0.005, 'KG'),
 (222, 89, 0.02, 'LTR'),
+(223, 1008409, 0.2, 'KG'),
 (223, 127, 0.005, 'KG'),
 (223, 89, 0.02, 'LTR'),
+(224, 1008409, 0.2, 'KG'),
 (224, 127, 0.005, 'KG'),
 (224, 89, 0.02, 'LTR'),
+(225, 1008409, 0.2, 'KG'),
 (225, 127, 0.005, 'KG'),
 (225, 89, 0.02, 'LTR'),
+(226, 1008409, 0.2, 'KG'),
 (226, 127, 0.005, 'KG'),
 (226, 89, 0.02, 'LTR'),
+(227, 1008409, 0.2, 'KG'),
 (227, 127, 0.005, 'KG'),
 (227, 89, 0.02, 'LTR'),
+(228, 1008409, 0.2, 'KG'),
 (228, 127, 0.005, 'KG'),
 (228, 89, 0.02, 'LTR'),
+(229, 1008409, 0.2, 'KG'),
 (229, 127, 0.005, 'KG'),
 (229, 89, 0.02, 'LTR'),
+(230, 1008409, 0.2, 'KG'),
 (230, 127, 0.005, 'KG'),
 (230, 89, 0.02, 'LTR'),
+(231, 1008409, 0.2, 'KG'),
 (231, 127, 0.005, 'KG'),
 (231, 89, 0.02, 'LTR'),
+(232, 1008409, 0.2, 'KG'),
 (232, 127, 0.005, 'KG'),
 (232, 89, 0.02, 'LTR'),
+(233, 1008409, 0.2, 'KG'),
 (233, 127, 0.005, 'KG'),
 (233, 89, 0.02, 'LTR'),
+(234, 1008409, 0.2, 'KG'),
 (234, 127, 0.005, 'KG'),
 (234, 89, 0.02, 'LTR'),
+(235, 1008409, 0.2, 'KG'),
 (235, 127, 0.005, 'KG'),
 (235, 89, 0.02, 'LTR'),
+(236, 1008409, 0.2, 'KG'),
 (236, 127, 0.005, 'KG'),
 (236, 89, 0.02, 'LTR'),
+(237, 1008409, 0.2, 'KG'),
 (237, 127, 0.005, 'KG'),
 (237, 89, 0.02, 'LTR'),
+(238, 1008409, 0.2, 'KG'),
 (238, 127, 0.005, 'KG'),
 (238, 89, 0.02, 'LTR'),
+(239, 1008409, 0.2, 'KG'),
 (239, 127, 0.005, 'KG'),
 (239, 89, 0.02, 'LTR'),
+(240, 1008409, 0.2, 'KG'),
 (240, 127, 0.005, 'KG'),
 (240, 89, 0.02, 'LTR'),
+(241, 1008409, 0.2, 'KG'),
 (241, 127, 0.005, 'KG'),
 (241, 89, 0.02, 'LTR'),
+(242, 1008409, 0.2, 'KG'),
 (242, 127, 0.005, 'KG'),
 (242, 89, 0.02, 'LTR'),
+(243, 1008409, 0.2, 'KG'),
 (243, 127, 0.005, 'KG'),
 (243, 89, 0.02, 'LTR'),
+(244, 1008409, 0.2, 'KG'),
 (244, 127, 0.005, 'KG'),
 (244, 89, 0.02, 'LTR'),
+(245, 1008409, 0.2, 'KG'),
 (245, 127, 0.005, 'KG'),
 (245, 89, 0.02, 'LTR'),
+(246, 1008409, 0.2, 'KG'),
 (246, 127, 0.005, 'KG'),
 (246, 89, 0.02, 'LTR'),
+(247, 1008409, 0.2, 'KG'),
 (247, 127, 0.005, 'KG'),
 (247, 89, 0.02, 'LTR'),
+(248, 1008409, 0.2, 'KG'),
 (248, 127, 0.005, 'KG'),
 (248, 89, 0.02, 'LTR'),
+(249, 1008409, 0.2, 'KG'),
 (249, 127, 0.005, 'KG'),
 (249, 89, 0.02, 'LTR'),
+(250, 1008409, 0.2, 'KG'),
 (250, 127, 0.005, 'KG'),
 (250, 89, 0.02, 'LTR'),
+(251, 1008409, 0.2, 'KG'),
 (251, 127, 0.005, 'KG'),
 (251, 89, 0.02, 'LTR'),
+(252, 1008409, 0.2, 'KG'),
 (252, 127, 0.005, 'KG'),
 (252, 89, 0.02, 'LTR'),
+(253, 1008409, 0.2, 'KG'),
 (253, 127, 0.005, 'KG'),
 (253, 89, 0.02, 'LTR'),
+(254, 1008409, 0.2, 'KG'),
 (254, 127, 0.005, 'KG'),
 (254, 89, 0.02, 'LTR'),
+(255, 1008409, 0.2, 'KG'),
 (255, 127, 0.005, 'KG'),
 (255, 89, 0.02, 'LTR'),
+(256, 1008409, 0.2, 'KG'),
 (256, 127, 0.005, 'KG'),
 (256, 89, 0.02, 'LTR'),
+(257, 1008409, 0.2, 'KG'),
 (257, 127, 0.005, 'KG'),
 (257, 89, 0.02, 'LTR'),
+(258, 1008409, 0.2, 'KG'),
 (258, 127, 0.005, 'KG'),
 (258, 89, 0.02, 'LTR'),
+(259, 1008409, 0.2, 'KG'),
 (259, 127, 0.005, 'KG'),
 (259, 89, 0.02, 'LTR'),
+(260, 1008409, 0.2, 'KG'),
 (260, 127, 0.005, 'KG'),
 (260, 89, 0.02, 'LTR'),
+(261, 1008409, 0.2, 'KG'),
 (261, 127, 0.005, 'KG'),
 (261, 89, 0.02, 'LTR'),
+(262, 1008409, 0.2, 'KG'),
 (262, 127, 0.005, 'KG'),
 (262, 89, 0.02, 'LTR'),
+(263, 1008409, 0.2, 'KG'),
 (263, 127, 0.005, 'KG'),
 (263, 89, 0.02, 'LTR'),
+(264, 1008409, 0.2, 'KG'),
 (264, 127, 0.005, 'KG'),
 (264, 89, 0.02, 'LTR'),
+(265, 1008409, 0.2, 'KG'),
 (265, 127, 0.005, 'KG'),
 (265, 89, 0.02, 'LTR'),
+(266, 1008409, 0.2, 'KG'),
 (266, 127, 0.005, 'KG'),
 (266, 89, 0.02, 'LTR'),
+(267, 1008409, 0.2, 'KG'),
 (267, 127, 0.005, 'KG'),
 (267, 89, 0.02, 'LTR'),
+(268, 1008409, 0.2, 'KG'),
 (268, 127, 0.005, 'KG'),
 (268, 89, 0.02, 'LTR'),
+(269, 1008409, 0.2, 'KG'),
 (269, 127, 0.005, 'KG'),
 (269, 89, 0.02, 'LTR'),
+(270, 1008409, 0.2, 'KG'),
 (270, 127, 0.005, 'KG'),
 (270, 89, 0.02, 'LTR'),
+(271, 1008409, 0.2, 'KG'),
 (271, 127, 0.005, 'KG'),
 (271, 89, 0.02, 'LTR'),
+(272, 1008409, 0.2, 'KG'),
 (272, 127, 0.005, 'KG'),
 (272, 89, 0.02, 'LTR'),
+(273, 1008409, 0.2, 'KG'),
 (273, 127, 0.005, 'KG'),
 (273, 89, 0.02, 'LTR'),
+(274, 1008409, 0.2, 'KG'),
 (274, 127, 0.005, 'KG'),
 (274, 89, 0.02, 'LTR'),
+(275, 1008409, 0.2, 'KG'),
 (275, 127, 0.005, 'KG'),
 (275, 89, 0.02, 'LTR'),
+(276, 1008409, 0.2, 'KG'),
 (276, 127, 0.005, 'KG'),
 (276, 89, 0.02, 'LTR'),
+(277, 1008409, 0.2, 'KG'),
 (277, 127, 0.005, 'KG'),
 (277, 89, 0.02, 'LTR'),
+(278, 1008409, 0.2, 'KG'),
 (278, 127, 0.005, 'KG'),
 (278, 89, 0.02, 'LTR'),
+(279, 1008409, 0.2, 'KG'),
 (279, 127, 0.005, 'KG'),
 (279, 89, 0.02, 'LTR'),
+(280, 1008409, 0.2, 'KG'),
 (280, 127, 0.005, 'KG'),
 (280, 89, 0.02, 'LTR'),
+(281, 1008409, 0.2, 'KG'),
 (281, 127, 0.005, 'KG'),
 (281, 89, 0.02, 'LTR'),
+(282, 1008409, 0.2, 'KG'),
 (282, 127, 0.005, 'KG'),
 (282, 89, 0.02, 'LTR'),
+(283, 1008409, 0.2, 'KG'),
 (283, 127, 0.005, 'KG'),
 (283, 89, 0.02, 'LTR'),
+(284, 1008409, 0.2, 'KG'),
 (284, 127, 0.005, 'KG'),
 (284, 89, 0.02, 'LTR'),
+(285, 1008409, 0.2, 'KG'),
 (285, 127, 0.005, 'KG'),
 (285, 89, 0.02, 'LTR'),
+(286, 1008409, 0.2, 'KG'),
 (286, 127, 0.005, 'KG'),
 (286, 89, 0.02, 'LTR'),
+(287, 1008409, 0.2, 'KG'),
 (287, 127, 0.005, 'KG'),
 (287, 89, 0.02, 'LTR'),
+(288, 1008409, 0.2, 'KG'),
 (288, 127, 0.005, 'KG'),
 (288, 89, 0.02, 'LTR'),
+(289, 1008409, 0.2, 'KG'),
 (289, 127, 0.005, 'KG'),
 (289, 89, 0.02, 'LTR'),
+(290, 1008409, 0.2, 'KG'),
 (290, 127, 0.005, 'KG'),
 (290, 89, 0.02, 'LTR'),
+(291, 1008409, 0.2, 'KG'),
 (291, 127, 0.005, 'KG'),
 (291, 89, 0.02, 'LTR'),
+(292, 1008409, 0.2, 'KG'),
 (292, 127, 0.005, 'KG'),
 (292, 89, 0.02, 'LTR'),
+(293, 1008409, 0.2, 'KG'),
 (293, 127, 0.005, 'KG'),
 (293, 89, 0.02, 'LTR'),
+(294, 1008409, 0.2, 'KG'),
 (294, 127, 0.005, 'KG'),
 (294, 89, 0.02, 'LTR'),
+(295, 1008409, 0.2, 'KG'),
 (295, 127, 0.005, 'KG'),
 (295, 89, 0.02, 'LTR'),
+(296, 1008409, 0.2, 'KG'),
 (296, 127, 0.005, 'KG'),
 (296, 89, 0.02, 'LTR'),
+(297, 1008409, 0.2, 'KG'),
 (297, 127, 0.005, 'KG'),
 (297, 89, 0.02, 'LTR'),
+(298, 1008409, 0.2, 'KG'),
 (298, 127, 0.005, 'KG'),
 (298, 89, 0.02, 'LTR'),
+(299, 1008409, 0.2, 'KG'),
 (299, 127, 0.005, 'KG'),
 (299, 89, 0.02, 'LTR'),
+(300, 1008409, 0.2, 'KG'),
 (300, 127, 0.005, 'KG'),
 (300, 89, 0.02, 'LTR'),
+(301, 1008409, 0.2, 'KG'),
 (301, 127, 0.005, 'KG'),
 (301, 89, 0.02, 'LTR'),
+(302, 1083105, 0.2, 'KG'),
 (302, 166, 0.05, 'KG'),
+(303, 1083105, 0.2, 'KG'),
 (303, 166, 0.05, 'KG'),
+(304, 1083105, 0.2, 'KG'),
 (304, 166, 0.05, 'KG'),
+(305, 1083105, 0.2, 'KG'),
 (305, 166, 0.05, 'KG'),
+(306, 1083105, 0.2, 'KG'),
 (306, 166, 0.05, 'KG'),
+(307, 1083105, 0.2, 'KG'),
 (307, 166, 0.05, 'KG'),
+(308, 1083105, 0.2, 'KG'),
 (308, 166, 0.05, 'KG'),
+(309, 1083105, 0.2, 'KG'),
 (309, 166, 0.05, 'KG'),
+(310, 1083105, 0.2, 'KG'),
 (310, 166, 0.05, 'KG'),
+(311, 1083105, 0.2, 'KG'),
 (311, 166, 0.05, 'KG'),
+(312, 1083105, 0.2, 'KG'),
 (312, 166, 0.05, 'KG'),
+(313, 1008409, 0.2, 'KG'),
 (313, 127, 0.005, 'KG'),
 (313, 89, 0.02, 'LTR'),
+(314, 1008409, 0.2, 'KG'),
 (314, 127, 0.005, 'KG'),
 (314, 89, 0.02, 'LTR'),
+(315, 1008409, 0.2, 'KG'),
 (315, 127, 0.005, 'KG'),
 (315, 89, 0.02, 'LTR'),
+(316, 1008409, 0.2, 'KG'),
 (316, 127, 0.005, 'KG'),
 (316, 89, 0.02, 'LTR'),
+(317, 1008409, 0.2, 'KG'),
 (317, 127, 0.005, 'KG'),
 (317, 89, 0.02, 'LTR'),
+(318, 1008409, 0.2, 'KG'),
 (318, 127, 0.005, 'KG'),
 (318, 89, 0.02, 'LTR'),
+(319, 1008409, 0.2, 'KG'),
 (319, 127, 0.005, 'KG'),
 (319, 89, 0.02, 'LTR'),
+(320, 1008409, 0.2, 'KG'),
 (320, 127, 0.005, 'KG'),
 (320, 89, 0.02, 'LTR'),
+(321, 1008409, 0.2, 'KG'),
 (321, 127, 0.005, 'KG'),
 (321, 89, 0.02, 'LTR'),
+(322, 1008409, 0.2, 'KG'),
 (322, 127, 0.005, 'KG'),
 (322, 89, 0.02, 'LTR'),
+(323, 1008409, 0.2, 'KG'),
 (323, 127, 0.005, 'KG'),
 (323, 89, 0.02, 'LTR'),
+(324, 1008409, 0.2, 'KG'),
 (324, 127, 0.005, 'KG'),
 (324, 89, 0.02, 'LTR'),
+(325, 1008409, 0.2, 'KG'),
 (325, 127, 0.005, 'KG'),
 (325, 89, 0.02, 'LTR'),
+(326, 1008409, 0.2, 'KG'),
 (326, 127, 0.005, 'KG'),
 (326, 89, 0.02, 'LTR'),
+(327, 1008409, 0.2, 'KG'),
 (327, 127, 0.005, 'KG'),
 (327, 89, 0.02, 'LTR'),
+(328, 1008409, 0.2, 'KG'),
 (328, 127, 0.005, 'KG'),
 (328, 89, 0.02, 'LTR'),
+(329, 1008409, 0.2, 'KG'),
 (329, 127, 0.005, 'KG'),
 (329, 89, 0.02, 'LTR'),
+(330, 1008409, 0.2, 'KG'),
 (330, 127, 0.005, 'KG'),
 (330, 89, 0.02, 'LTR'),
+(331, 1008409, 0.2, 'KG'),
 (331, 127, 0.005, 'KG'),
 (331, 89, 0.02, 'LTR'),
+(332, 1008409, 0.2, 'KG'),
 (332, 127, 0.005, 'KG'),
-(332, 89, 0.02, 'LTR')
-ON CONFLICT DO NOTHING;
-INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
+(332, 89, 0.02, 'LTR'),
+(333, 1008409, 0.2, 'KG'),
 (333, 127, 0.005, 'KG'),
 (333, 89, 0.02, 'LTR'),
+(334, 1008409, 0.2, 'KG'),
 (334, 127, 0.005, 'KG'),
 (334, 89, 0.02, 'LTR'),
+(335, 1008409, 0.2, 'KG'),
 (335, 127, 0.005, 'KG'),
 (335, 89, 0.02, 'LTR'),
+(336, 1008409, 0.2, 'KG'),
 (336, 127, 0.005, 'KG'),
 (336, 89, 0.02, 'LTR'),
+(337, 1008409, 0.2, 'KG'),
 (337, 127, 0.005, 'KG'),
 (337, 89, 0.02, 'LTR'),
+(338, 1008409, 0.2, 'KG'),
 (338, 127, 0.005, 'KG'),
 (338, 89, 0.02, 'LTR'),
+(339, 1008409, 0.2, 'KG'),
 (339, 127, 0.005, 'KG'),
 (339, 89, 0.02, 'LTR'),
+(340, 1008409, 0.2, 'KG'),
 (340, 127, 0.005, 'KG'),
 (340, 89, 0.02, 'LTR'),
+(341, 1008409, 0.2, 'KG'),
 (341, 127, 0.005, 'KG'),
 (341, 89, 0.02, 'LTR'),
+(342, 1008409, 0.2, 'KG'),
 (342, 127, 0.005, 'KG'),
 (342, 89, 0.02, 'LTR'),
+(343, 1008409, 0.2, 'KG'),
 (343, 127, 0.005, 'KG'),
 (343, 89, 0.02, 'LTR'),
+(344, 1008409, 0.2, 'KG'),
 (344, 127, 0.005, 'KG'),
 (344, 89, 0.02, 'LTR'),
+(345, 1008409, 0.2, 'KG'),
 (345, 127, 0.005, 'KG'),
 (345, 89, 0.02, 'LTR'),
+(346, 1008409, 0.2, 'KG'),
 (346, 127, 0.005, 'KG'),
 (346, 89, 0.02, 'LTR'),
+(347, 1008409, 0.2, 'KG'),
 (347, 127, 0.005, 'KG'),
 (347, 89, 0.02, 'LTR'),
+(348, 1008409, 0.2, 'KG'),
 (348, 127, 0.005, 'KG'),
 (348, 89, 0.02, 'LTR'),
+(349, 1008409, 0.2, 'KG'),
 (349, 127, 0.005, 'KG'),
 (349, 89, 0.02, 'LTR'),
+(350, 1083105, 0.2, 'KG'),
 (350, 166, 0.05, 'KG'),
+(351, 1083105, 0.2, 'KG'),
 (351, 166, 0.05, 'KG'),
+(352, 1083105, 0.2, 'KG'),
 (352, 166, 0.05, 'KG'),
+(353, 1083105, 0.2, 'KG'),
 (353, 166, 0.05, 'KG'),
+(354, 1083105, 0.2, 'KG'),
 (354, 166, 0.05, 'KG'),
+(355, 1083105, 0.2, 'KG'),
 (355, 166, 0.05, 'KG'),
+(356, 1083105, 0.2, 'KG'),
 (356, 166, 0.05, 'KG'),
+(357, 1083105, 0.2, 'KG'),
 (357, 166, 0.05, 'KG'),
+(358, 1083105, 0.2, 'KG'),
 (358, 166, 0.05, 'KG'),
+(359, 1083105, 0.2, 'KG'),
 (359, 166, 0.05, 'KG'),
+(360, 1083105, 0.2, 'KG'),
 (360, 166, 0.05, 'KG'),
+(361, 1083105, 0.2, 'KG'),
 (361, 166, 0.05, 'KG'),
+(362, 1083105, 0.2, 'KG'),
 (362, 166, 0.05, 'KG'),
+(363, 1083105, 0.2, 'KG'),
 (363, 166, 0.05, 'KG'),
+(364, 1008409, 0.2, 'KG'),
 (364, 127, 0.005, 'KG'),
 (364, 89, 0.02, 'LTR'),
+(365, 1008409, 0.2, 'KG'),
 (365, 127, 0.005, 'KG'),
 (365, 89, 0.02, 'LTR'),
+(366, 1008409, 0.2, 'KG'),
 (366, 127, 0.005, 'KG'),
 (366, 89, 0.02, 'LTR'),
+(367, 1008409, 0.2, 'KG'),
 (367, 127, 0.005, 'KG'),
 (367, 89, 0.02, 'LTR'),
+(368, 1008409, 0.2, 'KG'),
 (368, 127, 0.005, 'KG'),
 (368, 89, 0.02, 'LTR'),
+(369, 1008409, 0.2, 'KG'),
 (369, 127, 0.005, 'KG'),
 (369, 89, 0.02, 'LTR'),
+(370, 1008409, 0.2, 'KG'),
 (370, 127, 0.005, 'KG'),
 (370, 89, 0.02, 'LTR'),
+(371, 1008409, 0.2, 'KG'),
 (371, 127, 0.005, 'KG'),
 (371, 89, 0.02, 'LTR'),
+(372, 1008409, 0.2, 'KG'),
 (372, 127, 0.005, 'KG'),
 (372, 89, 0.02, 'LTR'),
+(373, 1008409, 0.2, 'KG'),
 (373, 127, 0.005, 'KG'),
 (373, 89, 0.02, 'LTR'),
+(374, 1008409, 0.2, 'KG'),
 (374, 127, 0.005, 'KG'),
 (374, 89, 0.02, 'LTR'),
+(375, 1008409, 0.2, 'KG'),
 (375, 127, 0.005, 'KG'),
 (375, 89, 0.02, 'LTR'),
+(376, 1008409, 0.2, 'KG'),
 (376, 127, 0.005, 'KG'),
 (376, 89, 0.02, 'LTR'),
+(377, 1008409, 0.2, 'KG'),
 (377, 127, 0.005, 'KG'),
 (377, 89, 0.02, 'LTR'),
+(378, 1008409, 0.2, 'KG'),
 (378, 127, 0.005, 'KG'),
 (378, 89, 0.02, 'LTR'),
+(379, 1008409, 0.2, 'KG'),
 (379, 127, 0.005, 'KG'),
 (379, 89, 0.02, 'LTR'),
+(380, 1083105, 0.2, 'KG'),
 (380, 166, 0.05, 'KG'),
+(381, 1083105, 0.2, 'KG'),
 (381, 166, 0.05, 'KG'),
+(382, 1083105, 0.2, 'KG'),
 (382, 166, 0.05, 'KG'),
+(383, 1083105, 0.2, 'KG'),
 (383, 166, 0.05, 'KG'),
+(384, 1008409, 0.2, 'KG'),
 (384, 127, 0.005, 'KG'),
 (384, 89, 0.02, 'LTR'),
+(385, 1008409, 0.2, 'KG'),
 (385, 127, 0.005, 'KG'),
 (385, 89, 0.02, 'LTR'),
+(386, 1008409, 0.2, 'KG'),
 (386, 127, 0.005, 'KG'),
 (386, 89, 0.02, 'LTR'),
+(387, 1008409, 0.2, 'KG'),
 (387, 127, 0.005, 'KG'),
 (387, 89, 0.02, 'LTR'),
+(388, 1008409, 0.2, 'KG'),
 (388, 127, 0.005, 'KG'),
 (388, 89, 0.02, 'LTR'),
+(389, 1008409, 0.2, 'KG'),
 (389, 127, 0.005, 'KG'),
 (389, 89, 0.02, 'LTR'),
+(390, 1008409, 0.2, 'KG'),
 (390, 127, 0.005, 'KG'),
 (390, 89, 0.02, 'LTR'),
+(391, 1008409, 0.2, 'KG'),
 (391, 127, 0.005, 'KG'),
 (391, 89, 0.02, 'LTR'),
+(392, 1008409, 0.2, 'KG'),
 (392, 127, 0.005, 'KG'),
 (392, 89, 0.02, 'LTR'),
 (393, 166, 0.15, 'KG'),
@@ -2733,72 +3202,106 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (409, 61, 0.05, 'KG'),
 (409, 149, 0.001, 'KG'),
 (409, 13, 0.2, 'LTR'),
+(410, 1008409, 0.2, 'KG'),
 (410, 127, 0.005, 'KG'),
 (410, 89, 0.02, 'LTR'),
+(411, 1008409, 0.2, 'KG'),
 (411, 127, 0.005, 'KG'),
 (411, 89, 0.02, 'LTR'),
+(412, 1008409, 0.2, 'KG'),
 (412, 127, 0.005, 'KG'),
 (412, 89, 0.02, 'LTR'),
+(413, 1008409, 0.2, 'KG'),
 (413, 127, 0.005, 'KG'),
 (413, 89, 0.02, 'LTR'),
+(414, 1008409, 0.2, 'KG'),
 (414, 127, 0.005, 'KG'),
 (414, 89, 0.02, 'LTR'),
+(415, 1008409, 0.2, 'KG'),
 (415, 127, 0.005, 'KG'),
 (415, 89, 0.02, 'LTR'),
+(416, 1008409, 0.2, 'KG'),
 (416, 127, 0.005, 'KG'),
 (416, 89, 0.02, 'LTR'),
+(417, 1008409, 0.2, 'KG'),
 (417, 127, 0.005, 'KG'),
 (417, 89, 0.02, 'LTR'),
+(418, 1008409, 0.2, 'KG'),
 (418, 127, 0.005, 'KG'),
 (418, 89, 0.02, 'LTR'),
+(419, 1008409, 0.2, 'KG'),
 (419, 127, 0.005, 'KG'),
 (419, 89, 0.02, 'LTR'),
+(420, 1008409, 0.2, 'KG'),
 (420, 127, 0.005, 'KG'),
 (420, 89, 0.02, 'LTR'),
+(421, 1008409, 0.2, 'KG'),
 (421, 127, 0.005, 'KG'),
 (421, 89, 0.02, 'LTR'),
+(422, 1008409, 0.2, 'KG'),
 (422, 127, 0.005, 'KG'),
 (422, 89, 0.02, 'LTR'),
+(423, 1008409, 0.2, 'KG'),
 (423, 127, 0.005, 'KG'),
 (423, 89, 0.02, 'LTR'),
+(424, 1008409, 0.2, 'KG'),
 (424, 127, 0.005, 'KG'),
 (424, 89, 0.02, 'LTR'),
+(425, 1008409, 0.2, 'KG'),
 (425, 127, 0.005, 'KG'),
 (425, 89, 0.02, 'LTR'),
+(426, 1008409, 0.2, 'KG'),
 (426, 127, 0.005, 'KG'),
 (426, 89, 0.02, 'LTR'),
+(427, 1008409, 0.2, 'KG'),
 (427, 127, 0.005, 'KG'),
 (427, 89, 0.02, 'LTR'),
+(428, 1008409, 0.2, 'KG'),
 (428, 127, 0.005, 'KG'),
 (428, 89, 0.02, 'LTR'),
+(429, 1008409, 0.2, 'KG'),
 (429, 127, 0.005, 'KG'),
 (429, 89, 0.02, 'LTR'),
+(430, 1008409, 0.2, 'KG'),
 (430, 127, 0.005, 'KG'),
 (430, 89, 0.02, 'LTR'),
+(431, 1008409, 0.2, 'KG'),
 (431, 127, 0.005, 'KG'),
 (431, 89, 0.02, 'LTR'),
+(432, 1008409, 0.2, 'KG'),
 (432, 127, 0.005, 'KG'),
 (432, 89, 0.02, 'LTR'),
+(433, 1008409, 0.2, 'KG'),
 (433, 127, 0.005, 'KG'),
 (433, 89, 0.02, 'LTR'),
+(434, 1008409, 0.2, 'KG'),
 (434, 127, 0.005, 'KG'),
 (434, 89, 0.02, 'LTR'),
+(435, 1008409, 0.2, 'KG'),
 (435, 127, 0.005, 'KG'),
 (435, 89, 0.02, 'LTR'),
+(436, 1008409, 0.2, 'KG'),
 (436, 127, 0.005, 'KG'),
 (436, 89, 0.02, 'LTR'),
+(437, 1008409, 0.2, 'KG'),
 (437, 127, 0.005, 'KG'),
 (437, 89, 0.02, 'LTR'),
+(438, 1008409, 0.2, 'KG'),
 (438, 127, 0.005, 'KG'),
 (438, 89, 0.02, 'LTR'),
+(439, 1008409, 0.2, 'KG'),
 (439, 127, 0.005, 'KG'),
 (439, 89, 0.02, 'LTR'),
+(440, 1008409, 0.2, 'KG'),
 (440, 127, 0.005, 'KG'),
 (440, 89, 0.02, 'LTR'),
+(441, 1008409, 0.2, 'KG'),
 (441, 127, 0.005, 'KG'),
 (441, 89, 0.02, 'LTR'),
+(442, 1008409, 0.2, 'KG'),
 (442, 127, 0.005, 'KG'),
 (442, 89, 0.02, 'LTR'),
+(443, 1008409, 0.2, 'KG'),
 (443, 127, 0.005, 'KG'),
 (443, 89, 0.02, 'LTR'),
 (444, 166, 0.15, 'KG'),
@@ -2841,46 +3344,67 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (453, 61, 0.05, 'KG'),
 (453, 149, 0.001, 'KG'),
 (453, 13, 0.2, 'LTR'),
+(454, 1008409, 0.2, 'KG'),
 (454, 127, 0.005, 'KG'),
 (454, 89, 0.02, 'LTR'),
+(455, 1008409, 0.2, 'KG'),
 (455, 127, 0.005, 'KG'),
 (455, 89, 0.02, 'LTR'),
+(456, 1008409, 0.2, 'KG'),
 (456, 127, 0.005, 'KG'),
 (456, 89, 0.02, 'LTR'),
+(457, 1008409, 0.2, 'KG'),
 (457, 127, 0.005, 'KG'),
 (457, 89, 0.02, 'LTR'),
+(458, 1008409, 0.2, 'KG'),
 (458, 127, 0.005, 'KG'),
 (458, 89, 0.02, 'LTR'),
+(459, 1008409, 0.2, 'KG'),
 (459, 127, 0.005, 'KG'),
 (459, 89, 0.02, 'LTR'),
+(460, 1008409, 0.2, 'KG'),
 (460, 127, 0.005, 'KG'),
 (460, 89, 0.02, 'LTR'),
+(461, 1008409, 0.2, 'KG'),
 (461, 127, 0.005, 'KG'),
 (461, 89, 0.02, 'LTR'),
+(462, 1008409, 0.2, 'KG'),
 (462, 127, 0.005, 'KG'),
 (462, 89, 0.02, 'LTR'),
+(463, 1008409, 0.2, 'KG'),
 (463, 127, 0.005, 'KG'),
 (463, 89, 0.02, 'LTR'),
+(464, 1008409, 0.2, 'KG'),
 (464, 127, 0.005, 'KG'),
 (464, 89, 0.02, 'LTR'),
+(465, 1008409, 0.2, 'KG'),
 (465, 127, 0.005, 'KG'),
 (465, 89, 0.02, 'LTR'),
+(466, 1008409, 0.2, 'KG'),
 (466, 127, 0.005, 'KG'),
 (466, 89, 0.02, 'LTR'),
+(467, 1008409, 0.2, 'KG'),
 (467, 127, 0.005, 'KG'),
 (467, 89, 0.02, 'LTR'),
+(468, 1008409, 0.2, 'KG'),
 (468, 127, 0.005, 'KG'),
 (468, 89, 0.02, 'LTR'),
+(469, 1008409, 0.2, 'KG'),
 (469, 127, 0.005, 'KG'),
 (469, 89, 0.02, 'LTR'),
+(470, 1008409, 0.2, 'KG'),
 (470, 127, 0.005, 'KG'),
 (470, 89, 0.02, 'LTR'),
+(471, 1008409, 0.2, 'KG'),
 (471, 127, 0.005, 'KG'),
 (471, 89, 0.02, 'LTR'),
+(472, 1008409, 0.2, 'KG'),
 (472, 127, 0.005, 'KG'),
 (472, 89, 0.02, 'LTR'),
+(473, 1008409, 0.2, 'KG'),
 (473, 127, 0.005, 'KG'),
 (473, 89, 0.02, 'LTR'),
+(474, 1008409, 0.2, 'KG'),
 (474, 127, 0.005, 'KG'),
 (474, 89, 0.02, 'LTR'),
 (475, 166, 0.15, 'KG'),
@@ -3017,16 +3541,22 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (508, 61, 0.05, 'KG'),
 (508, 149, 0.001, 'KG'),
 (508, 13, 0.2, 'LTR'),
+(509, 1008409, 0.2, 'KG'),
 (509, 127, 0.005, 'KG'),
 (509, 89, 0.02, 'LTR'),
+(510, 1008409, 0.2, 'KG'),
 (510, 127, 0.005, 'KG'),
 (510, 89, 0.02, 'LTR'),
+(511, 1008409, 0.2, 'KG'),
 (511, 127, 0.005, 'KG'),
 (511, 89, 0.02, 'LTR'),
+(512, 1008409, 0.2, 'KG'),
 (512, 127, 0.005, 'KG'),
 (512, 89, 0.02, 'LTR'),
+(513, 1008409, 0.2, 'KG'),
 (513, 127, 0.005, 'KG'),
 (513, 89, 0.02, 'LTR'),
+(514, 1008409, 0.2, 'KG'),
 (514, 127, 0.005, 'KG'),
 (514, 89, 0.02, 'LTR'),
 (515, 166, 0.15, 'KG'),
@@ -3057,10 +3587,16 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (521, 61, 0.05, 'KG'),
 (521, 149, 0.001, 'KG'),
 (521, 13, 0.2, 'LTR'),
+(522, 1008409, 0.2, 'KG'),
 (522, 127, 0.005, 'KG'),
 (522, 89, 0.02, 'LTR'),
-(523, 127, 0.005, 'KG'),
+(523, 1008409, 0.2, 'KG'),
+(523, 127, 0.005, 'KG')
+ON CONFLICT DO NOTHING;
+
+INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (523, 89, 0.02, 'LTR'),
+(524, 1008409, 0.2, 'KG'),
 (524, 127, 0.005, 'KG'),
 (524, 89, 0.02, 'LTR'),
 (525, 166, 0.15, 'KG'),
@@ -3155,126 +3691,187 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (547, 61, 0.05, 'KG'),
 (547, 149, 0.001, 'KG'),
 (547, 13, 0.2, 'LTR'),
+(548, 1008409, 0.2, 'KG'),
 (548, 127, 0.005, 'KG'),
 (548, 89, 0.02, 'LTR'),
+(549, 1008409, 0.2, 'KG'),
 (549, 127, 0.005, 'KG'),
 (549, 89, 0.02, 'LTR'),
+(550, 1008409, 0.2, 'KG'),
 (550, 127, 0.005, 'KG'),
 (550, 89, 0.02, 'LTR'),
+(551, 1008409, 0.2, 'KG'),
 (551, 127, 0.005, 'KG'),
 (551, 89, 0.02, 'LTR'),
+(552, 1008409, 0.2, 'KG'),
 (552, 127, 0.005, 'KG'),
 (552, 89, 0.02, 'LTR'),
+(553, 1008409, 0.2, 'KG'),
 (553, 127, 0.005, 'KG'),
 (553, 89, 0.02, 'LTR'),
+(554, 1008409, 0.2, 'KG'),
 (554, 127, 0.005, 'KG'),
 (554, 89, 0.02, 'LTR'),
+(555, 1008409, 0.2, 'KG'),
 (555, 127, 0.005, 'KG'),
 (555, 89, 0.02, 'LTR'),
+(556, 1008409, 0.2, 'KG'),
 (556, 127, 0.005, 'KG'),
 (556, 89, 0.02, 'LTR'),
+(557, 1008409, 0.2, 'KG'),
 (557, 127, 0.005, 'KG'),
 (557, 89, 0.02, 'LTR'),
+(558, 1008409, 0.2, 'KG'),
 (558, 127, 0.005, 'KG'),
 (558, 89, 0.02, 'LTR'),
+(559, 1008409, 0.2, 'KG'),
 (559, 127, 0.005, 'KG'),
 (559, 89, 0.02, 'LTR'),
+(560, 1008409, 0.2, 'KG'),
 (560, 127, 0.005, 'KG'),
 (560, 89, 0.02, 'LTR'),
+(561, 1008409, 0.2, 'KG'),
 (561, 127, 0.005, 'KG'),
 (561, 89, 0.02, 'LTR'),
+(562, 1008409, 0.2, 'KG'),
 (562, 127, 0.005, 'KG'),
 (562, 89, 0.02, 'LTR'),
+(563, 1008409, 0.2, 'KG'),
 (563, 127, 0.005, 'KG'),
 (563, 89, 0.02, 'LTR'),
+(564, 1008409, 0.2, 'KG'),
 (564, 127, 0.005, 'KG'),
 (564, 89, 0.02, 'LTR'),
+(565, 1008409, 0.2, 'KG'),
 (565, 127, 0.005, 'KG'),
 (565, 89, 0.02, 'LTR'),
+(566, 1008409, 0.2, 'KG'),
 (566, 127, 0.005, 'KG'),
 (566, 89, 0.02, 'LTR'),
+(567, 1008409, 0.2, 'KG'),
 (567, 127, 0.005, 'KG'),
 (567, 89, 0.02, 'LTR'),
+(568, 1008409, 0.2, 'KG'),
 (568, 127, 0.005, 'KG'),
 (568, 89, 0.02, 'LTR'),
+(569, 1008409, 0.2, 'KG'),
 (569, 127, 0.005, 'KG'),
 (569, 89, 0.02, 'LTR'),
+(570, 1008409, 0.2, 'KG'),
 (570, 127, 0.005, 'KG'),
 (570, 89, 0.02, 'LTR'),
+(571, 1008409, 0.2, 'KG'),
 (571, 127, 0.005, 'KG'),
 (571, 89, 0.02, 'LTR'),
+(572, 1008409, 0.2, 'KG'),
 (572, 127, 0.005, 'KG'),
 (572, 89, 0.02, 'LTR'),
+(573, 1008409, 0.2, 'KG'),
 (573, 127, 0.005, 'KG'),
 (573, 89, 0.02, 'LTR'),
+(574, 1008409, 0.2, 'KG'),
 (574, 127, 0.005, 'KG'),
 (574, 89, 0.02, 'LTR'),
+(575, 1008409, 0.2, 'KG'),
 (575, 127, 0.005, 'KG'),
 (575, 89, 0.02, 'LTR'),
+(576, 1008409, 0.2, 'KG'),
 (576, 127, 0.005, 'KG'),
 (576, 89, 0.02, 'LTR'),
+(577, 1008409, 0.2, 'KG'),
 (577, 127, 0.005, 'KG'),
 (577, 89, 0.02, 'LTR'),
+(578, 1008409, 0.2, 'KG'),
 (578, 127, 0.005, 'KG'),
 (578, 89, 0.02, 'LTR'),
+(579, 1008409, 0.2, 'KG'),
 (579, 127, 0.005, 'KG'),
 (579, 89, 0.02, 'LTR'),
+(580, 1008409, 0.2, 'KG'),
 (580, 127, 0.005, 'KG'),
 (580, 89, 0.02, 'LTR'),
+(581, 1008409, 0.2, 'KG'),
 (581, 127, 0.005, 'KG'),
 (581, 89, 0.02, 'LTR'),
+(582, 1008409, 0.2, 'KG'),
 (582, 127, 0.005, 'KG'),
 (582, 89, 0.02, 'LTR'),
+(583, 1008409, 0.2, 'KG'),
 (583, 127, 0.005, 'KG'),
 (583, 89, 0.02, 'LTR'),
+(584, 1008409, 0.2, 'KG'),
 (584, 127, 0.005, 'KG'),
 (584, 89, 0.02, 'LTR'),
+(585, 1008409, 0.2, 'KG'),
 (585, 127, 0.005, 'KG'),
 (585, 89, 0.02, 'LTR'),
+(586, 1008409, 0.2, 'KG'),
 (586, 127, 0.005, 'KG'),
 (586, 89, 0.02, 'LTR'),
+(587, 1008409, 0.2, 'KG'),
 (587, 127, 0.005, 'KG'),
 (587, 89, 0.02, 'LTR'),
+(588, 1008409, 0.2, 'KG'),
 (588, 127, 0.005, 'KG'),
 (588, 89, 0.02, 'LTR'),
+(589, 1008409, 0.2, 'KG'),
 (589, 127, 0.005, 'KG'),
 (589, 89, 0.02, 'LTR'),
+(590, 1008409, 0.2, 'KG'),
 (590, 127, 0.005, 'KG'),
 (590, 89, 0.02, 'LTR'),
+(591, 1008409, 0.2, 'KG'),
 (591, 127, 0.005, 'KG'),
 (591, 89, 0.02, 'LTR'),
+(592, 1008409, 0.2, 'KG'),
 (592, 127, 0.005, 'KG'),
 (592, 89, 0.02, 'LTR'),
+(593, 1008409, 0.2, 'KG'),
 (593, 127, 0.005, 'KG'),
 (593, 89, 0.02, 'LTR'),
+(594, 1008409, 0.2, 'KG'),
 (594, 127, 0.005, 'KG'),
 (594, 89, 0.02, 'LTR'),
+(595, 1008409, 0.2, 'KG'),
 (595, 127, 0.005, 'KG'),
 (595, 89, 0.02, 'LTR'),
+(596, 1008409, 0.2, 'KG'),
 (596, 127, 0.005, 'KG'),
 (596, 89, 0.02, 'LTR'),
+(597, 1008409, 0.2, 'KG'),
 (597, 127, 0.005, 'KG'),
 (597, 89, 0.02, 'LTR'),
+(598, 1008409, 0.2, 'KG'),
 (598, 127, 0.005, 'KG'),
 (598, 89, 0.02, 'LTR'),
+(599, 1008409, 0.2, 'KG'),
 (599, 127, 0.005, 'KG'),
 (599, 89, 0.02, 'LTR'),
+(600, 1008409, 0.2, 'KG'),
 (600, 127, 0.005, 'KG'),
 (600, 89, 0.02, 'LTR'),
+(601, 1008409, 0.2, 'KG'),
 (601, 127, 0.005, 'KG'),
 (601, 89, 0.02, 'LTR'),
+(602, 1008409, 0.2, 'KG'),
 (602, 127, 0.005, 'KG'),
 (602, 89, 0.02, 'LTR'),
+(603, 1008409, 0.2, 'KG'),
 (603, 127, 0.005, 'KG'),
 (603, 89, 0.02, 'LTR'),
+(604, 1008409, 0.2, 'KG'),
 (604, 127, 0.005, 'KG'),
 (604, 89, 0.02, 'LTR'),
+(605, 1008409, 0.2, 'KG'),
 (605, 127, 0.005, 'KG'),
 (605, 89, 0.02, 'LTR'),
+(606, 1008409, 0.2, 'KG'),
 (606, 127, 0.005, 'KG'),
 (606, 89, 0.02, 'LTR'),
+(607, 1008409, 0.2, 'KG'),
 (607, 127, 0.005, 'KG'),
 (607, 89, 0.02, 'LTR'),
+(608, 1039230, 0.25, 'KG'),
 (608, 117, 0.2, 'KG'),
 (608, 89, 0.05, 'LTR'),
 (608, 61, 0.02, 'KG'),
@@ -3282,6 +3879,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (608, 163, 0.001, 'KG'),
 (608, 165, 0.001, 'KG'),
 (608, 164, 0.001, 'KG'),
+(608, 1211973, 0.1, 'KG'),
+(609, 1039230, 0.25, 'KG'),
 (609, 117, 0.2, 'KG'),
 (609, 89, 0.05, 'LTR'),
 (609, 61, 0.02, 'KG'),
@@ -3289,6 +3888,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (609, 163, 0.001, 'KG'),
 (609, 165, 0.001, 'KG'),
 (609, 164, 0.001, 'KG'),
+(609, 1211973, 0.1, 'KG'),
+(610, 1039230, 0.25, 'KG'),
 (610, 117, 0.2, 'KG'),
 (610, 89, 0.05, 'LTR'),
 (610, 61, 0.02, 'KG'),
@@ -3296,6 +3897,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (610, 163, 0.001, 'KG'),
 (610, 165, 0.001, 'KG'),
 (610, 164, 0.001, 'KG'),
+(610, 1211973, 0.1, 'KG'),
+(611, 1039230, 0.25, 'KG'),
 (611, 117, 0.2, 'KG'),
 (611, 89, 0.05, 'LTR'),
 (611, 61, 0.02, 'KG'),
@@ -3303,6 +3906,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (611, 163, 0.001, 'KG'),
 (611, 165, 0.001, 'KG'),
 (611, 164, 0.001, 'KG'),
+(611, 1211973, 0.1, 'KG'),
+(612, 1039230, 0.25, 'KG'),
 (612, 117, 0.2, 'KG'),
 (612, 89, 0.05, 'LTR'),
 (612, 61, 0.02, 'KG'),
@@ -3310,6 +3915,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (612, 163, 0.001, 'KG'),
 (612, 165, 0.001, 'KG'),
 (612, 164, 0.001, 'KG'),
+(612, 1211973, 0.1, 'KG'),
+(613, 1039230, 0.25, 'KG'),
 (613, 117, 0.2, 'KG'),
 (613, 89, 0.05, 'LTR'),
 (613, 61, 0.02, 'KG'),
@@ -3317,6 +3924,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (613, 163, 0.001, 'KG'),
 (613, 165, 0.001, 'KG'),
 (613, 164, 0.001, 'KG'),
+(613, 1211973, 0.1, 'KG'),
+(614, 1039230, 0.25, 'KG'),
 (614, 117, 0.2, 'KG'),
 (614, 89, 0.05, 'LTR'),
 (614, 61, 0.02, 'KG'),
@@ -3324,6 +3933,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (614, 163, 0.001, 'KG'),
 (614, 165, 0.001, 'KG'),
 (614, 164, 0.001, 'KG'),
+(614, 1211973, 0.1, 'KG'),
+(615, 1039230, 0.25, 'KG'),
 (615, 117, 0.2, 'KG'),
 (615, 89, 0.05, 'LTR'),
 (615, 61, 0.02, 'KG'),
@@ -3331,6 +3942,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (615, 163, 0.001, 'KG'),
 (615, 165, 0.001, 'KG'),
 (615, 164, 0.001, 'KG'),
+(615, 1211973, 0.1, 'KG'),
+(616, 1039230, 0.25, 'KG'),
 (616, 117, 0.2, 'KG'),
 (616, 89, 0.05, 'LTR'),
 (616, 61, 0.02, 'KG'),
@@ -3338,6 +3951,7 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (616, 163, 0.001, 'KG'),
 (616, 165, 0.001, 'KG'),
 (616, 164, 0.001, 'KG'),
+(616, 1211973, 0.1, 'KG'),
 (617, 127, 0.005, 'KG'),
 (617, 1, 0.002, 'KG'),
 (617, 89, 0.01, 'LTR'),
@@ -3413,330 +4027,490 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (631, 89, 0.01, 'LTR'),
 (631, 19, 0.001, 'KG'),
 (631, 22, 0.001, 'KG'),
+(632, 1008409, 0.2, 'KG'),
 (632, 127, 0.005, 'KG'),
 (632, 89, 0.02, 'LTR'),
+(633, 1008409, 0.2, 'KG'),
 (633, 127, 0.005, 'KG'),
 (633, 89, 0.02, 'LTR'),
+(634, 1008409, 0.2, 'KG'),
 (634, 127, 0.005, 'KG'),
 (634, 89, 0.02, 'LTR'),
+(635, 1008409, 0.2, 'KG'),
 (635, 127, 0.005, 'KG'),
 (635, 89, 0.02, 'LTR'),
+(636, 1008409, 0.2, 'KG'),
 (636, 127, 0.005, 'KG'),
 (636, 89, 0.02, 'LTR'),
+(637, 1008409, 0.2, 'KG'),
 (637, 127, 0.005, 'KG'),
 (637, 89, 0.02, 'LTR'),
+(638, 1008409, 0.2, 'KG'),
 (638, 127, 0.005, 'KG'),
 (638, 89, 0.02, 'LTR'),
+(639, 1008409, 0.2, 'KG'),
 (639, 127, 0.005, 'KG'),
 (639, 89, 0.02, 'LTR'),
+(640, 1008409, 0.2, 'KG'),
 (640, 127, 0.005, 'KG'),
 (640, 89, 0.02, 'LTR'),
+(641, 1008409, 0.2, 'KG'),
 (641, 127, 0.005, 'KG'),
 (641, 89, 0.02, 'LTR'),
+(642, 1008409, 0.2, 'KG'),
 (642, 127, 0.005, 'KG'),
 (642, 89, 0.02, 'LTR'),
+(643, 1008409, 0.2, 'KG'),
 (643, 127, 0.005, 'KG'),
 (643, 89, 0.02, 'LTR'),
+(644, 1008409, 0.2, 'KG'),
 (644, 127, 0.005, 'KG'),
 (644, 89, 0.02, 'LTR'),
+(645, 1008409, 0.2, 'KG'),
 (645, 127, 0.005, 'KG'),
 (645, 89, 0.02, 'LTR'),
+(646, 1008409, 0.2, 'KG'),
 (646, 127, 0.005, 'KG'),
 (646, 89, 0.02, 'LTR'),
+(647, 1008409, 0.2, 'KG'),
 (647, 127, 0.005, 'KG'),
 (647, 89, 0.02, 'LTR'),
+(648, 1008409, 0.2, 'KG'),
 (648, 127, 0.005, 'KG'),
 (648, 89, 0.02, 'LTR'),
+(649, 1008409, 0.2, 'KG'),
 (649, 127, 0.005, 'KG'),
 (649, 89, 0.02, 'LTR'),
+(650, 1008409, 0.2, 'KG'),
 (650, 127, 0.005, 'KG'),
 (650, 89, 0.02, 'LTR'),
+(651, 1008409, 0.2, 'KG'),
 (651, 127, 0.005, 'KG'),
 (651, 89, 0.02, 'LTR'),
+(652, 1008409, 0.2, 'KG'),
 (652, 127, 0.005, 'KG'),
 (652, 89, 0.02, 'LTR'),
+(653, 1008409, 0.2, 'KG'),
 (653, 127, 0.005, 'KG'),
 (653, 89, 0.02, 'LTR'),
+(654, 1008409, 0.2, 'KG'),
 (654, 127, 0.005, 'KG'),
 (654, 89, 0.02, 'LTR'),
+(655, 1008409, 0.2, 'KG'),
 (655, 127, 0.005, 'KG'),
 (655, 89, 0.02, 'LTR'),
+(656, 1008409, 0.2, 'KG'),
 (656, 127, 0.005, 'KG'),
 (656, 89, 0.02, 'LTR'),
+(657, 1008409, 0.2, 'KG'),
 (657, 127, 0.005, 'KG'),
 (657, 89, 0.02, 'LTR'),
+(658, 1008409, 0.2, 'KG'),
 (658, 127, 0.005, 'KG'),
 (658, 89, 0.02, 'LTR'),
+(659, 1008409, 0.2, 'KG'),
 (659, 127, 0.005, 'KG'),
 (659, 89, 0.02, 'LTR'),
+(660, 1008409, 0.2, 'KG'),
 (660, 127, 0.005, 'KG'),
 (660, 89, 0.02, 'LTR'),
+(661, 1008409, 0.2, 'KG'),
 (661, 127, 0.005, 'KG'),
 (661, 89, 0.02, 'LTR'),
+(662, 1008409, 0.2, 'KG'),
 (662, 127, 0.005, 'KG'),
 (662, 89, 0.02, 'LTR'),
+(663, 1008409, 0.2, 'KG'),
 (663, 127, 0.005, 'KG'),
 (663, 89, 0.02, 'LTR'),
+(664, 1008409, 0.2, 'KG'),
 (664, 127, 0.005, 'KG'),
 (664, 89, 0.02, 'LTR'),
+(665, 1008409, 0.2, 'KG'),
 (665, 127, 0.005, 'KG'),
 (665, 89, 0.02, 'LTR'),
+(666, 1008409, 0.2, 'KG'),
 (666, 127, 0.005, 'KG'),
 (666, 89, 0.02, 'LTR'),
+(667, 1008409, 0.2, 'KG'),
 (667, 127, 0.005, 'KG'),
 (667, 89, 0.02, 'LTR'),
+(668, 1008409, 0.2, 'KG'),
 (668, 127, 0.005, 'KG'),
 (668, 89, 0.02, 'LTR'),
+(669, 1008409, 0.2, 'KG'),
 (669, 127, 0.005, 'KG'),
 (669, 89, 0.02, 'LTR'),
+(670, 1008409, 0.2, 'KG'),
 (670, 127, 0.005, 'KG'),
 (670, 89, 0.02, 'LTR'),
+(671, 1008409, 0.2, 'KG'),
 (671, 127, 0.005, 'KG'),
 (671, 89, 0.02, 'LTR'),
+(672, 1008409, 0.2, 'KG'),
 (672, 127, 0.005, 'KG'),
 (672, 89, 0.02, 'LTR'),
+(673, 1008409, 0.2, 'KG'),
 (673, 127, 0.005, 'KG'),
 (673, 89, 0.02, 'LTR'),
+(674, 1008409, 0.2, 'KG'),
 (674, 127, 0.005, 'KG'),
 (674, 89, 0.02, 'LTR'),
+(675, 1008409, 0.2, 'KG'),
 (675, 127, 0.005, 'KG'),
 (675, 89, 0.02, 'LTR'),
+(676, 1008409, 0.2, 'KG'),
 (676, 127, 0.005, 'KG'),
 (676, 89, 0.02, 'LTR'),
+(677, 1008409, 0.2, 'KG'),
 (677, 127, 0.005, 'KG'),
 (677, 89, 0.02, 'LTR'),
+(678, 1008409, 0.2, 'KG'),
 (678, 127, 0.005, 'KG'),
 (678, 89, 0.02, 'LTR'),
+(679, 1008409, 0.2, 'KG'),
 (679, 127, 0.005, 'KG'),
 (679, 89, 0.02, 'LTR'),
+(680, 1008409, 0.2, 'KG'),
 (680, 127, 0.005, 'KG'),
 (680, 89, 0.02, 'LTR'),
+(681, 1008409, 0.2, 'KG'),
 (681, 127, 0.005, 'KG'),
 (681, 89, 0.02, 'LTR'),
+(682, 1008409, 0.2, 'KG'),
 (682, 127, 0.005, 'KG'),
 (682, 89, 0.02, 'LTR'),
+(683, 1008409, 0.2, 'KG'),
 (683, 127, 0.005, 'KG'),
 (683, 89, 0.02, 'LTR'),
+(684, 1008409, 0.2, 'KG'),
 (684, 127, 0.005, 'KG'),
 (684, 89, 0.02, 'LTR'),
+(685, 1008409, 0.2, 'KG'),
 (685, 127, 0.005, 'KG'),
 (685, 89, 0.02, 'LTR'),
+(686, 1008409, 0.2, 'KG'),
 (686, 127, 0.005, 'KG'),
 (686, 89, 0.02, 'LTR'),
+(687, 1008409, 0.2, 'KG'),
 (687, 127, 0.005, 'KG'),
 (687, 89, 0.02, 'LTR'),
+(688, 1008409, 0.2, 'KG'),
 (688, 127, 0.005, 'KG'),
 (688, 89, 0.02, 'LTR'),
+(689, 1008409, 0.2, 'KG'),
 (689, 127, 0.005, 'KG'),
 (689, 89, 0.02, 'LTR'),
+(690, 1008409, 0.2, 'KG'),
 (690, 127, 0.005, 'KG'),
 (690, 89, 0.02, 'LTR'),
+(691, 1008409, 0.2, 'KG'),
 (691, 127, 0.005, 'KG'),
 (691, 89, 0.02, 'LTR'),
+(692, 1008409, 0.2, 'KG'),
 (692, 127, 0.005, 'KG'),
 (692, 89, 0.02, 'LTR'),
+(693, 1008409, 0.2, 'KG'),
 (693, 127, 0.005, 'KG'),
 (693, 89, 0.02, 'LTR'),
+(694, 1008409, 0.2, 'KG'),
 (694, 127, 0.005, 'KG'),
 (694, 89, 0.02, 'LTR'),
+(695, 1008409, 0.2, 'KG'),
 (695, 127, 0.005, 'KG'),
 (695, 89, 0.02, 'LTR'),
+(696, 1008409, 0.2, 'KG'),
 (696, 127, 0.005, 'KG'),
 (696, 89, 0.02, 'LTR'),
+(697, 1008409, 0.2, 'KG'),
 (697, 127, 0.005, 'KG'),
 (697, 89, 0.02, 'LTR'),
+(698, 1008409, 0.2, 'KG'),
 (698, 127, 0.005, 'KG'),
 (698, 89, 0.02, 'LTR'),
+(699, 1008409, 0.2, 'KG'),
 (699, 127, 0.005, 'KG'),
 (699, 89, 0.02, 'LTR'),
+(700, 1008409, 0.2, 'KG'),
 (700, 127, 0.005, 'KG'),
 (700, 89, 0.02, 'LTR'),
+(701, 1008409, 0.2, 'KG'),
 (701, 127, 0.005, 'KG'),
 (701, 89, 0.02, 'LTR'),
+(702, 1008409, 0.2, 'KG'),
 (702, 127, 0.005, 'KG'),
 (702, 89, 0.02, 'LTR'),
+(703, 1008409, 0.2, 'KG'),
 (703, 127, 0.005, 'KG'),
 (703, 89, 0.02, 'LTR'),
+(704, 1008409, 0.2, 'KG'),
 (704, 127, 0.005, 'KG'),
 (704, 89, 0.02, 'LTR'),
+(705, 1008409, 0.2, 'KG'),
 (705, 127, 0.005, 'KG'),
 (705, 89, 0.02, 'LTR'),
+(706, 1008409, 0.2, 'KG'),
 (706, 127, 0.005, 'KG'),
-(706, 89, 0.02, 'LTR')
-ON CONFLICT DO NOTHING;
-INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
+(706, 89, 0.02, 'LTR'),
+(707, 1008409, 0.2, 'KG'),
 (707, 127, 0.005, 'KG'),
 (707, 89, 0.02, 'LTR'),
+(708, 1008409, 0.2, 'KG'),
 (708, 127, 0.005, 'KG'),
 (708, 89, 0.02, 'LTR'),
+(709, 1008409, 0.2, 'KG'),
 (709, 127, 0.005, 'KG'),
 (709, 89, 0.02, 'LTR'),
+(710, 1008409, 0.2, 'KG'),
 (710, 127, 0.005, 'KG'),
 (710, 89, 0.02, 'LTR'),
+(711, 1008409, 0.2, 'KG'),
 (711, 127, 0.005, 'KG'),
 (711, 89, 0.02, 'LTR'),
+(712, 1008409, 0.2, 'KG'),
 (712, 127, 0.005, 'KG'),
 (712, 89, 0.02, 'LTR'),
+(713, 1008409, 0.2, 'KG'),
 (713, 127, 0.005, 'KG'),
 (713, 89, 0.02, 'LTR'),
+(714, 1008409, 0.2, 'KG'),
 (714, 127, 0.005, 'KG'),
 (714, 89, 0.02, 'LTR'),
+(715, 1008409, 0.2, 'KG'),
 (715, 127, 0.005, 'KG'),
 (715, 89, 0.02, 'LTR'),
+(716, 1008409, 0.2, 'KG'),
 (716, 127, 0.005, 'KG'),
 (716, 89, 0.02, 'LTR'),
+(717, 1008409, 0.2, 'KG'),
 (717, 127, 0.005, 'KG'),
 (717, 89, 0.02, 'LTR'),
+(718, 1008409, 0.2, 'KG'),
 (718, 127, 0.005, 'KG'),
 (718, 89, 0.02, 'LTR'),
+(719, 1008409, 0.2, 'KG'),
 (719, 127, 0.005, 'KG'),
 (719, 89, 0.02, 'LTR'),
+(720, 1008409, 0.2, 'KG'),
 (720, 127, 0.005, 'KG'),
 (720, 89, 0.02, 'LTR'),
+(721, 1008409, 0.2, 'KG'),
 (721, 127, 0.005, 'KG'),
 (721, 89, 0.02, 'LTR'),
+(722, 1008409, 0.2, 'KG'),
 (722, 127, 0.005, 'KG'),
 (722, 89, 0.02, 'LTR'),
+(723, 1008409, 0.2, 'KG'),
 (723, 127, 0.005, 'KG'),
 (723, 89, 0.02, 'LTR'),
+(724, 1008409, 0.2, 'KG'),
 (724, 127, 0.005, 'KG'),
 (724, 89, 0.02, 'LTR'),
+(725, 1008409, 0.2, 'KG'),
 (725, 127, 0.005, 'KG'),
 (725, 89, 0.02, 'LTR'),
+(726, 1008409, 0.2, 'KG'),
 (726, 127, 0.005, 'KG'),
 (726, 89, 0.02, 'LTR'),
+(727, 1008409, 0.2, 'KG'),
 (727, 127, 0.005, 'KG'),
 (727, 89, 0.02, 'LTR'),
+(728, 1008409, 0.2, 'KG'),
 (728, 127, 0.005, 'KG'),
 (728, 89, 0.02, 'LTR'),
+(729, 1008409, 0.2, 'KG'),
 (729, 127, 0.005, 'KG'),
 (729, 89, 0.02, 'LTR'),
+(730, 1008409, 0.2, 'KG'),
 (730, 127, 0.005, 'KG'),
 (730, 89, 0.02, 'LTR'),
+(731, 1008409, 0.2, 'KG'),
 (731, 127, 0.005, 'KG'),
 (731, 89, 0.02, 'LTR'),
+(732, 1008409, 0.2, 'KG'),
 (732, 127, 0.005, 'KG'),
 (732, 89, 0.02, 'LTR'),
+(733, 1008409, 0.2, 'KG'),
 (733, 127, 0.005, 'KG'),
 (733, 89, 0.02, 'LTR'),
+(734, 1008409, 0.2, 'KG'),
 (734, 127, 0.005, 'KG'),
 (734, 89, 0.02, 'LTR'),
+(735, 1008409, 0.2, 'KG'),
 (735, 127, 0.005, 'KG'),
 (735, 89, 0.02, 'LTR'),
+(736, 1008409, 0.2, 'KG'),
 (736, 127, 0.005, 'KG'),
 (736, 89, 0.02, 'LTR'),
+(737, 1008409, 0.2, 'KG'),
 (737, 127, 0.005, 'KG'),
 (737, 89, 0.02, 'LTR'),
+(738, 1008409, 0.2, 'KG'),
 (738, 127, 0.005, 'KG'),
 (738, 89, 0.02, 'LTR'),
+(739, 1008409, 0.2, 'KG'),
 (739, 127, 0.005, 'KG'),
 (739, 89, 0.02, 'LTR'),
+(740, 1008409, 0.2, 'KG'),
 (740, 127, 0.005, 'KG'),
 (740, 89, 0.02, 'LTR'),
+(741, 1008409, 0.2, 'KG'),
 (741, 127, 0.005, 'KG'),
 (741, 89, 0.02, 'LTR'),
+(742, 1008409, 0.2, 'KG'),
 (742, 127, 0.005, 'KG'),
 (742, 89, 0.02, 'LTR'),
+(743, 1008409, 0.2, 'KG'),
 (743, 127, 0.005, 'KG'),
 (743, 89, 0.02, 'LTR'),
+(744, 1008409, 0.2, 'KG'),
 (744, 127, 0.005, 'KG'),
 (744, 89, 0.02, 'LTR'),
+(745, 1008409, 0.2, 'KG'),
 (745, 127, 0.005, 'KG'),
 (745, 89, 0.02, 'LTR'),
+(746, 1008409, 0.2, 'KG'),
 (746, 127, 0.005, 'KG'),
 (746, 89, 0.02, 'LTR'),
+(747, 1008409, 0.2, 'KG'),
 (747, 127, 0.005, 'KG'),
 (747, 89, 0.02, 'LTR'),
+(748, 1008409, 0.2, 'KG'),
 (748, 127, 0.005, 'KG'),
 (748, 89, 0.02, 'LTR'),
+(749, 1008409, 0.2, 'KG'),
 (749, 127, 0.005, 'KG'),
 (749, 89, 0.02, 'LTR'),
+(750, 1008409, 0.2, 'KG'),
 (750, 127, 0.005, 'KG'),
 (750, 89, 0.02, 'LTR'),
+(751, 1008409, 0.2, 'KG'),
 (751, 127, 0.005, 'KG'),
 (751, 89, 0.02, 'LTR'),
+(752, 1008409, 0.2, 'KG'),
 (752, 127, 0.005, 'KG'),
 (752, 89, 0.02, 'LTR'),
+(753, 1008409, 0.2, 'KG'),
 (753, 127, 0.005, 'KG'),
 (753, 89, 0.02, 'LTR'),
+(754, 1008409, 0.2, 'KG'),
 (754, 127, 0.005, 'KG'),
 (754, 89, 0.02, 'LTR'),
+(755, 1008409, 0.2, 'KG'),
 (755, 127, 0.005, 'KG'),
 (755, 89, 0.02, 'LTR'),
+(756, 1008409, 0.2, 'KG'),
 (756, 127, 0.005, 'KG'),
 (756, 89, 0.02, 'LTR'),
+(757, 1008409, 0.2, 'KG'),
 (757, 127, 0.005, 'KG'),
 (757, 89, 0.02, 'LTR'),
+(758, 1008409, 0.2, 'KG'),
 (758, 127, 0.005, 'KG'),
 (758, 89, 0.02, 'LTR'),
+(759, 1008409, 0.2, 'KG'),
 (759, 127, 0.005, 'KG'),
 (759, 89, 0.02, 'LTR'),
+(760, 1008409, 0.2, 'KG'),
 (760, 127, 0.005, 'KG'),
 (760, 89, 0.02, 'LTR'),
+(761, 1008409, 0.2, 'KG'),
 (761, 127, 0.005, 'KG'),
 (761, 89, 0.02, 'LTR'),
+(762, 1008409, 0.2, 'KG'),
 (762, 127, 0.005, 'KG'),
 (762, 89, 0.02, 'LTR'),
+(763, 1008409, 0.2, 'KG'),
 (763, 127, 0.005, 'KG'),
 (763, 89, 0.02, 'LTR'),
+(764, 1008409, 0.2, 'KG'),
 (764, 127, 0.005, 'KG'),
 (764, 89, 0.02, 'LTR'),
+(765, 1008409, 0.2, 'KG'),
 (765, 127, 0.005, 'KG'),
 (765, 89, 0.02, 'LTR'),
+(766, 1008409, 0.2, 'KG'),
 (766, 127, 0.005, 'KG'),
 (766, 89, 0.02, 'LTR'),
+(767, 1008409, 0.2, 'KG'),
 (767, 127, 0.005, 'KG'),
 (767, 89, 0.02, 'LTR'),
+(768, 1008409, 0.2, 'KG'),
 (768, 127, 0.005, 'KG'),
 (768, 89, 0.02, 'LTR'),
+(769, 1008409, 0.2, 'KG'),
 (769, 127, 0.005, 'KG'),
 (769, 89, 0.02, 'LTR'),
+(770, 1008409, 0.2, 'KG'),
 (770, 127, 0.005, 'KG'),
 (770, 89, 0.02, 'LTR'),
+(771, 1008409, 0.2, 'KG'),
 (771, 127, 0.005, 'KG'),
 (771, 89, 0.02, 'LTR'),
+(772, 1008409, 0.2, 'KG'),
 (772, 127, 0.005, 'KG'),
 (772, 89, 0.02, 'LTR'),
+(773, 1008409, 0.2, 'KG'),
 (773, 127, 0.005, 'KG'),
 (773, 89, 0.02, 'LTR'),
+(774, 1008409, 0.2, 'KG'),
 (774, 127, 0.005, 'KG'),
 (774, 89, 0.02, 'LTR'),
+(775, 1008409, 0.2, 'KG'),
 (775, 127, 0.005, 'KG'),
 (775, 89, 0.02, 'LTR'),
+(776, 1008409, 0.2, 'KG'),
 (776, 127, 0.005, 'KG'),
 (776, 89, 0.02, 'LTR'),
+(777, 1008409, 0.2, 'KG'),
 (777, 127, 0.005, 'KG'),
 (777, 89, 0.02, 'LTR'),
+(778, 1008409, 0.2, 'KG'),
 (778, 127, 0.005, 'KG'),
 (778, 89, 0.02, 'LTR'),
+(779, 1008409, 0.2, 'KG'),
 (779, 127, 0.005, 'KG'),
 (779, 89, 0.02, 'LTR'),
+(780, 1008409, 0.2, 'KG'),
 (780, 127, 0.005, 'KG'),
 (780, 89, 0.02, 'LTR'),
+(781, 1008409, 0.2, 'KG'),
 (781, 127, 0.005, 'KG'),
 (781, 89, 0.02, 'LTR'),
+(782, 1008409, 0.2, 'KG'),
 (782, 127, 0.005, 'KG'),
 (782, 89, 0.02, 'LTR'),
+(783, 1008409, 0.2, 'KG'),
 (783, 127, 0.005, 'KG'),
 (783, 89, 0.02, 'LTR'),
+(784, 1008409, 0.2, 'KG'),
 (784, 127, 0.005, 'KG'),
 (784, 89, 0.02, 'LTR'),
+(785, 1008409, 0.2, 'KG'),
 (785, 127, 0.005, 'KG'),
 (785, 89, 0.02, 'LTR'),
+(786, 1008409, 0.2, 'KG'),
 (786, 127, 0.005, 'KG'),
 (786, 89, 0.02, 'LTR'),
+(787, 1008409, 0.2, 'KG'),
 (787, 127, 0.005, 'KG'),
 (787, 89, 0.02, 'LTR'),
+(788, 1008409, 0.2, 'KG'),
 (788, 127, 0.005, 'KG'),
 (788, 89, 0.02, 'LTR'),
+(789, 1008409, 0.2, 'KG'),
 (789, 127, 0.005, 'KG'),
 (789, 89, 0.02, 'LTR'),
+(790, 1008409, 0.2, 'KG'),
 (790, 127, 0.005, 'KG'),
 (790, 89, 0.02, 'LTR'),
+(791, 1008409, 0.2, 'KG'),
 (791, 127, 0.005, 'KG'),
 (791, 89, 0.02, 'LTR'),
+(792, 1008409, 0.2, 'KG'),
 (792, 127, 0.005, 'KG'),
 (792, 89, 0.02, 'LTR'),
+(793, 1039230, 0.25, 'KG'),
 (793, 117, 0.2, 'KG'),
 (793, 89, 0.05, 'LTR'),
 (793, 61, 0.02, 'KG'),
@@ -3744,6 +4518,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (793, 163, 0.001, 'KG'),
 (793, 165, 0.001, 'KG'),
 (793, 164, 0.001, 'KG'),
+(793, 1211973, 0.1, 'KG'),
+(794, 1039230, 0.25, 'KG'),
 (794, 117, 0.2, 'KG'),
 (794, 89, 0.05, 'LTR'),
 (794, 61, 0.02, 'KG'),
@@ -3751,6 +4527,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (794, 163, 0.001, 'KG'),
 (794, 165, 0.001, 'KG'),
 (794, 164, 0.001, 'KG'),
+(794, 1211973, 0.1, 'KG'),
+(795, 1039230, 0.25, 'KG'),
 (795, 117, 0.2, 'KG'),
 (795, 89, 0.05, 'LTR'),
 (795, 61, 0.02, 'KG'),
@@ -3758,6 +4536,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (795, 163, 0.001, 'KG'),
 (795, 165, 0.001, 'KG'),
 (795, 164, 0.001, 'KG'),
+(795, 1211973, 0.1, 'KG'),
+(796, 1039230, 0.25, 'KG'),
 (796, 117, 0.2, 'KG'),
 (796, 89, 0.05, 'LTR'),
 (796, 61, 0.02, 'KG'),
@@ -3765,6 +4545,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (796, 163, 0.001, 'KG'),
 (796, 165, 0.001, 'KG'),
 (796, 164, 0.001, 'KG'),
+(796, 1211973, 0.1, 'KG'),
+(797, 1039230, 0.25, 'KG'),
 (797, 117, 0.2, 'KG'),
 (797, 89, 0.05, 'LTR'),
 (797, 61, 0.02, 'KG'),
@@ -3772,6 +4554,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (797, 163, 0.001, 'KG'),
 (797, 165, 0.001, 'KG'),
 (797, 164, 0.001, 'KG'),
+(797, 1211973, 0.1, 'KG'),
+(798, 1039230, 0.25, 'KG'),
 (798, 117, 0.2, 'KG'),
 (798, 89, 0.05, 'LTR'),
 (798, 61, 0.02, 'KG'),
@@ -3779,6 +4563,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (798, 163, 0.001, 'KG'),
 (798, 165, 0.001, 'KG'),
 (798, 164, 0.001, 'KG'),
+(798, 1211973, 0.1, 'KG'),
+(799, 1039230, 0.25, 'KG'),
 (799, 117, 0.2, 'KG'),
 (799, 89, 0.05, 'LTR'),
 (799, 61, 0.02, 'KG'),
@@ -3786,6 +4572,8 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (799, 163, 0.001, 'KG'),
 (799, 165, 0.001, 'KG'),
 (799, 164, 0.001, 'KG'),
+(799, 1211973, 0.1, 'KG'),
+(800, 1039230, 0.25, 'KG'),
 (800, 117, 0.2, 'KG'),
 (800, 89, 0.05, 'LTR'),
 (800, 61, 0.02, 'KG'),
@@ -3793,6 +4581,7 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (800, 163, 0.001, 'KG'),
 (800, 165, 0.001, 'KG'),
 (800, 164, 0.001, 'KG'),
+(800, 1211973, 0.1, 'KG'),
 (801, 127, 0.005, 'KG'),
 (801, 1, 0.002, 'KG'),
 (801, 89, 0.01, 'LTR'),
@@ -3805,7 +4594,10 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (802, 22, 0.001, 'KG'),
 (803, 127, 0.005, 'KG'),
 (803, 1, 0.002, 'KG'),
-(803, 89, 0.01, 'LTR'),
+(803, 89, 0.01, 'LTR')
+ON CONFLICT DO NOTHING;
+
+INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (803, 19, 0.001, 'KG'),
 (803, 22, 0.001, 'KG'),
 (804, 127, 0.005, 'KG'),
@@ -3863,888 +4655,1330 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (814, 89, 0.01, 'LTR'),
 (814, 19, 0.001, 'KG'),
 (814, 22, 0.001, 'KG'),
+(815, 1008409, 0.2, 'KG'),
 (815, 127, 0.005, 'KG'),
 (815, 89, 0.02, 'LTR'),
+(816, 1008409, 0.2, 'KG'),
 (816, 127, 0.005, 'KG'),
 (816, 89, 0.02, 'LTR'),
+(817, 1008409, 0.2, 'KG'),
 (817, 127, 0.005, 'KG'),
 (817, 89, 0.02, 'LTR'),
+(818, 1008409, 0.2, 'KG'),
 (818, 127, 0.005, 'KG'),
 (818, 89, 0.02, 'LTR'),
+(819, 1008409, 0.2, 'KG'),
 (819, 127, 0.005, 'KG'),
 (819, 89, 0.02, 'LTR'),
+(820, 1008409, 0.2, 'KG'),
 (820, 127, 0.005, 'KG'),
 (820, 89, 0.02, 'LTR'),
+(821, 1008409, 0.2, 'KG'),
 (821, 127, 0.005, 'KG'),
 (821, 89, 0.02, 'LTR'),
+(822, 1008409, 0.2, 'KG'),
 (822, 127, 0.005, 'KG'),
 (822, 89, 0.02, 'LTR'),
+(823, 1008409, 0.2, 'KG'),
 (823, 127, 0.005, 'KG'),
 (823, 89, 0.02, 'LTR'),
+(824, 1008409, 0.2, 'KG'),
 (824, 127, 0.005, 'KG'),
 (824, 89, 0.02, 'LTR'),
+(825, 1008409, 0.2, 'KG'),
 (825, 127, 0.005, 'KG'),
 (825, 89, 0.02, 'LTR'),
+(826, 1008409, 0.2, 'KG'),
 (826, 127, 0.005, 'KG'),
 (826, 89, 0.02, 'LTR'),
+(827, 1008409, 0.2, 'KG'),
 (827, 127, 0.005, 'KG'),
 (827, 89, 0.02, 'LTR'),
+(828, 1008409, 0.2, 'KG'),
 (828, 127, 0.005, 'KG'),
 (828, 89, 0.02, 'LTR'),
+(829, 1008409, 0.2, 'KG'),
 (829, 127, 0.005, 'KG'),
 (829, 89, 0.02, 'LTR'),
+(830, 1008409, 0.2, 'KG'),
 (830, 127, 0.005, 'KG'),
 (830, 89, 0.02, 'LTR'),
+(831, 1008409, 0.2, 'KG'),
 (831, 127, 0.005, 'KG'),
 (831, 89, 0.02, 'LTR'),
+(832, 1008409, 0.2, 'KG'),
 (832, 127, 0.005, 'KG'),
 (832, 89, 0.02, 'LTR'),
+(833, 1008409, 0.2, 'KG'),
 (833, 127, 0.005, 'KG'),
 (833, 89, 0.02, 'LTR'),
+(834, 1008409, 0.2, 'KG'),
 (834, 127, 0.005, 'KG'),
 (834, 89, 0.02, 'LTR'),
+(835, 1008409, 0.2, 'KG'),
 (835, 127, 0.005, 'KG'),
 (835, 89, 0.02, 'LTR'),
+(836, 1008409, 0.2, 'KG'),
 (836, 127, 0.005, 'KG'),
 (836, 89, 0.02, 'LTR'),
+(837, 1008409, 0.2, 'KG'),
 (837, 127, 0.005, 'KG'),
 (837, 89, 0.02, 'LTR'),
+(838, 1008409, 0.2, 'KG'),
 (838, 127, 0.005, 'KG'),
 (838, 89, 0.02, 'LTR'),
+(839, 1008409, 0.2, 'KG'),
 (839, 127, 0.005, 'KG'),
 (839, 89, 0.02, 'LTR'),
+(840, 1008409, 0.2, 'KG'),
 (840, 127, 0.005, 'KG'),
 (840, 89, 0.02, 'LTR'),
+(841, 1008409, 0.2, 'KG'),
 (841, 127, 0.005, 'KG'),
 (841, 89, 0.02, 'LTR'),
+(842, 1008409, 0.2, 'KG'),
 (842, 127, 0.005, 'KG'),
 (842, 89, 0.02, 'LTR'),
+(843, 1008409, 0.2, 'KG'),
 (843, 127, 0.005, 'KG'),
 (843, 89, 0.02, 'LTR'),
+(844, 1008409, 0.2, 'KG'),
 (844, 127, 0.005, 'KG'),
 (844, 89, 0.02, 'LTR'),
+(845, 1008409, 0.2, 'KG'),
 (845, 127, 0.005, 'KG'),
 (845, 89, 0.02, 'LTR'),
+(846, 1008409, 0.2, 'KG'),
 (846, 127, 0.005, 'KG'),
 (846, 89, 0.02, 'LTR'),
+(847, 1008409, 0.2, 'KG'),
 (847, 127, 0.005, 'KG'),
 (847, 89, 0.02, 'LTR'),
+(848, 1008409, 0.2, 'KG'),
 (848, 127, 0.005, 'KG'),
 (848, 89, 0.02, 'LTR'),
+(849, 1008409, 0.2, 'KG'),
 (849, 127, 0.005, 'KG'),
 (849, 89, 0.02, 'LTR'),
+(850, 1008409, 0.2, 'KG'),
 (850, 127, 0.005, 'KG'),
 (850, 89, 0.02, 'LTR'),
+(851, 1008409, 0.2, 'KG'),
 (851, 127, 0.005, 'KG'),
 (851, 89, 0.02, 'LTR'),
+(852, 1008409, 0.2, 'KG'),
 (852, 127, 0.005, 'KG'),
 (852, 89, 0.02, 'LTR'),
+(853, 1008409, 0.2, 'KG'),
 (853, 127, 0.005, 'KG'),
 (853, 89, 0.02, 'LTR'),
+(854, 1008409, 0.2, 'KG'),
 (854, 127, 0.005, 'KG'),
 (854, 89, 0.02, 'LTR'),
+(855, 1008409, 0.2, 'KG'),
 (855, 127, 0.005, 'KG'),
 (855, 89, 0.02, 'LTR'),
+(856, 1008409, 0.2, 'KG'),
 (856, 127, 0.005, 'KG'),
 (856, 89, 0.02, 'LTR'),
+(857, 1008409, 0.2, 'KG'),
 (857, 127, 0.005, 'KG'),
 (857, 89, 0.02, 'LTR'),
+(858, 1008409, 0.2, 'KG'),
 (858, 127, 0.005, 'KG'),
 (858, 89, 0.02, 'LTR'),
+(859, 1008409, 0.2, 'KG'),
 (859, 127, 0.005, 'KG'),
 (859, 89, 0.02, 'LTR'),
+(860, 1008409, 0.2, 'KG'),
 (860, 127, 0.005, 'KG'),
 (860, 89, 0.02, 'LTR'),
+(861, 1008409, 0.2, 'KG'),
 (861, 127, 0.005, 'KG'),
 (861, 89, 0.02, 'LTR'),
+(862, 1008409, 0.2, 'KG'),
 (862, 127, 0.005, 'KG'),
 (862, 89, 0.02, 'LTR'),
+(863, 1008409, 0.2, 'KG'),
 (863, 127, 0.005, 'KG'),
 (863, 89, 0.02, 'LTR'),
+(864, 1008409, 0.2, 'KG'),
 (864, 127, 0.005, 'KG'),
 (864, 89, 0.02, 'LTR'),
+(865, 1008409, 0.2, 'KG'),
 (865, 127, 0.005, 'KG'),
 (865, 89, 0.02, 'LTR'),
+(866, 1008409, 0.2, 'KG'),
 (866, 127, 0.005, 'KG'),
 (866, 89, 0.02, 'LTR'),
+(867, 1008409, 0.2, 'KG'),
 (867, 127, 0.005, 'KG'),
 (867, 89, 0.02, 'LTR'),
+(868, 1008409, 0.2, 'KG'),
 (868, 127, 0.005, 'KG'),
 (868, 89, 0.02, 'LTR'),
+(869, 1008409, 0.2, 'KG'),
 (869, 127, 0.005, 'KG'),
 (869, 89, 0.02, 'LTR'),
+(870, 1008409, 0.2, 'KG'),
 (870, 127, 0.005, 'KG'),
 (870, 89, 0.02, 'LTR'),
+(871, 1008409, 0.2, 'KG'),
 (871, 127, 0.005, 'KG'),
 (871, 89, 0.02, 'LTR'),
+(872, 1008409, 0.2, 'KG'),
 (872, 127, 0.005, 'KG'),
 (872, 89, 0.02, 'LTR'),
+(873, 1008409, 0.2, 'KG'),
 (873, 127, 0.005, 'KG'),
 (873, 89, 0.02, 'LTR'),
+(874, 1008409, 0.2, 'KG'),
 (874, 127, 0.005, 'KG'),
 (874, 89, 0.02, 'LTR'),
+(875, 1008409, 0.2, 'KG'),
 (875, 127, 0.005, 'KG'),
 (875, 89, 0.02, 'LTR'),
+(876, 1008409, 0.2, 'KG'),
 (876, 127, 0.005, 'KG'),
 (876, 89, 0.02, 'LTR'),
+(877, 1008409, 0.2, 'KG'),
 (877, 127, 0.005, 'KG'),
 (877, 89, 0.02, 'LTR'),
+(878, 1008409, 0.2, 'KG'),
 (878, 127, 0.005, 'KG'),
 (878, 89, 0.02, 'LTR'),
+(879, 1008409, 0.2, 'KG'),
 (879, 127, 0.005, 'KG'),
 (879, 89, 0.02, 'LTR'),
+(880, 1008409, 0.2, 'KG'),
 (880, 127, 0.005, 'KG'),
 (880, 89, 0.02, 'LTR'),
+(881, 1008409, 0.2, 'KG'),
 (881, 127, 0.005, 'KG'),
 (881, 89, 0.02, 'LTR'),
+(882, 1008409, 0.2, 'KG'),
 (882, 127, 0.005, 'KG'),
 (882, 89, 0.02, 'LTR'),
+(883, 1008409, 0.2, 'KG'),
 (883, 127, 0.005, 'KG'),
 (883, 89, 0.02, 'LTR'),
+(884, 1008409, 0.2, 'KG'),
 (884, 127, 0.005, 'KG'),
 (884, 89, 0.02, 'LTR'),
+(885, 1008409, 0.2, 'KG'),
 (885, 127, 0.005, 'KG'),
 (885, 89, 0.02, 'LTR'),
+(886, 1008409, 0.2, 'KG'),
 (886, 127, 0.005, 'KG'),
 (886, 89, 0.02, 'LTR'),
+(887, 1008409, 0.2, 'KG'),
 (887, 127, 0.005, 'KG'),
 (887, 89, 0.02, 'LTR'),
+(888, 1008409, 0.2, 'KG'),
 (888, 127, 0.005, 'KG'),
 (888, 89, 0.02, 'LTR'),
+(889, 1008409, 0.2, 'KG'),
 (889, 127, 0.005, 'KG'),
 (889, 89, 0.02, 'LTR'),
+(890, 1008409, 0.2, 'KG'),
 (890, 127, 0.005, 'KG'),
 (890, 89, 0.02, 'LTR'),
+(891, 1008409, 0.2, 'KG'),
 (891, 127, 0.005, 'KG'),
 (891, 89, 0.02, 'LTR'),
+(892, 1008409, 0.2, 'KG'),
 (892, 127, 0.005, 'KG'),
 (892, 89, 0.02, 'LTR'),
+(893, 1008409, 0.2, 'KG'),
 (893, 127, 0.005, 'KG'),
 (893, 89, 0.02, 'LTR'),
+(894, 1008409, 0.2, 'KG'),
 (894, 127, 0.005, 'KG'),
 (894, 89, 0.02, 'LTR'),
+(895, 1008409, 0.2, 'KG'),
 (895, 127, 0.005, 'KG'),
 (895, 89, 0.02, 'LTR'),
+(896, 1008409, 0.2, 'KG'),
 (896, 127, 0.005, 'KG'),
 (896, 89, 0.02, 'LTR'),
+(897, 1008409, 0.2, 'KG'),
 (897, 127, 0.005, 'KG'),
 (897, 89, 0.02, 'LTR'),
+(898, 1008409, 0.2, 'KG'),
 (898, 127, 0.005, 'KG'),
 (898, 89, 0.02, 'LTR'),
+(899, 1008409, 0.2, 'KG'),
 (899, 127, 0.005, 'KG'),
 (899, 89, 0.02, 'LTR'),
+(900, 1008409, 0.2, 'KG'),
 (900, 127, 0.005, 'KG'),
 (900, 89, 0.02, 'LTR'),
+(901, 1008409, 0.2, 'KG'),
 (901, 127, 0.005, 'KG'),
 (901, 89, 0.02, 'LTR'),
+(902, 1008409, 0.2, 'KG'),
 (902, 127, 0.005, 'KG'),
 (902, 89, 0.02, 'LTR'),
+(903, 1008409, 0.2, 'KG'),
 (903, 127, 0.005, 'KG'),
 (903, 89, 0.02, 'LTR'),
+(904, 1008409, 0.2, 'KG'),
 (904, 127, 0.005, 'KG'),
 (904, 89, 0.02, 'LTR'),
+(905, 1008409, 0.2, 'KG'),
 (905, 127, 0.005, 'KG'),
 (905, 89, 0.02, 'LTR'),
+(906, 1008409, 0.2, 'KG'),
 (906, 127, 0.005, 'KG'),
 (906, 89, 0.02, 'LTR'),
+(907, 1008409, 0.2, 'KG'),
 (907, 127, 0.005, 'KG'),
 (907, 89, 0.02, 'LTR'),
+(908, 1008409, 0.2, 'KG'),
 (908, 127, 0.005, 'KG'),
 (908, 89, 0.02, 'LTR'),
+(909, 1008409, 0.2, 'KG'),
 (909, 127, 0.005, 'KG'),
 (909, 89, 0.02, 'LTR'),
+(910, 1008409, 0.2, 'KG'),
 (910, 127, 0.005, 'KG'),
 (910, 89, 0.02, 'LTR'),
+(911, 1008409, 0.2, 'KG'),
 (911, 127, 0.005, 'KG'),
 (911, 89, 0.02, 'LTR'),
+(912, 1008409, 0.2, 'KG'),
 (912, 127, 0.005, 'KG'),
 (912, 89, 0.02, 'LTR'),
+(913, 1008409, 0.2, 'KG'),
 (913, 127, 0.005, 'KG'),
 (913, 89, 0.02, 'LTR'),
+(914, 1008409, 0.2, 'KG'),
 (914, 127, 0.005, 'KG'),
 (914, 89, 0.02, 'LTR'),
+(915, 1008409, 0.2, 'KG'),
 (915, 127, 0.005, 'KG'),
 (915, 89, 0.02, 'LTR'),
+(916, 1008409, 0.2, 'KG'),
 (916, 127, 0.005, 'KG'),
 (916, 89, 0.02, 'LTR'),
+(917, 1008409, 0.2, 'KG'),
 (917, 127, 0.005, 'KG'),
 (917, 89, 0.02, 'LTR'),
+(918, 1008409, 0.2, 'KG'),
 (918, 127, 0.005, 'KG'),
 (918, 89, 0.02, 'LTR'),
+(919, 1008409, 0.2, 'KG'),
 (919, 127, 0.005, 'KG'),
 (919, 89, 0.02, 'LTR'),
+(920, 1008409, 0.2, 'KG'),
 (920, 127, 0.005, 'KG'),
 (920, 89, 0.02, 'LTR'),
+(921, 1008409, 0.2, 'KG'),
 (921, 127, 0.005, 'KG'),
 (921, 89, 0.02, 'LTR'),
+(922, 1008409, 0.2, 'KG'),
 (922, 127, 0.005, 'KG'),
 (922, 89, 0.02, 'LTR'),
+(923, 1008409, 0.2, 'KG'),
 (923, 127, 0.005, 'KG'),
 (923, 89, 0.02, 'LTR'),
+(924, 1008409, 0.2, 'KG'),
 (924, 127, 0.005, 'KG'),
 (924, 89, 0.02, 'LTR'),
+(925, 1008409, 0.2, 'KG'),
 (925, 127, 0.005, 'KG'),
 (925, 89, 0.02, 'LTR'),
+(926, 1008409, 0.2, 'KG'),
 (926, 127, 0.005, 'KG'),
 (926, 89, 0.02, 'LTR'),
+(927, 1008409, 0.2, 'KG'),
 (927, 127, 0.005, 'KG'),
 (927, 89, 0.02, 'LTR'),
+(928, 1008409, 0.2, 'KG'),
 (928, 127, 0.005, 'KG'),
 (928, 89, 0.02, 'LTR'),
+(929, 1008409, 0.2, 'KG'),
 (929, 127, 0.005, 'KG'),
 (929, 89, 0.02, 'LTR'),
+(930, 1008409, 0.2, 'KG'),
 (930, 127, 0.005, 'KG'),
 (930, 89, 0.02, 'LTR'),
+(931, 1008409, 0.2, 'KG'),
 (931, 127, 0.005, 'KG'),
 (931, 89, 0.02, 'LTR'),
+(932, 1008409, 0.2, 'KG'),
 (932, 127, 0.005, 'KG'),
 (932, 89, 0.02, 'LTR'),
+(933, 1008409, 0.2, 'KG'),
 (933, 127, 0.005, 'KG'),
 (933, 89, 0.02, 'LTR'),
+(934, 1008409, 0.2, 'KG'),
 (934, 127, 0.005, 'KG'),
 (934, 89, 0.02, 'LTR'),
+(935, 1008409, 0.2, 'KG'),
 (935, 127, 0.005, 'KG'),
 (935, 89, 0.02, 'LTR'),
+(936, 1008409, 0.2, 'KG'),
 (936, 127, 0.005, 'KG'),
 (936, 89, 0.02, 'LTR'),
+(937, 1008409, 0.2, 'KG'),
 (937, 127, 0.005, 'KG'),
 (937, 89, 0.02, 'LTR'),
+(938, 1008409, 0.2, 'KG'),
 (938, 127, 0.005, 'KG'),
 (938, 89, 0.02, 'LTR'),
+(939, 1008409, 0.2, 'KG'),
 (939, 127, 0.005, 'KG'),
 (939, 89, 0.02, 'LTR'),
+(940, 1008409, 0.2, 'KG'),
 (940, 127, 0.005, 'KG'),
 (940, 89, 0.02, 'LTR'),
+(941, 1008409, 0.2, 'KG'),
 (941, 127, 0.005, 'KG'),
 (941, 89, 0.02, 'LTR'),
+(942, 1008409, 0.2, 'KG'),
 (942, 127, 0.005, 'KG'),
 (942, 89, 0.02, 'LTR'),
+(943, 1008409, 0.2, 'KG'),
 (943, 127, 0.005, 'KG'),
 (943, 89, 0.02, 'LTR'),
+(944, 1008409, 0.2, 'KG'),
 (944, 127, 0.005, 'KG'),
 (944, 89, 0.02, 'LTR'),
+(945, 1008409, 0.2, 'KG'),
 (945, 127, 0.005, 'KG'),
 (945, 89, 0.02, 'LTR'),
+(946, 1008409, 0.2, 'KG'),
 (946, 127, 0.005, 'KG'),
 (946, 89, 0.02, 'LTR'),
+(947, 1008409, 0.2, 'KG'),
 (947, 127, 0.005, 'KG'),
 (947, 89, 0.02, 'LTR'),
+(948, 1008409, 0.2, 'KG'),
 (948, 127, 0.005, 'KG'),
 (948, 89, 0.02, 'LTR'),
+(949, 1008409, 0.2, 'KG'),
 (949, 127, 0.005, 'KG'),
 (949, 89, 0.02, 'LTR'),
+(950, 1008409, 0.2, 'KG'),
 (950, 127, 0.005, 'KG'),
 (950, 89, 0.02, 'LTR'),
+(951, 1008409, 0.2, 'KG'),
 (951, 127, 0.005, 'KG'),
 (951, 89, 0.02, 'LTR'),
+(952, 1008409, 0.2, 'KG'),
 (952, 127, 0.005, 'KG'),
 (952, 89, 0.02, 'LTR'),
+(953, 1008409, 0.2, 'KG'),
 (953, 127, 0.005, 'KG'),
 (953, 89, 0.02, 'LTR'),
+(954, 1008409, 0.2, 'KG'),
 (954, 127, 0.005, 'KG'),
 (954, 89, 0.02, 'LTR'),
+(955, 1008409, 0.2, 'KG'),
 (955, 127, 0.005, 'KG'),
 (955, 89, 0.02, 'LTR'),
+(956, 1008409, 0.2, 'KG'),
 (956, 127, 0.005, 'KG'),
 (956, 89, 0.02, 'LTR'),
+(957, 1008409, 0.2, 'KG'),
 (957, 127, 0.005, 'KG'),
 (957, 89, 0.02, 'LTR'),
+(958, 1008409, 0.2, 'KG'),
 (958, 127, 0.005, 'KG'),
 (958, 89, 0.02, 'LTR'),
+(959, 1008409, 0.2, 'KG'),
 (959, 127, 0.005, 'KG'),
 (959, 89, 0.02, 'LTR'),
+(960, 1008409, 0.2, 'KG'),
 (960, 127, 0.005, 'KG'),
 (960, 89, 0.02, 'LTR'),
+(961, 1008409, 0.2, 'KG'),
 (961, 127, 0.005, 'KG'),
 (961, 89, 0.02, 'LTR'),
+(962, 1008409, 0.2, 'KG'),
 (962, 127, 0.005, 'KG'),
 (962, 89, 0.02, 'LTR'),
+(963, 1008409, 0.2, 'KG'),
 (963, 127, 0.005, 'KG'),
 (963, 89, 0.02, 'LTR'),
+(964, 1008409, 0.2, 'KG'),
 (964, 127, 0.005, 'KG'),
 (964, 89, 0.02, 'LTR'),
+(965, 1008409, 0.2, 'KG'),
 (965, 127, 0.005, 'KG'),
 (965, 89, 0.02, 'LTR'),
+(966, 1008409, 0.2, 'KG'),
 (966, 127, 0.005, 'KG'),
 (966, 89, 0.02, 'LTR'),
+(967, 1008409, 0.2, 'KG'),
 (967, 127, 0.005, 'KG'),
 (967, 89, 0.02, 'LTR'),
+(968, 1008409, 0.2, 'KG'),
 (968, 127, 0.005, 'KG'),
 (968, 89, 0.02, 'LTR'),
+(969, 1008409, 0.2, 'KG'),
 (969, 127, 0.005, 'KG'),
 (969, 89, 0.02, 'LTR'),
+(970, 1008409, 0.2, 'KG'),
 (970, 127, 0.005, 'KG'),
 (970, 89, 0.02, 'LTR'),
+(971, 1008409, 0.2, 'KG'),
 (971, 127, 0.005, 'KG'),
 (971, 89, 0.02, 'LTR'),
+(972, 1008409, 0.2, 'KG'),
 (972, 127, 0.005, 'KG'),
 (972, 89, 0.02, 'LTR'),
+(973, 1008409, 0.2, 'KG'),
 (973, 127, 0.005, 'KG'),
 (973, 89, 0.02, 'LTR'),
+(974, 1008409, 0.2, 'KG'),
 (974, 127, 0.005, 'KG'),
 (974, 89, 0.02, 'LTR'),
+(975, 1008409, 0.2, 'KG'),
 (975, 127, 0.005, 'KG'),
 (975, 89, 0.02, 'LTR'),
+(976, 1008409, 0.2, 'KG'),
 (976, 127, 0.005, 'KG'),
 (976, 89, 0.02, 'LTR'),
+(977, 1008409, 0.2, 'KG'),
 (977, 127, 0.005, 'KG'),
 (977, 89, 0.02, 'LTR'),
+(978, 1008409, 0.2, 'KG'),
 (978, 127, 0.005, 'KG'),
 (978, 89, 0.02, 'LTR'),
+(979, 1008409, 0.2, 'KG'),
 (979, 127, 0.005, 'KG'),
 (979, 89, 0.02, 'LTR'),
+(980, 1008409, 0.2, 'KG'),
 (980, 127, 0.005, 'KG'),
 (980, 89, 0.02, 'LTR'),
+(981, 1008409, 0.2, 'KG'),
 (981, 127, 0.005, 'KG'),
 (981, 89, 0.02, 'LTR'),
+(982, 1008409, 0.2, 'KG'),
 (982, 127, 0.005, 'KG'),
 (982, 89, 0.02, 'LTR'),
+(983, 1008409, 0.2, 'KG'),
 (983, 127, 0.005, 'KG'),
 (983, 89, 0.02, 'LTR'),
+(984, 1008409, 0.2, 'KG'),
 (984, 127, 0.005, 'KG'),
 (984, 89, 0.02, 'LTR'),
+(985, 1008409, 0.2, 'KG'),
 (985, 127, 0.005, 'KG'),
 (985, 89, 0.02, 'LTR'),
+(986, 1008409, 0.2, 'KG'),
 (986, 127, 0.005, 'KG'),
 (986, 89, 0.02, 'LTR'),
+(987, 1008409, 0.2, 'KG'),
 (987, 127, 0.005, 'KG'),
 (987, 89, 0.02, 'LTR'),
+(988, 1008409, 0.2, 'KG'),
 (988, 127, 0.005, 'KG'),
 (988, 89, 0.02, 'LTR'),
+(989, 1008409, 0.2, 'KG'),
 (989, 127, 0.005, 'KG'),
 (989, 89, 0.02, 'LTR'),
+(990, 1008409, 0.2, 'KG'),
 (990, 127, 0.005, 'KG'),
 (990, 89, 0.02, 'LTR'),
+(991, 1008409, 0.2, 'KG'),
 (991, 127, 0.005, 'KG'),
 (991, 89, 0.02, 'LTR'),
+(992, 1008409, 0.2, 'KG'),
 (992, 127, 0.005, 'KG'),
 (992, 89, 0.02, 'LTR'),
+(993, 1008409, 0.2, 'KG'),
 (993, 127, 0.005, 'KG'),
 (993, 89, 0.02, 'LTR'),
+(994, 1008409, 0.2, 'KG'),
 (994, 127, 0.005, 'KG'),
 (994, 89, 0.02, 'LTR'),
+(995, 1008409, 0.2, 'KG'),
 (995, 127, 0.005, 'KG'),
 (995, 89, 0.02, 'LTR'),
+(996, 1008409, 0.2, 'KG'),
 (996, 127, 0.005, 'KG'),
 (996, 89, 0.02, 'LTR'),
+(997, 1008409, 0.2, 'KG'),
 (997, 127, 0.005, 'KG'),
 (997, 89, 0.02, 'LTR'),
+(998, 1008409, 0.2, 'KG'),
 (998, 127, 0.005, 'KG'),
 (998, 89, 0.02, 'LTR'),
+(999, 1008409, 0.2, 'KG'),
 (999, 127, 0.005, 'KG'),
 (999, 89, 0.02, 'LTR'),
+(1000, 1008409, 0.2, 'KG'),
 (1000, 127, 0.005, 'KG'),
 (1000, 89, 0.02, 'LTR'),
+(1001, 1008409, 0.2, 'KG'),
 (1001, 127, 0.005, 'KG'),
 (1001, 89, 0.02, 'LTR'),
+(1002, 1008409, 0.2, 'KG'),
 (1002, 127, 0.005, 'KG'),
 (1002, 89, 0.02, 'LTR'),
+(1003, 1008409, 0.2, 'KG'),
 (1003, 127, 0.005, 'KG'),
 (1003, 89, 0.02, 'LTR'),
+(1004, 1008409, 0.2, 'KG'),
 (1004, 127, 0.005, 'KG'),
 (1004, 89, 0.02, 'LTR'),
+(1005, 1008409, 0.2, 'KG'),
 (1005, 127, 0.005, 'KG'),
 (1005, 89, 0.02, 'LTR'),
+(1006, 1008409, 0.2, 'KG'),
 (1006, 127, 0.005, 'KG'),
 (1006, 89, 0.02, 'LTR'),
+(1007, 1008409, 0.2, 'KG'),
 (1007, 127, 0.005, 'KG'),
 (1007, 89, 0.02, 'LTR'),
+(1008, 1008409, 0.2, 'KG'),
 (1008, 127, 0.005, 'KG'),
 (1008, 89, 0.02, 'LTR'),
+(1009, 1008409, 0.2, 'KG'),
 (1009, 127, 0.005, 'KG'),
 (1009, 89, 0.02, 'LTR'),
+(1010, 1008409, 0.2, 'KG'),
 (1010, 127, 0.005, 'KG'),
 (1010, 89, 0.02, 'LTR'),
+(1011, 1008409, 0.2, 'KG'),
 (1011, 127, 0.005, 'KG'),
 (1011, 89, 0.02, 'LTR'),
+(1012, 1008409, 0.2, 'KG'),
 (1012, 127, 0.005, 'KG'),
 (1012, 89, 0.02, 'LTR'),
+(1013, 1008409, 0.2, 'KG'),
 (1013, 127, 0.005, 'KG'),
 (1013, 89, 0.02, 'LTR'),
+(1014, 1008409, 0.2, 'KG'),
 (1014, 127, 0.005, 'KG'),
 (1014, 89, 0.02, 'LTR'),
+(1015, 1008409, 0.2, 'KG'),
 (1015, 127, 0.005, 'KG'),
 (1015, 89, 0.02, 'LTR'),
+(1016, 1008409, 0.2, 'KG'),
 (1016, 127, 0.005, 'KG'),
 (1016, 89, 0.02, 'LTR'),
+(1017, 1008409, 0.2, 'KG'),
 (1017, 127, 0.005, 'KG'),
 (1017, 89, 0.02, 'LTR'),
+(1018, 1008409, 0.2, 'KG'),
 (1018, 127, 0.005, 'KG'),
 (1018, 89, 0.02, 'LTR'),
+(1019, 1008409, 0.2, 'KG'),
 (1019, 127, 0.005, 'KG'),
 (1019, 89, 0.02, 'LTR'),
+(1020, 1008409, 0.2, 'KG'),
 (1020, 127, 0.005, 'KG'),
 (1020, 89, 0.02, 'LTR'),
+(1021, 1008409, 0.2, 'KG'),
 (1021, 127, 0.005, 'KG'),
 (1021, 89, 0.02, 'LTR'),
+(1022, 1008409, 0.2, 'KG'),
 (1022, 127, 0.005, 'KG'),
 (1022, 89, 0.02, 'LTR'),
+(1023, 1008409, 0.2, 'KG'),
 (1023, 127, 0.005, 'KG'),
 (1023, 89, 0.02, 'LTR'),
+(1024, 1008409, 0.2, 'KG'),
 (1024, 127, 0.005, 'KG'),
 (1024, 89, 0.02, 'LTR'),
+(1025, 1008409, 0.2, 'KG'),
 (1025, 127, 0.005, 'KG'),
 (1025, 89, 0.02, 'LTR'),
+(1026, 1008409, 0.2, 'KG'),
 (1026, 127, 0.005, 'KG'),
 (1026, 89, 0.02, 'LTR'),
+(1027, 1008409, 0.2, 'KG'),
 (1027, 127, 0.005, 'KG'),
 (1027, 89, 0.02, 'LTR'),
+(1028, 1008409, 0.2, 'KG'),
 (1028, 127, 0.005, 'KG'),
 (1028, 89, 0.02, 'LTR'),
+(1029, 1008409, 0.2, 'KG'),
 (1029, 127, 0.005, 'KG'),
 (1029, 89, 0.02, 'LTR'),
+(1030, 1008409, 0.2, 'KG'),
 (1030, 127, 0.005, 'KG'),
 (1030, 89, 0.02, 'LTR'),
+(1031, 1008409, 0.2, 'KG'),
 (1031, 127, 0.005, 'KG'),
 (1031, 89, 0.02, 'LTR'),
+(1032, 1008409, 0.2, 'KG'),
 (1032, 127, 0.005, 'KG'),
 (1032, 89, 0.02, 'LTR'),
+(1033, 1008409, 0.2, 'KG'),
 (1033, 127, 0.005, 'KG'),
 (1033, 89, 0.02, 'LTR'),
+(1034, 1008409, 0.2, 'KG'),
 (1034, 127, 0.005, 'KG'),
 (1034, 89, 0.02, 'LTR'),
+(1035, 1008409, 0.2, 'KG'),
 (1035, 127, 0.005, 'KG'),
 (1035, 89, 0.02, 'LTR'),
+(1036, 1008409, 0.2, 'KG'),
 (1036, 127, 0.005, 'KG'),
 (1036, 89, 0.02, 'LTR'),
+(1037, 1008409, 0.2, 'KG'),
 (1037, 127, 0.005, 'KG'),
 (1037, 89, 0.02, 'LTR'),
+(1038, 1008409, 0.2, 'KG'),
 (1038, 127, 0.005, 'KG'),
 (1038, 89, 0.02, 'LTR'),
+(1039, 1008409, 0.2, 'KG'),
 (1039, 127, 0.005, 'KG'),
 (1039, 89, 0.02, 'LTR'),
+(1040, 1008409, 0.2, 'KG'),
 (1040, 127, 0.005, 'KG'),
 (1040, 89, 0.02, 'LTR'),
+(1041, 1008409, 0.2, 'KG'),
 (1041, 127, 0.005, 'KG'),
 (1041, 89, 0.02, 'LTR'),
+(1042, 1008409, 0.2, 'KG'),
 (1042, 127, 0.005, 'KG'),
 (1042, 89, 0.02, 'LTR'),
+(1043, 1008409, 0.2, 'KG'),
 (1043, 127, 0.005, 'KG'),
 (1043, 89, 0.02, 'LTR'),
+(1044, 1008409, 0.2, 'KG'),
 (1044, 127, 0.005, 'KG'),
 (1044, 89, 0.02, 'LTR'),
+(1045, 1008409, 0.2, 'KG'),
 (1045, 127, 0.005, 'KG'),
 (1045, 89, 0.02, 'LTR'),
+(1046, 1008409, 0.2, 'KG'),
 (1046, 127, 0.005, 'KG'),
 (1046, 89, 0.02, 'LTR'),
+(1047, 1008409, 0.2, 'KG'),
 (1047, 127, 0.005, 'KG'),
 (1047, 89, 0.02, 'LTR'),
+(1048, 1008409, 0.2, 'KG'),
 (1048, 127, 0.005, 'KG'),
 (1048, 89, 0.02, 'LTR'),
+(1049, 1008409, 0.2, 'KG'),
 (1049, 127, 0.005, 'KG'),
 (1049, 89, 0.02, 'LTR'),
+(1050, 1008409, 0.2, 'KG'),
 (1050, 127, 0.005, 'KG'),
 (1050, 89, 0.02, 'LTR'),
+(1051, 1008409, 0.2, 'KG'),
 (1051, 127, 0.005, 'KG'),
 (1051, 89, 0.02, 'LTR'),
+(1052, 1008409, 0.2, 'KG'),
 (1052, 127, 0.005, 'KG'),
 (1052, 89, 0.02, 'LTR'),
+(1053, 1008409, 0.2, 'KG'),
 (1053, 127, 0.005, 'KG'),
 (1053, 89, 0.02, 'LTR'),
+(1054, 1008409, 0.2, 'KG'),
 (1054, 127, 0.005, 'KG'),
 (1054, 89, 0.02, 'LTR'),
+(1055, 1008409, 0.2, 'KG'),
 (1055, 127, 0.005, 'KG'),
 (1055, 89, 0.02, 'LTR'),
+(1056, 1008409, 0.2, 'KG'),
 (1056, 127, 0.005, 'KG'),
 (1056, 89, 0.02, 'LTR'),
+(1057, 1008409, 0.2, 'KG'),
 (1057, 127, 0.005, 'KG'),
 (1057, 89, 0.02, 'LTR'),
+(1058, 1008409, 0.2, 'KG'),
 (1058, 127, 0.005, 'KG'),
 (1058, 89, 0.02, 'LTR'),
+(1059, 1008409, 0.2, 'KG'),
 (1059, 127, 0.005, 'KG'),
 (1059, 89, 0.02, 'LTR'),
+(1060, 1008409, 0.2, 'KG'),
 (1060, 127, 0.005, 'KG'),
 (1060, 89, 0.02, 'LTR'),
+(1061, 1008409, 0.2, 'KG'),
 (1061, 127, 0.005, 'KG'),
 (1061, 89, 0.02, 'LTR'),
+(1062, 1008409, 0.2, 'KG'),
 (1062, 127, 0.005, 'KG'),
 (1062, 89, 0.02, 'LTR'),
+(1063, 1008409, 0.2, 'KG'),
 (1063, 127, 0.005, 'KG'),
 (1063, 89, 0.02, 'LTR'),
+(1064, 1008409, 0.2, 'KG'),
 (1064, 127, 0.005, 'KG'),
 (1064, 89, 0.02, 'LTR'),
+(1065, 1008409, 0.2, 'KG'),
 (1065, 127, 0.005, 'KG'),
 (1065, 89, 0.02, 'LTR'),
+(1066, 1008409, 0.2, 'KG'),
 (1066, 127, 0.005, 'KG'),
 (1066, 89, 0.02, 'LTR'),
+(1067, 1008409, 0.2, 'KG'),
 (1067, 127, 0.005, 'KG'),
 (1067, 89, 0.02, 'LTR'),
+(1068, 1008409, 0.2, 'KG'),
 (1068, 127, 0.005, 'KG'),
 (1068, 89, 0.02, 'LTR'),
+(1069, 1008409, 0.2, 'KG'),
 (1069, 127, 0.005, 'KG'),
 (1069, 89, 0.02, 'LTR'),
+(1070, 1008409, 0.2, 'KG'),
 (1070, 127, 0.005, 'KG'),
 (1070, 89, 0.02, 'LTR'),
+(1071, 1008409, 0.2, 'KG'),
 (1071, 127, 0.005, 'KG'),
 (1071, 89, 0.02, 'LTR'),
+(1072, 1008409, 0.2, 'KG'),
 (1072, 127, 0.005, 'KG'),
 (1072, 89, 0.02, 'LTR'),
+(1073, 1008409, 0.2, 'KG'),
 (1073, 127, 0.005, 'KG'),
 (1073, 89, 0.02, 'LTR'),
+(1074, 1008409, 0.2, 'KG'),
 (1074, 127, 0.005, 'KG'),
 (1074, 89, 0.02, 'LTR'),
+(1075, 1008409, 0.2, 'KG'),
 (1075, 127, 0.005, 'KG'),
 (1075, 89, 0.02, 'LTR'),
+(1076, 1008409, 0.2, 'KG'),
 (1076, 127, 0.005, 'KG'),
 (1076, 89, 0.02, 'LTR'),
+(1077, 1008409, 0.2, 'KG'),
 (1077, 127, 0.005, 'KG'),
 (1077, 89, 0.02, 'LTR'),
+(1078, 1008409, 0.2, 'KG'),
 (1078, 127, 0.005, 'KG'),
 (1078, 89, 0.02, 'LTR'),
+(1079, 1008409, 0.2, 'KG'),
 (1079, 127, 0.005, 'KG'),
 (1079, 89, 0.02, 'LTR'),
+(1080, 1008409, 0.2, 'KG'),
 (1080, 127, 0.005, 'KG'),
 (1080, 89, 0.02, 'LTR'),
+(1081, 1008409, 0.2, 'KG'),
 (1081, 127, 0.005, 'KG'),
 (1081, 89, 0.02, 'LTR'),
+(1082, 1008409, 0.2, 'KG'),
 (1082, 127, 0.005, 'KG'),
 (1082, 89, 0.02, 'LTR'),
+(1083, 1008409, 0.2, 'KG'),
 (1083, 127, 0.005, 'KG'),
 (1083, 89, 0.02, 'LTR'),
+(1084, 1008409, 0.2, 'KG'),
 (1084, 127, 0.005, 'KG'),
 (1084, 89, 0.02, 'LTR'),
+(1085, 1008409, 0.2, 'KG'),
 (1085, 127, 0.005, 'KG'),
 (1085, 89, 0.02, 'LTR'),
+(1086, 1008409, 0.2, 'KG'),
 (1086, 127, 0.005, 'KG'),
 (1086, 89, 0.02, 'LTR'),
+(1087, 1008409, 0.2, 'KG'),
 (1087, 127, 0.005, 'KG'),
 (1087, 89, 0.02, 'LTR'),
+(1088, 1008409, 0.2, 'KG'),
 (1088, 127, 0.005, 'KG'),
 (1088, 89, 0.02, 'LTR'),
+(1089, 1008409, 0.2, 'KG'),
 (1089, 127, 0.005, 'KG'),
 (1089, 89, 0.02, 'LTR'),
+(1090, 1008409, 0.2, 'KG'),
 (1090, 127, 0.005, 'KG'),
 (1090, 89, 0.02, 'LTR'),
+(1091, 1008409, 0.2, 'KG'),
 (1091, 127, 0.005, 'KG'),
 (1091, 89, 0.02, 'LTR'),
+(1092, 1008409, 0.2, 'KG'),
 (1092, 127, 0.005, 'KG'),
 (1092, 89, 0.02, 'LTR'),
+(1093, 1008409, 0.2, 'KG'),
 (1093, 127, 0.005, 'KG'),
 (1093, 89, 0.02, 'LTR'),
+(1094, 1008409, 0.2, 'KG'),
 (1094, 127, 0.005, 'KG'),
 (1094, 89, 0.02, 'LTR'),
+(1095, 1008409, 0.2, 'KG'),
 (1095, 127, 0.005, 'KG'),
 (1095, 89, 0.02, 'LTR'),
+(1096, 1008409, 0.2, 'KG'),
 (1096, 127, 0.005, 'KG'),
 (1096, 89, 0.02, 'LTR'),
+(1097, 1008409, 0.2, 'KG'),
 (1097, 127, 0.005, 'KG'),
 (1097, 89, 0.02, 'LTR'),
+(1098, 1008409, 0.2, 'KG'),
 (1098, 127, 0.005, 'KG'),
 (1098, 89, 0.02, 'LTR'),
+(1099, 1008409, 0.2, 'KG'),
 (1099, 127, 0.005, 'KG'),
 (1099, 89, 0.02, 'LTR'),
+(1100, 1008409, 0.2, 'KG'),
 (1100, 127, 0.005, 'KG'),
 (1100, 89, 0.02, 'LTR'),
+(1101, 1008409, 0.2, 'KG'),
 (1101, 127, 0.005, 'KG'),
 (1101, 89, 0.02, 'LTR'),
+(1102, 1008409, 0.2, 'KG'),
 (1102, 127, 0.005, 'KG'),
 (1102, 89, 0.02, 'LTR'),
+(1103, 1008409, 0.2, 'KG'),
 (1103, 127, 0.005, 'KG'),
 (1103, 89, 0.02, 'LTR'),
+(1104, 1008409, 0.2, 'KG'),
 (1104, 127, 0.005, 'KG'),
 (1104, 89, 0.02, 'LTR'),
+(1105, 1008409, 0.2, 'KG'),
 (1105, 127, 0.005, 'KG'),
 (1105, 89, 0.02, 'LTR'),
+(1106, 1008409, 0.2, 'KG'),
 (1106, 127, 0.005, 'KG'),
 (1106, 89, 0.02, 'LTR'),
+(1107, 1008409, 0.2, 'KG'),
 (1107, 127, 0.005, 'KG'),
 (1107, 89, 0.02, 'LTR'),
+(1108, 1008409, 0.2, 'KG'),
 (1108, 127, 0.005, 'KG'),
 (1108, 89, 0.02, 'LTR'),
+(1109, 1008409, 0.2, 'KG'),
 (1109, 127, 0.005, 'KG'),
 (1109, 89, 0.02, 'LTR'),
+(1110, 1008409, 0.2, 'KG'),
 (1110, 127, 0.005, 'KG'),
 (1110, 89, 0.02, 'LTR'),
+(1111, 1008409, 0.2, 'KG'),
 (1111, 127, 0.005, 'KG'),
 (1111, 89, 0.02, 'LTR'),
+(1112, 1008409, 0.2, 'KG'),
 (1112, 127, 0.005, 'KG'),
 (1112, 89, 0.02, 'LTR'),
+(1113, 1008409, 0.2, 'KG'),
 (1113, 127, 0.005, 'KG'),
 (1113, 89, 0.02, 'LTR'),
+(1114, 1008409, 0.2, 'KG'),
 (1114, 127, 0.005, 'KG'),
 (1114, 89, 0.02, 'LTR'),
+(1115, 1008409, 0.2, 'KG'),
 (1115, 127, 0.005, 'KG'),
 (1115, 89, 0.02, 'LTR'),
+(1116, 1008409, 0.2, 'KG'),
 (1116, 127, 0.005, 'KG'),
 (1116, 89, 0.02, 'LTR'),
+(1117, 1008409, 0.2, 'KG'),
 (1117, 127, 0.005, 'KG'),
 (1117, 89, 0.02, 'LTR'),
+(1118, 1008409, 0.2, 'KG'),
 (1118, 127, 0.005, 'KG'),
 (1118, 89, 0.02, 'LTR'),
+(1119, 1008409, 0.2, 'KG'),
 (1119, 127, 0.005, 'KG'),
 (1119, 89, 0.02, 'LTR'),
+(1120, 1008409, 0.2, 'KG'),
 (1120, 127, 0.005, 'KG'),
 (1120, 89, 0.02, 'LTR'),
+(1121, 1008409, 0.2, 'KG'),
 (1121, 127, 0.005, 'KG'),
 (1121, 89, 0.02, 'LTR'),
+(1122, 1008409, 0.2, 'KG'),
 (1122, 127, 0.005, 'KG'),
 (1122, 89, 0.02, 'LTR'),
+(1123, 1008409, 0.2, 'KG'),
 (1123, 127, 0.005, 'KG'),
 (1123, 89, 0.02, 'LTR'),
+(1124, 1008409, 0.2, 'KG'),
 (1124, 127, 0.005, 'KG'),
 (1124, 89, 0.02, 'LTR'),
+(1125, 1008409, 0.2, 'KG'),
 (1125, 127, 0.005, 'KG'),
 (1125, 89, 0.02, 'LTR'),
+(1126, 1008409, 0.2, 'KG'),
 (1126, 127, 0.005, 'KG'),
 (1126, 89, 0.02, 'LTR'),
+(1127, 1008409, 0.2, 'KG'),
 (1127, 127, 0.005, 'KG'),
 (1127, 89, 0.02, 'LTR'),
+(1128, 1008409, 0.2, 'KG'),
 (1128, 127, 0.005, 'KG'),
 (1128, 89, 0.02, 'LTR'),
+(1129, 1008409, 0.2, 'KG')
+ON CONFLICT DO NOTHING;
+
+INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (1129, 127, 0.005, 'KG'),
 (1129, 89, 0.02, 'LTR'),
+(1130, 1008409, 0.2, 'KG'),
 (1130, 127, 0.005, 'KG'),
 (1130, 89, 0.02, 'LTR'),
+(1131, 1008409, 0.2, 'KG'),
 (1131, 127, 0.005, 'KG'),
 (1131, 89, 0.02, 'LTR'),
+(1132, 1008409, 0.2, 'KG'),
 (1132, 127, 0.005, 'KG'),
 (1132, 89, 0.02, 'LTR'),
+(1133, 1008409, 0.2, 'KG'),
 (1133, 127, 0.005, 'KG'),
 (1133, 89, 0.02, 'LTR'),
+(1134, 1008409, 0.2, 'KG'),
 (1134, 127, 0.005, 'KG'),
 (1134, 89, 0.02, 'LTR'),
+(1135, 1008409, 0.2, 'KG'),
 (1135, 127, 0.005, 'KG'),
 (1135, 89, 0.02, 'LTR'),
+(1136, 1008409, 0.2, 'KG'),
 (1136, 127, 0.005, 'KG'),
 (1136, 89, 0.02, 'LTR'),
+(1137, 1008409, 0.2, 'KG'),
 (1137, 127, 0.005, 'KG'),
 (1137, 89, 0.02, 'LTR'),
+(1138, 1008409, 0.2, 'KG'),
 (1138, 127, 0.005, 'KG'),
 (1138, 89, 0.02, 'LTR'),
+(1139, 1008409, 0.2, 'KG'),
 (1139, 127, 0.005, 'KG'),
 (1139, 89, 0.02, 'LTR'),
+(1140, 1008409, 0.2, 'KG'),
 (1140, 127, 0.005, 'KG'),
 (1140, 89, 0.02, 'LTR'),
+(1141, 1008409, 0.2, 'KG'),
 (1141, 127, 0.005, 'KG'),
 (1141, 89, 0.02, 'LTR'),
+(1142, 1008409, 0.2, 'KG'),
 (1142, 127, 0.005, 'KG'),
 (1142, 89, 0.02, 'LTR'),
+(1143, 1008409, 0.2, 'KG'),
 (1143, 127, 0.005, 'KG'),
 (1143, 89, 0.02, 'LTR'),
+(1144, 1008409, 0.2, 'KG'),
 (1144, 127, 0.005, 'KG'),
 (1144, 89, 0.02, 'LTR'),
+(1145, 1008409, 0.2, 'KG'),
 (1145, 127, 0.005, 'KG'),
 (1145, 89, 0.02, 'LTR'),
+(1146, 1008409, 0.2, 'KG'),
 (1146, 127, 0.005, 'KG'),
 (1146, 89, 0.02, 'LTR'),
+(1147, 1008409, 0.2, 'KG'),
 (1147, 127, 0.005, 'KG'),
 (1147, 89, 0.02, 'LTR'),
+(1148, 1008409, 0.2, 'KG'),
 (1148, 127, 0.005, 'KG'),
 (1148, 89, 0.02, 'LTR'),
+(1149, 1008409, 0.2, 'KG'),
 (1149, 127, 0.005, 'KG'),
 (1149, 89, 0.02, 'LTR'),
+(1150, 1008409, 0.2, 'KG'),
 (1150, 127, 0.005, 'KG'),
 (1150, 89, 0.02, 'LTR'),
+(1151, 1008409, 0.2, 'KG'),
 (1151, 127, 0.005, 'KG'),
 (1151, 89, 0.02, 'LTR'),
+(1152, 1008409, 0.2, 'KG'),
 (1152, 127, 0.005, 'KG'),
 (1152, 89, 0.02, 'LTR'),
+(1153, 1008409, 0.2, 'KG'),
 (1153, 127, 0.005, 'KG'),
 (1153, 89, 0.02, 'LTR'),
+(1154, 1008409, 0.2, 'KG'),
 (1154, 127, 0.005, 'KG'),
 (1154, 89, 0.02, 'LTR'),
+(1155, 1008409, 0.2, 'KG'),
 (1155, 127, 0.005, 'KG'),
 (1155, 89, 0.02, 'LTR'),
+(1156, 1008409, 0.2, 'KG'),
 (1156, 127, 0.005, 'KG'),
 (1156, 89, 0.02, 'LTR'),
+(1157, 1008409, 0.2, 'KG'),
 (1157, 127, 0.005, 'KG'),
 (1157, 89, 0.02, 'LTR'),
+(1158, 1008409, 0.2, 'KG'),
 (1158, 127, 0.005, 'KG'),
 (1158, 89, 0.02, 'LTR'),
+(1159, 1008409, 0.2, 'KG'),
 (1159, 127, 0.005, 'KG'),
 (1159, 89, 0.02, 'LTR'),
+(1160, 1008409, 0.2, 'KG'),
 (1160, 127, 0.005, 'KG'),
 (1160, 89, 0.02, 'LTR'),
+(1161, 1008409, 0.2, 'KG'),
 (1161, 127, 0.005, 'KG'),
 (1161, 89, 0.02, 'LTR'),
+(1162, 1008409, 0.2, 'KG'),
 (1162, 127, 0.005, 'KG'),
 (1162, 89, 0.02, 'LTR'),
+(1163, 1008409, 0.2, 'KG'),
 (1163, 127, 0.005, 'KG'),
 (1163, 89, 0.02, 'LTR'),
+(1164, 1008409, 0.2, 'KG'),
 (1164, 127, 0.005, 'KG'),
 (1164, 89, 0.02, 'LTR'),
+(1165, 1008409, 0.2, 'KG'),
 (1165, 127, 0.005, 'KG'),
-(1165, 89, 0.02, 'LTR')
-ON CONFLICT DO NOTHING;
-INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
+(1165, 89, 0.02, 'LTR'),
+(1166, 1008409, 0.2, 'KG'),
 (1166, 127, 0.005, 'KG'),
 (1166, 89, 0.02, 'LTR'),
+(1167, 1008409, 0.2, 'KG'),
 (1167, 127, 0.005, 'KG'),
 (1167, 89, 0.02, 'LTR'),
+(1168, 1008409, 0.2, 'KG'),
 (1168, 127, 0.005, 'KG'),
 (1168, 89, 0.02, 'LTR'),
+(1169, 1008409, 0.2, 'KG'),
 (1169, 127, 0.005, 'KG'),
 (1169, 89, 0.02, 'LTR'),
+(1170, 1008409, 0.2, 'KG'),
 (1170, 127, 0.005, 'KG'),
 (1170, 89, 0.02, 'LTR'),
+(1171, 1008409, 0.2, 'KG'),
 (1171, 127, 0.005, 'KG'),
 (1171, 89, 0.02, 'LTR'),
+(1172, 1008409, 0.2, 'KG'),
 (1172, 127, 0.005, 'KG'),
 (1172, 89, 0.02, 'LTR'),
+(1173, 1008409, 0.2, 'KG'),
 (1173, 127, 0.005, 'KG'),
 (1173, 89, 0.02, 'LTR'),
+(1174, 1008409, 0.2, 'KG'),
 (1174, 127, 0.005, 'KG'),
 (1174, 89, 0.02, 'LTR'),
+(1175, 1008409, 0.2, 'KG'),
 (1175, 127, 0.005, 'KG'),
 (1175, 89, 0.02, 'LTR'),
+(1176, 1008409, 0.2, 'KG'),
 (1176, 127, 0.005, 'KG'),
 (1176, 89, 0.02, 'LTR'),
+(1177, 1008409, 0.2, 'KG'),
 (1177, 127, 0.005, 'KG'),
 (1177, 89, 0.02, 'LTR'),
+(1178, 1008409, 0.2, 'KG'),
 (1178, 127, 0.005, 'KG'),
 (1178, 89, 0.02, 'LTR'),
+(1179, 1008409, 0.2, 'KG'),
 (1179, 127, 0.005, 'KG'),
 (1179, 89, 0.02, 'LTR'),
+(1180, 1008409, 0.2, 'KG'),
 (1180, 127, 0.005, 'KG'),
 (1180, 89, 0.02, 'LTR'),
+(1181, 1008409, 0.2, 'KG'),
 (1181, 127, 0.005, 'KG'),
 (1181, 89, 0.02, 'LTR'),
+(1182, 1008409, 0.2, 'KG'),
 (1182, 127, 0.005, 'KG'),
 (1182, 89, 0.02, 'LTR'),
+(1183, 1008409, 0.2, 'KG'),
 (1183, 127, 0.005, 'KG'),
 (1183, 89, 0.02, 'LTR'),
+(1184, 1008409, 0.2, 'KG'),
 (1184, 127, 0.005, 'KG'),
 (1184, 89, 0.02, 'LTR'),
+(1185, 1008409, 0.2, 'KG'),
 (1185, 127, 0.005, 'KG'),
 (1185, 89, 0.02, 'LTR'),
+(1186, 1008409, 0.2, 'KG'),
 (1186, 127, 0.005, 'KG'),
 (1186, 89, 0.02, 'LTR'),
+(1187, 1008409, 0.2, 'KG'),
 (1187, 127, 0.005, 'KG'),
 (1187, 89, 0.02, 'LTR'),
+(1188, 1008409, 0.2, 'KG'),
 (1188, 127, 0.005, 'KG'),
 (1188, 89, 0.02, 'LTR'),
+(1189, 1008409, 0.2, 'KG'),
 (1189, 127, 0.005, 'KG'),
 (1189, 89, 0.02, 'LTR'),
+(1190, 1008409, 0.2, 'KG'),
 (1190, 127, 0.005, 'KG'),
 (1190, 89, 0.02, 'LTR'),
+(1191, 1008409, 0.2, 'KG'),
 (1191, 127, 0.005, 'KG'),
 (1191, 89, 0.02, 'LTR'),
+(1192, 1008409, 0.2, 'KG'),
 (1192, 127, 0.005, 'KG'),
 (1192, 89, 0.02, 'LTR'),
+(1193, 1008409, 0.2, 'KG'),
 (1193, 127, 0.005, 'KG'),
 (1193, 89, 0.02, 'LTR'),
+(1194, 1008409, 0.2, 'KG'),
 (1194, 127, 0.005, 'KG'),
 (1194, 89, 0.02, 'LTR'),
+(1195, 1008409, 0.2, 'KG'),
 (1195, 127, 0.005, 'KG'),
 (1195, 89, 0.02, 'LTR'),
+(1196, 1008409, 0.2, 'KG'),
 (1196, 127, 0.005, 'KG'),
 (1196, 89, 0.02, 'LTR'),
+(1197, 1008409, 0.2, 'KG'),
 (1197, 127, 0.005, 'KG'),
 (1197, 89, 0.02, 'LTR'),
+(1198, 1008409, 0.2, 'KG'),
 (1198, 127, 0.005, 'KG'),
 (1198, 89, 0.02, 'LTR'),
+(1199, 1008409, 0.2, 'KG'),
 (1199, 127, 0.005, 'KG'),
 (1199, 89, 0.02, 'LTR'),
+(1200, 1008409, 0.2, 'KG'),
 (1200, 127, 0.005, 'KG'),
 (1200, 89, 0.02, 'LTR'),
+(1201, 1008409, 0.2, 'KG'),
 (1201, 127, 0.005, 'KG'),
 (1201, 89, 0.02, 'LTR'),
+(1202, 1008409, 0.2, 'KG'),
 (1202, 127, 0.005, 'KG'),
 (1202, 89, 0.02, 'LTR'),
+(1203, 1008409, 0.2, 'KG'),
 (1203, 127, 0.005, 'KG'),
 (1203, 89, 0.02, 'LTR'),
+(1204, 1008409, 0.2, 'KG'),
 (1204, 127, 0.005, 'KG'),
 (1204, 89, 0.02, 'LTR'),
+(1205, 1008409, 0.2, 'KG'),
 (1205, 127, 0.005, 'KG'),
 (1205, 89, 0.02, 'LTR'),
+(1206, 1008409, 0.2, 'KG'),
 (1206, 127, 0.005, 'KG'),
 (1206, 89, 0.02, 'LTR'),
+(1207, 1008409, 0.2, 'KG'),
 (1207, 127, 0.005, 'KG'),
 (1207, 89, 0.02, 'LTR'),
+(1208, 1008409, 0.2, 'KG'),
 (1208, 127, 0.005, 'KG'),
 (1208, 89, 0.02, 'LTR'),
+(1209, 1008409, 0.2, 'KG'),
 (1209, 127, 0.005, 'KG'),
 (1209, 89, 0.02, 'LTR'),
+(1210, 1008409, 0.2, 'KG'),
 (1210, 127, 0.005, 'KG'),
 (1210, 89, 0.02, 'LTR'),
+(1211, 1008409, 0.2, 'KG'),
 (1211, 127, 0.005, 'KG'),
 (1211, 89, 0.02, 'LTR'),
+(1212, 1008409, 0.2, 'KG'),
 (1212, 127, 0.005, 'KG'),
 (1212, 89, 0.02, 'LTR'),
+(1213, 1008409, 0.2, 'KG'),
 (1213, 127, 0.005, 'KG'),
 (1213, 89, 0.02, 'LTR'),
+(1214, 1008409, 0.2, 'KG'),
 (1214, 127, 0.005, 'KG'),
 (1214, 89, 0.02, 'LTR'),
+(1215, 1008409, 0.2, 'KG'),
 (1215, 127, 0.005, 'KG'),
 (1215, 89, 0.02, 'LTR'),
+(1216, 1008409, 0.2, 'KG'),
 (1216, 127, 0.005, 'KG'),
 (1216, 89, 0.02, 'LTR'),
+(1217, 1008409, 0.2, 'KG'),
 (1217, 127, 0.005, 'KG'),
 (1217, 89, 0.02, 'LTR'),
+(1218, 1008409, 0.2, 'KG'),
 (1218, 127, 0.005, 'KG'),
 (1218, 89, 0.02, 'LTR'),
+(1219, 1008409, 0.2, 'KG'),
 (1219, 127, 0.005, 'KG'),
 (1219, 89, 0.02, 'LTR'),
+(1220, 1008409, 0.2, 'KG'),
 (1220, 127, 0.005, 'KG'),
 (1220, 89, 0.02, 'LTR'),
+(1221, 1008409, 0.2, 'KG'),
 (1221, 127, 0.005, 'KG'),
 (1221, 89, 0.02, 'LTR'),
+(1222, 1008409, 0.2, 'KG'),
 (1222, 127, 0.005, 'KG'),
 (1222, 89, 0.02, 'LTR'),
+(1223, 1008409, 0.2, 'KG'),
 (1223, 127, 0.005, 'KG'),
 (1223, 89, 0.02, 'LTR'),
+(1224, 1008409, 0.2, 'KG'),
 (1224, 127, 0.005, 'KG'),
 (1224, 89, 0.02, 'LTR'),
+(1225, 1008409, 0.2, 'KG'),
 (1225, 127, 0.005, 'KG'),
 (1225, 89, 0.02, 'LTR'),
+(1226, 1008409, 0.2, 'KG'),
 (1226, 127, 0.005, 'KG'),
 (1226, 89, 0.02, 'LTR'),
+(1227, 1008409, 0.2, 'KG'),
 (1227, 127, 0.005, 'KG'),
 (1227, 89, 0.02, 'LTR'),
+(1228, 1008409, 0.2, 'KG'),
 (1228, 127, 0.005, 'KG'),
 (1228, 89, 0.02, 'LTR'),
+(1229, 1008409, 0.2, 'KG'),
 (1229, 127, 0.005, 'KG'),
 (1229, 89, 0.02, 'LTR'),
+(1230, 1008409, 0.2, 'KG'),
 (1230, 127, 0.005, 'KG'),
 (1230, 89, 0.02, 'LTR'),
+(1231, 1008409, 0.2, 'KG'),
 (1231, 127, 0.005, 'KG'),
 (1231, 89, 0.02, 'LTR'),
+(1232, 1008409, 0.2, 'KG'),
 (1232, 127, 0.005, 'KG'),
 (1232, 89, 0.02, 'LTR'),
+(1233, 1008409, 0.2, 'KG'),
 (1233, 127, 0.005, 'KG'),
 (1233, 89, 0.02, 'LTR'),
+(1234, 1008409, 0.2, 'KG'),
 (1234, 127, 0.005, 'KG'),
 (1234, 89, 0.02, 'LTR'),
+(1235, 1008409, 0.2, 'KG'),
 (1235, 127, 0.005, 'KG'),
 (1235, 89, 0.02, 'LTR'),
+(1236, 1008409, 0.2, 'KG'),
 (1236, 127, 0.005, 'KG'),
 (1236, 89, 0.02, 'LTR'),
+(1237, 1008409, 0.2, 'KG'),
 (1237, 127, 0.005, 'KG'),
 (1237, 89, 0.02, 'LTR'),
+(1238, 1008409, 0.2, 'KG'),
 (1238, 127, 0.005, 'KG'),
 (1238, 89, 0.02, 'LTR'),
+(1239, 1008409, 0.2, 'KG'),
 (1239, 127, 0.005, 'KG'),
 (1239, 89, 0.02, 'LTR'),
+(1240, 1008409, 0.2, 'KG'),
 (1240, 127, 0.005, 'KG'),
 (1240, 89, 0.02, 'LTR'),
+(1241, 1008409, 0.2, 'KG'),
 (1241, 127, 0.005, 'KG'),
 (1241, 89, 0.02, 'LTR'),
+(1242, 1008409, 0.2, 'KG'),
 (1242, 127, 0.005, 'KG'),
 (1242, 89, 0.02, 'LTR'),
+(1243, 1008409, 0.2, 'KG'),
 (1243, 127, 0.005, 'KG'),
 (1243, 89, 0.02, 'LTR'),
+(1244, 1008409, 0.2, 'KG'),
 (1244, 127, 0.005, 'KG'),
 (1244, 89, 0.02, 'LTR'),
+(1245, 1008409, 0.2, 'KG'),
 (1245, 127, 0.005, 'KG'),
 (1245, 89, 0.02, 'LTR'),
+(1246, 1008409, 0.2, 'KG'),
 (1246, 127, 0.005, 'KG'),
 (1246, 89, 0.02, 'LTR'),
+(1247, 1008409, 0.2, 'KG'),
 (1247, 127, 0.005, 'KG'),
 (1247, 89, 0.02, 'LTR'),
+(1248, 1008409, 0.2, 'KG'),
 (1248, 127, 0.005, 'KG'),
 (1248, 89, 0.02, 'LTR'),
+(1249, 1008409, 0.2, 'KG'),
 (1249, 127, 0.005, 'KG'),
 (1249, 89, 0.02, 'LTR'),
+(1250, 1008409, 0.2, 'KG'),
 (1250, 127, 0.005, 'KG'),
 (1250, 89, 0.02, 'LTR'),
+(1251, 1008409, 0.2, 'KG'),
 (1251, 127, 0.005, 'KG'),
 (1251, 89, 0.02, 'LTR'),
+(1252, 1008409, 0.2, 'KG'),
 (1252, 127, 0.005, 'KG'),
 (1252, 89, 0.02, 'LTR'),
+(1253, 1008409, 0.2, 'KG'),
 (1253, 127, 0.005, 'KG'),
 (1253, 89, 0.02, 'LTR'),
+(1254, 1008409, 0.2, 'KG'),
 (1254, 127, 0.005, 'KG'),
 (1254, 89, 0.02, 'LTR'),
+(1255, 1008409, 0.2, 'KG'),
 (1255, 127, 0.005, 'KG'),
 (1255, 89, 0.02, 'LTR'),
 (1256, 166, 0.15, 'KG'),
@@ -5042,3 +6276,4 @@ INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES
 (1329, 149, 0.001, 'KG'),
 (1329, 13, 0.2, 'LTR')
 ON CONFLICT DO NOTHING;
+
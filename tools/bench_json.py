@@ -0,0 +1,68 @@
+"""
+Throughput of the list endpoints with and without the FAST_JSON path.
+
+"validated" is the default: ORM objects converted through response_model.
+"fast" selects Core row tuples and renders them with orjson. Both serve the
+same page of the bundled menu, and the bodies must match.
+
+Usage: python tools/bench_json.py [--rounds 50] [--limit N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+import backend.services.serialization as serialization
+from backend.database import SessionLocal
+from backend.main import app
+from backend.models import MenuItem
+
+PATHS = {"validated": False, "fast": True}
+
+
+def bench(client, url, params, rounds):
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        response = client.get(url, params=params)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return response, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the Pydantic-validated and fast JSON list paths.")
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=None, help="Page size; defaults to one less than the menu size so the ETag cache is bypassed.")
+    args = parser.parse_args()
+
+    if serialization.orjson is None:
+        print("orjson is not installed; the fast path falls back to the stdlib encoder.")
+    with SessionLocal() as db:
+        menu_count = db.query(MenuItem).count()
+    limit = args.limit or max(menu_count - 1, 1)
+
+    client = TestClient(app)
+    results = {}
+    for label, enabled in PATHS.items():
+        serialization.FAST_JSON_ENABLED = enabled
+        bench(client, "/menu-items", {"limit": limit}, 3)  # warm caches and pool
+        response, timings = bench(client, "/menu-items", {"limit": limit}, args.rounds)
+        results[label] = (response.json(), timings)
+        mean = statistics.mean(timings)
+        print(f"{label:>9}: {limit} rows  p50 {statistics.median(timings):7.2f} ms  mean {mean:7.2f} ms  "
+              f"{1000 / mean:7.1f} req/s  {len(response.content)} bytes")
+
+    same = results["validated"][0] == results["fast"][0]
+    speedup = statistics.mean(results["validated"][1]) / statistics.mean(results["fast"][1])
+    print(f"Bodies identical: {same}  speedup: {speedup:.2f}x")
+    sys.exit(0 if same else 1)
+
+
+if __name__ == "__main__":
+    main()
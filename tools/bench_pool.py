@@ -0,0 +1,59 @@
+"""
+Per-request latency of each DB_POOL_MODE against DATABASE_URL.
+
+A "request" is what the API does per call: open a session, run one small
+indexed query, close the session. Each mode gets its own engine.
+
+Usage: python tools/bench_pool.py [--requests 200] [--modes null,single,persistent,pre_ping]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import POOL_MODES, SQLALCHEMY_DATABASE_URL, ReconnectingSession, create_db_engine
+from backend.models import MenuItem
+
+
+def bench(mode, n_requests):
+    engine = create_db_engine(SQLALCHEMY_DATABASE_URL, mode)
+    Session = sessionmaker(bind=engine, autoflush=False, class_=ReconnectingSession)
+    timings = []
+    try:
+        for i in range(n_requests + 1):
+            started = time.perf_counter()
+            db = Session()
+            try:
+                db.query(MenuItem.name).filter(MenuItem.id == (i % 50) + 1).first()
+            finally:
+                db.close()
+            if i:  # first request pays for the initial connect in every mode
+                timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        engine.dispose()
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1], statistics.mean(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--modes", default="null,single,persistent,pre_ping")
+    args = parser.parse_args()
+
+    print(f"URL: {SQLALCHEMY_DATABASE_URL[:30]}...  ({args.requests} requests per mode)")
+    print(f"{'mode':<12}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}")
+    for mode in args.modes.split(","):
+        if mode not in POOL_MODES:
+            parser.error(f"unknown mode {mode!r}")
+        p50, p95, mean = bench(mode, args.requests)
+        print(f"{mode:<12}{p50:>10.3f}{p95:>10.3f}{mean:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
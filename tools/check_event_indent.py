@@ -0,0 +1,49 @@
+"""
+Consistency check for the materialized event_indent table: every event's
+stored indent is compared against a full recompute of its planned menu.
+
+Usage: python tools/check_event_indent.py [--events 1,2,3] [--repair]
+Runs against DATABASE_URL (default catering.db). Exits 1 on any mismatch
+unless --repair rebuilt the affected events.
+"""
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.database import SessionLocal
+from backend.services.event_indent import check_event_indent, rebuild_event_indent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare event_indent against a full recompute.")
+    parser.add_argument("--events", default=None, help="Comma-separated event ids (default: all events).")
+    parser.add_argument("--repair", action="store_true", help="Rebuild the events that disagree.")
+    args = parser.parse_args()
+    event_ids = [int(e) for e in args.events.split(",")] if args.events else None
+
+    db = SessionLocal()
+    try:
+        mismatches = check_event_indent(db, event_ids)
+        for m in mismatches[:20]:
+            print(f"  event {m['event_id']} ingredient {m['ingredient_id']} ({m['unit']}): "
+                  f"materialized={m['materialized']} expected={m['expected']}")
+        if len(mismatches) > 20:
+            print(f"  ... {len(mismatches) - 20} more")
+        broken = sorted({m["event_id"] for m in mismatches})
+        print(f"{len(mismatches)} mismatched lines across {len(broken)} events.")
+
+        if broken and args.repair:
+            rebuild_event_indent(db, broken)
+            db.commit()
+            remaining = check_event_indent(db, broken)
+            print(f"Rebuilt {len(broken)} events; {len(remaining)} mismatches remain.")
+            sys.exit(1 if remaining else 0)
+        sys.exit(1 if mismatches else 0)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
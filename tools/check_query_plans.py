@@ -0,0 +1,106 @@
+"""
+Query-plan regression check: runs EXPLAIN QUERY PLAN on SQLite for the hot
+queries (recipe lookups, plan lookups, event date ranges, the procurement
+roll-up) and fails if any of them falls back to a full table scan.
+
+Usage: python tools/check_query_plans.py [--database] [--verbose]
+By default the schema is built in memory from backend.models, which checks
+the index definitions themselves. --database checks DATABASE_URL (default
+catering.db) instead; bring it up to date with `alembic upgrade head` first,
+since Alembic owns the schema. Exits 1 when a query is not served by an index.
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, func, inspect, select
+
+from backend.models import Base, Event, EventIndent, ProductionPlan, Recipe
+from backend.services.procurement import requirements_statement
+
+SAMPLE_IDS = [1, 2, 3, 5, 8]
+
+
+def hot_queries():
+    """(description, statement, tables that must be reached through an index)."""
+    start, end = datetime(2026, 1, 1), datetime(2026, 1, 31, 23, 59, 59)
+    return [
+        ("recipe lines of a menu selection (BOM, event_indent deltas)",
+         select(Recipe.ingredient_id, Recipe.unit, func.sum(Recipe.quantity))
+         .where(Recipe.menu_item_id.in_(SAMPLE_IDS))
+         .group_by(Recipe.ingredient_id, Recipe.unit),
+         ["recipes"]),
+        ("recipe lines using an ingredient",
+         select(Recipe.menu_item_id, Recipe.quantity).where(Recipe.ingredient_id == 1),
+         ["recipes"]),
+        ("one (menu item, ingredient) line",
+         select(Recipe.id).where(Recipe.menu_item_id == 1, Recipe.ingredient_id == 2),
+         ["recipes"]),
+        ("production plan of an event",
+         select(ProductionPlan).where(ProductionPlan.event_id == 1),
+         ["production_plan"]),
+        ("events planning a menu item (sync)",
+         select(ProductionPlan.event_id).where(ProductionPlan.menu_item_id.in_(SAMPLE_IDS)).distinct(),
+         ["production_plan"]),
+        ("events in a date range",
+         select(Event.id).where(Event.date >= start, Event.date <= end),
+         ["events"]),
+        ("procurement roll-up over a date range (plan_procurement)",
+         requirements_statement(start, end),
+         ["events", "production_plan", "recipes"]),
+        ("materialized indent of an event",
+         select(EventIndent).where(EventIndent.event_id == 1),
+         ["event_indent"]),
+    ]
+
+
+def explain(conn, stmt):
+    sql = str(stmt.compile(conn, compile_kwargs={"literal_binds": True}))
+    return [row[-1] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql)]
+
+
+def unindexed(plan, tables):
+    """Tables of `tables` the plan does not reach through an index search."""
+    searched = {line.split()[1] for line in plan if line.startswith("SEARCH ")}
+    return [t for t in tables if t not in searched]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Assert the hot queries use indexes (SQLite).")
+    parser.add_argument("--database", action="store_true", help="Check DATABASE_URL instead of an in-memory schema.")
+    parser.add_argument("--verbose", action="store_true", help="Print every query plan.")
+    args = parser.parse_args()
+
+    if args.database:
+        from backend.database import engine
+    else:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine)
+    if engine.dialect.name != "sqlite":
+        sys.exit(f"EXPLAIN QUERY PLAN checks need SQLite, not {engine.dialect.name}.")
+
+    failures = 0
+    with engine.connect() as conn:
+        present = set(inspect(conn).get_table_names())
+        for description, stmt, tables in hot_queries():
+            if not present.issuperset(tables):
+                print(f"skip {description} (missing table)")
+                continue
+            plan = explain(conn, stmt)
+            missing = unindexed(plan, tables)
+            print(f"{'FAIL' if missing else 'ok  '} {description}")
+            if missing or args.verbose:
+                for line in plan:
+                    print(f"       {line}")
+            if missing:
+                print(f"       full scan of: {', '.join(missing)}")
+                failures += 1
+    print(f"{failures} of {len(hot_queries())} hot queries not served by an index.")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
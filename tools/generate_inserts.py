@@ -1,82 +1,226 @@
+import argparse
+import itertools
+import os
+import sys
+from functools import reduce
+
 import pandas as pd
-import math
-
-def clean_sql_string(s):
-    if pd.isna(s):
-        return "NULL"
-    return "'" + str(s).replace("'", "''") + "'"
-
-def generate_inserts():
-    print("Generating seeds.sql...")
-    
-    with open("seeds.sql", "w", encoding='utf-8') as f:
-        # 1. Ingredients
-        print("Processing Ingredients...")
-        try:
-            inventory_df = pd.read_csv("food inventory.csv", on_bad_lines='skip')
-        except TypeError:
-            inventory_df = pd.read_csv("food inventory.csv", error_bad_lines=False)
-            
-        values_list = []
-        seen_ids = set()
-        
-        for _, row in inventory_df.iterrows():
-            item_id = row['Item ID']
-            if pd.isna(item_id) or item_id in seen_ids:
-                continue
-            seen_ids.add(item_id)
-
-            val = f"({item_id}, {clean_sql_string(row['Item Name'])}, {clean_sql_string(row['Category'])}, {clean_sql_string(row.get('Regional Name'))}, {clean_sql_string(row.get('Brand'))}, {clean_sql_string(row.get('Package Size'))}, {clean_sql_string(row['Unit'])}, {row['Stock Quantity'] if pd.notna(row['Stock Quantity']) else 0.0})"
-            values_list.append(val)
-        
-        if values_list:
-            f.write(f"INSERT INTO ingredients (id, name, category, regional_name, brand, package_size, unit, stock_qty) VALUES\n")
-            f.write(",\n".join(values_list))
-            f.write("\nON CONFLICT (id) DO NOTHING;\n\n")
-
-        # 2. Menu Items
-        print("Processing Menu Items...")
-        recipes_df = pd.read_csv("Master_Recipes_Generated.csv")
-        menu_items_group = recipes_df.groupby('Menu Item ID').first()
-        
-        values_list = []
-        for menu_id, row in menu_items_group.iterrows():
-            if pd.isna(menu_id): continue
-            diet = "Non-Veg" if "Non-Veg" in str(row['Menu Category']) else "Veg"
-            val = f"({int(menu_id)}, {clean_sql_string(row['Menu Item Name'])}, {clean_sql_string(row['Menu Category'])}, {clean_sql_string(row['Menu Sub-Category'])}, '{diet}')"
-            values_list.append(val)
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.services.fresh import FreshIdRegistry, fresh_ingredient_frame, fresh_ingredient_ids, is_fresh_line
+
+CHUNK_ROWS = 1000  # rows per INSERT statement / CSV read
+SQLITE_ROWS_PER_INSERT = 500  # stays under SQLITE_MAX_COMPOUND_SELECT on old builds
+
+# Column order and Postgres types used by every output format
+TABLES = {
+    "ingredients": {
+        "columns": {"id": "INTEGER", "name": "TEXT", "category": "TEXT", "regional_name": "TEXT", "brand": "TEXT",
+                    "package_size": "TEXT", "unit": "TEXT", "stock_qty": "FLOAT"},
+        "conflict": "ON CONFLICT (id) DO NOTHING",
+    },
+    "menu_items": {
+        "columns": {"id": "INTEGER", "name": "TEXT", "category": "TEXT", "sub_category": "TEXT", "diet_type": "TEXT"},
+        "conflict": "ON CONFLICT (id) DO NOTHING",
+    },
+    "recipes": {
+        "columns": {"menu_item_id": "INTEGER", "ingredient_id": "INTEGER", "quantity": "FLOAT", "unit": "TEXT"},
+        "conflict": "ON CONFLICT DO NOTHING",
+    },
+}
+
+# --- Vectorized cell rendering ---
+def sql_literals(col):
+    if pd.api.types.is_numeric_dtype(col):
+        return col.astype(str).where(col.notna(), "NULL")
+    quoted = "'" + col.astype(str).str.replace("'", "''", regex=False) + "'"
+    return quoted.where(col.notna(), "NULL")
+
+def copy_fields(col):
+    # PostgreSQL COPY text format: backslash escapes, \N for NULL
+    text = col.astype(str)
+    for raw, escaped in (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r")):
+        text = text.str.replace(raw, escaped, regex=False)
+    return text.where(col.notna(), "\\N")
+
+def render_rows(df, render_cell, sep):
+    if df.empty:
+        return []
+    return reduce(lambda a, b: a + sep + b, (render_cell(df[c]) for c in df.columns)).tolist()
+
+# --- Writers: one per output format ---
+class InsertWriter:
+    """Multi-row INSERT ... ON CONFLICT statements (Postgres and SQLite >= 3.24)."""
+    def __init__(self, f):
+        self.f = f
+
+    def header(self):
+        pass
+
+    def begin(self, table):
+        pass
+
+    def rows(self, table, df):
+        values_list = ["(" + row + ")" for row in render_rows(df, sql_literals, ", ")]
         if values_list:
-            f.write(f"INSERT INTO menu_items (id, name, category, sub_category, diet_type) VALUES\n")
-            f.write(",\n".join(values_list))
-            f.write("\nON CONFLICT (id) DO NOTHING;\n\n")
-
-        # 3. Recipes
-        print("Processing Recipes...")
-        values_list = []
-        for _, row in recipes_df.iterrows():
-            menu_id = row['Menu Item ID']
-            ing_id_raw = row['Ingredient ID']
-            
-            if pd.notna(ing_id_raw):
-                try:
-                    ing_id = int(float(ing_id_raw))
-                    if ing_id in seen_ids: # valid ingredient
-                        val = f"({int(menu_id)}, {ing_id}, {row['Quantity']}, {clean_sql_string(row['Unit'])})"
-                        values_list.append(val)
-                except ValueError:
-                    continue
-        
-        if values_list:
-            # Split into chunks of 1000 to avoid limits
-            chunk_size = 1000
-            for i in range(0, len(values_list), chunk_size):
-                chunk = values_list[i:i + chunk_size]
-                f.write(f"INSERT INTO recipes (menu_item_id, ingredient_id, quantity, unit) VALUES\n")
-                f.write(",\n".join(chunk))
-                f.write("\nON CONFLICT DO NOTHING;\n")
+            self.f.write(f"INSERT INTO {table} ({', '.join(df.columns)}) VALUES\n")
+            self.f.write(",\n".join(values_list))
+            self.f.write(f"\n{TABLES[table]['conflict']};\n\n")
+
+    def end(self, table):
+        pass
+
+    def footer(self):
+        pass
+
+class SQLiteWriter(InsertWriter):
+    """One transaction of INSERT OR IGNORE batches; `sqlite3 catering.db < seeds.sqlite.sql`."""
+    def header(self):
+        self.f.write("PRAGMA synchronous = OFF;\nBEGIN TRANSACTION;\n")
+
+    def rows(self, table, df):
+        values_list = ["(" + row + ")" for row in render_rows(df, sql_literals, ", ")]
+        for i in range(0, len(values_list), SQLITE_ROWS_PER_INSERT):
+            self.f.write(f"INSERT OR IGNORE INTO {table} ({', '.join(df.columns)}) VALUES\n")
+            self.f.write(",\n".join(values_list[i:i + SQLITE_ROWS_PER_INSERT]))
+            self.f.write(";\n")
+
+    def footer(self):
+        self.f.write("COMMIT;\n")
+
+class CopyWriter:
+    """
+    PostgreSQL COPY ... FROM STDIN blocks (load with `psql -f`).
+    Rows land in a temp table first so the merge keeps ON CONFLICT DO NOTHING semantics.
+    """
+    def __init__(self, f):
+        self.f = f
+
+    def header(self):
+        self.f.write("BEGIN;\n")
+
+    def begin(self, table):
+        columns = TABLES[table]["columns"]
+        self.f.write(f"CREATE TEMP TABLE _seed_{table} ({', '.join(f'{c} {t}' for c, t in columns.items())}) ON COMMIT DROP;\n")
+        self.f.write(f"COPY _seed_{table} ({', '.join(columns)}) FROM STDIN;\n")
+
+    def rows(self, table, df):
+        lines = render_rows(df, copy_fields, "\t")
+        if lines:
+            self.f.write("\n".join(lines))
+            self.f.write("\n")
+
+    def end(self, table):
+        columns = ", ".join(TABLES[table]["columns"])
+        self.f.write("\\.\n")
+        self.f.write(f"INSERT INTO {table} ({columns}) SELECT {columns} FROM _seed_{table} {TABLES[table]['conflict']};\n\n")
+
+    def footer(self):
+        self.f.write("COMMIT;\n")
+
+WRITERS = {"insert": InsertWriter, "copy": CopyWriter, "sqlite": SQLiteWriter}
+
+# --- Chunk -> table frames (vectorized) ---
+def read_inventory_chunks(path, chunk_rows):
+    try:
+        return pd.read_csv(path, on_bad_lines='skip', chunksize=chunk_rows)
+    except TypeError:
+        return pd.read_csv(path, error_bad_lines=False, chunksize=chunk_rows)
+
+def ingredient_frames(chunks, seen_ids, issued):
+    # seen_ids is filled as we go: recipes are only emitted for known ingredients
+    for chunk in chunks:
+        ids = pd.to_numeric(chunk['Item ID'], errors='coerce')
+        keep = ids.notna() & ~ids.isin(seen_ids) & ~ids.duplicated()
+        chunk, ids = chunk[keep], ids[keep].astype("int64")
+        seen_ids.update(ids.tolist())
+        issued.claim_existing(zip(ids, chunk['Item Name']))  # inventory ids in the fresh range
+        yield pd.DataFrame({
+            "id": ids,
+            "name": chunk['Item Name'],
+            "category": chunk['Category'],
+            "regional_name": chunk.get('Regional Name'),
+            "brand": chunk.get('Brand'),
+            "package_size": chunk.get('Package Size'),
+            "unit": chunk['Unit'],
+            "stock_qty": chunk['Stock Quantity'].fillna(0.0),
+        })
+
+def fresh_ingredient_frames(chunks, seen_ids, issued):
+    # Fresh produce from the recipes CSV, appended to the ingredients table; `issued`
+    # spans every chunk, so only ids already emitted for the same name are skipped
+    for chunk in chunks:
+        fresh = fresh_ingredient_frame(chunk, issued)
+        fresh = fresh[~fresh["id"].isin(seen_ids)]
+        seen_ids.update(fresh["id"].tolist())
+        yield fresh
+
+def menu_item_frames(chunks, seen_menu_ids):
+    for chunk in chunks:
+        first = chunk.dropna(subset=['Menu Item ID']).groupby('Menu Item ID', sort=False).first().reset_index()
+        first = first[~first['Menu Item ID'].isin(seen_menu_ids)]
+        seen_menu_ids.update(first['Menu Item ID'].tolist())
+        yield pd.DataFrame({
+            "id": first['Menu Item ID'].astype("int64"),
+            "name": first['Menu Item Name'],
+            "category": first['Menu Category'],
+            "sub_category": first['Menu Sub-Category'],
+            "diet_type": first['Menu Category'].astype(str).str.contains("Non-Veg", regex=False).map({True: "Non-Veg", False: "Veg"}),
+        })
+
+def recipe_frames(chunks, seen_ids):
+    for chunk in chunks:
+        ing_ids = pd.to_numeric(chunk['Ingredient ID'], errors='coerce')
+        fresh = is_fresh_line(chunk)
+        if fresh.any():
+            ing_ids = ing_ids.where(~fresh, fresh_ingredient_ids(chunk['Ingredient Name'].where(fresh)))
+        keep = ing_ids.notna() & ing_ids.isin(seen_ids)  # valid ingredient
+        chunk = chunk[keep]
+        yield pd.DataFrame({
+            "menu_item_id": chunk['Menu Item ID'].astype("int64"),
+            "ingredient_id": ing_ids[keep].astype("int64"),
+            "quantity": chunk['Quantity'],
+            "unit": chunk['Unit'],
+        })
+
+def generate_inserts(output="seeds.sql", inventory="food inventory.csv", recipes="Master_Recipes_Generated.csv",
+                     chunk_rows=CHUNK_ROWS, fmt="insert"):
+    # Streams every CSV in chunks and writes each statement as soon as it is built,
+    # so memory stays bounded by chunk_rows however large the catalogue is.
+    print(f"Generating {output} ({fmt} format)...")
+    seen_ids = set()
+    issued = FreshIdRegistry()
+    stages = [
+        ("ingredients", "Processing Ingredients...", lambda: itertools.chain(
+            ingredient_frames(read_inventory_chunks(inventory, chunk_rows), seen_ids, issued),
+            fresh_ingredient_frames(pd.read_csv(recipes, chunksize=chunk_rows), seen_ids, issued),
+        )),
+        ("menu_items", "Processing Menu Items...", lambda: menu_item_frames(pd.read_csv(recipes, chunksize=chunk_rows), set())),
+        ("recipes", "Processing Recipes...", lambda: recipe_frames(pd.read_csv(recipes, chunksize=chunk_rows), seen_ids)),
+    ]
+
+    with open(output, "w", encoding='utf-8') as f:
+        writer = WRITERS[fmt](f)
+        writer.header()
+        for table, message, frames in stages:
+            print(message)
+            writer.begin(table)
+            for df in frames():
+                writer.rows(table, df)
+            writer.end(table)
+        writer.footer()
 
-    print("seeds.sql generated.")
+    print(f"{output} generated.")
 
 if __name__ == "__main__":
-    generate_inserts()
+    parser = argparse.ArgumentParser(description="Generate seed SQL from the bundled CSVs.")
+    parser.add_argument("--output", default=None, help="Defaults to seeds.sql (insert), seeds.copy.sql or seeds.sqlite.sql.")
+    parser.add_argument("--format", choices=sorted(WRITERS), default="insert",
+                        help="insert: multi-row INSERTs; copy: PostgreSQL COPY FROM STDIN; sqlite: single-transaction INSERT OR IGNORE.")
+    parser.add_argument("--inventory", default="food inventory.csv")
+    parser.add_argument("--recipes", default="Master_Recipes_Generated.csv")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args()
+    output = args.output or {"insert": "seeds.sql", "copy": "seeds.copy.sql", "sqlite": "seeds.sqlite.sql"}[args.format]
+    generate_inserts(output, args.inventory, args.recipes, args.chunk_rows, args.format)
@@ -0,0 +1,123 @@
+"""
+Numerical parity check: both indent engines - the compiled recipe matrix
+(the default) and the single-query SQL BOM explosion (RECIPE_MATRIX_CACHE=0)
+- vs the original per-item/per-ingredient loop in calculate_indent. The
+loop's totals are converted into canonical units (backend/services/units.py)
+before comparing. Each engine is called directly, whatever the environment
+enables, and without the indent memo cache.
+
+Usage: python tools/verify_indent_parity.py [--samples 50] [--seed 7]
+Runs against DATABASE_URL (default catering.db), migrated to head. Everything it
+writes is rolled back.
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.database import SessionLocal
+from backend.models import Event, Ingredient, MenuItem, Recipe
+from backend.services.bom import explode_bom
+from backend.services.calculation import build_indent, calculate_stomach_ceiling
+from backend.services.recipe_matrix import get_recipe_matrix, get_unit_table
+
+TOLERANCE = 1e-9
+
+
+def legacy_indent(db, portion_per_item, menu_item_ids):
+    # The pre-BOM-engine aggregation loop, kept verbatim as the reference
+    ingredient_totals = {}
+    for item_id in menu_item_ids:
+        recipes = db.query(Recipe).filter(Recipe.menu_item_id == item_id).all()
+        for recipe in recipes:
+            if recipe.ingredient_id:
+                qty = recipe.quantity * portion_per_item
+                ing_id = recipe.ingredient_id
+                if ing_id not in ingredient_totals:
+                    ing_obj = db.query(Ingredient).filter(Ingredient.id == ing_id).first()
+                    ingredient_totals[ing_id] = {
+                        "id": ing_id,
+                        "name": ing_obj.name if ing_obj else "Unknown",
+                        "quantity": 0.0,
+                        "unit": recipe.unit,
+                        "category": ing_obj.category if ing_obj else "Misc",
+                    }
+                ingredient_totals[ing_id]["quantity"] += qty
+    return ingredient_totals
+
+
+def to_canonical(totals, units):
+    for ing_id, line in totals.items():
+        line["unit"], factor = units.convert(ing_id, line["unit"])
+        line["quantity"] *= factor
+    return totals
+
+
+def compare(expected, actual):
+    errors = []
+    got = {row["id"]: row for row in actual}
+    if set(got) != set(expected):
+        errors.append(f"ingredient sets differ: missing={set(expected) - set(got)} extra={set(got) - set(expected)}")
+    for ing_id, ref in expected.items():
+        row = got.get(ing_id)
+        if row is None:
+            continue
+        if abs(row["quantity"] - ref["quantity"]) > TOLERANCE * max(1.0, abs(ref["quantity"])):
+            errors.append(f"ingredient {ing_id}: quantity {row['quantity']} != {ref['quantity']}")
+        for key in ("name", "unit", "category"):
+            if row[key] != ref[key]:
+                errors.append(f"ingredient {ing_id}: {key} {row[key]!r} != {ref[key]!r}")
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    db = SessionLocal()
+    try:
+        menu_ids = [row[0] for row in db.query(MenuItem.id).all()]
+        if not menu_ids:
+            print("No menu items found - run backend/scripts/ingest_data.py first.")
+            return 1
+
+        event = Event(name="Parity Check", venue="-", pax_male=300, pax_female=250, pax_child=50, profile_type="Urban")
+        db.add(event)
+        db.flush()
+
+        selections = [[], menu_ids[:1], menu_ids[:40], menu_ids[:3] * 2]
+        for _ in range(args.samples):
+            selections.append(rng.sample(menu_ids, rng.randint(1, min(60, len(menu_ids)))))
+
+        engines = {
+            "matrix": get_recipe_matrix(db).explode,
+            "sql_bom": lambda servings: explode_bom(db, servings),
+        }
+        capacity = calculate_stomach_ceiling(event)
+        failures = 0
+        for name, explode in engines.items():
+            failed = 0
+            for selection in selections:
+                result = build_indent(capacity, selection, explode)
+                if not selection:
+                    continue
+                expected = to_canonical(legacy_indent(db, result["portion_per_item"], selection), get_unit_table(db))
+                errors = compare(expected, result["indent"])
+                if errors:
+                    failed += 1
+                    print(f"FAIL {name} ({len(selection)} items): " + "; ".join(errors[:5]))
+            print(f"{name}: {len(selections) - failed}/{len(selections)} selections match the legacy loop.")
+            failures += failed
+        return 1 if failures else 0
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())